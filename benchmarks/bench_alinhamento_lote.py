@@ -0,0 +1,57 @@
+"""
+Benchmark: `alinhar_palavras` (um texto por vez) vs. `alinhar_palavras_lote`.
+
+Gera uma transcrição sintética com o número de palavras pedido e mede o tempo
+das duas versões (e da visão em dicts do lote, para comparação justa).
+
+Execute com:
+    poetry run python benchmarks/bench_alinhamento_lote.py [palavras]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from autodub.adapters.mocks.mock_alignment import alinhar_palavras, alinhar_palavras_lote
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    total_palavras = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    gerador = np.random.default_rng(0)
+    textos, inicios, duracoes = [], [], []
+    palavras, tempo = 0, 0.0
+    while palavras < total_palavras:
+        quantidade = int(gerador.integers(3, 15))
+        textos.append(" ".join(f"palavra{palavras + k}" for k in range(quantidade)))
+        duracao = quantidade * 0.35
+        inicios.append(tempo)
+        duracoes.append(duracao)
+        tempo += duracao + 0.2
+        palavras += quantidade
+
+    _, tempo_loop = medir(
+        lambda: [alinhar_palavras(t, i, d) for t, i, d in zip(textos, inicios, duracoes)]
+    )
+    lote, tempo_lote = medir(lambda: alinhar_palavras_lote(textos, inicios, duracoes))
+    _, tempo_dicts = medir(lote.para_dicts)
+
+    print(f"segmentos: {len(textos)} | palavras: {palavras}")
+    print(f"{'versão':>24} | {'tempo (s)':>10} | {'aceleração':>10}")
+    print(f"{'alinhar_palavras (loop)':>24} | {tempo_loop:10.3f} | {1.0:10.1f}")
+    print(f"{'lote (arrays)':>24} | {tempo_lote:10.3f} | {tempo_loop / tempo_lote:10.1f}")
+    print(
+        f"{'lote + para_dicts':>24} | {tempo_lote + tempo_dicts:10.3f} | "
+        f"{tempo_loop / (tempo_lote + tempo_dicts):10.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
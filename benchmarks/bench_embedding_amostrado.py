@@ -0,0 +1,60 @@
+"""
+Benchmark: embedding do arquivo inteiro vs. embedding amostrado.
+
+Compara tempo de execução e similaridade de cosseno entre o embedding do
+arquivo completo e o do modo amostrado (`max_segundos_amostra`).
+
+Execute com:
+    poetry run python benchmarks/bench_embedding_amostrado.py audio.wav [30 60 120]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from autodub.adapters.embedding_extractor_adapter import ResemblyzerEmbedding
+
+
+def medir(extrator: ResemblyzerEmbedding, caminho: str):
+    inicio = time.perf_counter()
+    embedding = extrator.extrair(caminho)
+    return embedding, time.perf_counter() - inicio
+
+
+def similaridade_cosseno(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(
+            "Uso: poetry run python benchmarks/bench_embedding_amostrado.py audio.wav [30 60]"
+        )
+        sys.exit(1)
+
+    caminho = sys.argv[1]
+    limites = [float(valor) for valor in sys.argv[2:]] or [30.0, 60.0, 120.0]
+
+    if not Path(caminho).exists():
+        print(f"❌ Erro: arquivo de entrada não encontrado: {caminho}")
+        sys.exit(1)
+
+    extrator = ResemblyzerEmbedding()
+    referencia, tempo_referencia = medir(extrator, caminho)
+    print(f"{'modo':>16} | {'tempo (s)':>10} | {'aceleração':>10} | {'cosseno':>8}")
+    print(f"{'arquivo inteiro':>16} | {tempo_referencia:10.2f} | {1.0:10.1f} | {1.0:8.4f}")
+
+    for limite in limites:
+        extrator.max_segundos_amostra = limite
+        embedding, tempo = medir(extrator, caminho)
+        print(
+            f"{f'amostrado {limite:g}s':>16} | {tempo:10.2f} | "
+            f"{tempo_referencia / tempo:10.1f} | "
+            f"{similaridade_cosseno(referencia, embedding):8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
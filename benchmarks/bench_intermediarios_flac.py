@@ -0,0 +1,84 @@
+"""
+Benchmark: intermediários em WAV (PCM) vs. FLAC.
+
+Grava e relê as falas de um episódio sintético (harmônicos com envelope de
+sílabas, pausas e um pouco de ruído, mais próximo de fala que um tom puro)
+com `gravar_pcm16` / `ler_pcm16`, e mede bytes gravados e tempo de parede.
+
+O disco "limitado" é simulado: depois de cada gravação/leitura, espera-se o
+tempo que os bytes levariam numa banda fixa (ex.: armazenamento de rede).
+
+Execute com:
+    poetry run python benchmarks/bench_intermediarios_flac.py [minutos] [MB/s limitado]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from autodub.utils.audio_storage import gravar_pcm16, ler_pcm16
+
+TAXA = 16000
+
+
+def fala_sintetica(segundos: float, semente: int) -> np.ndarray:
+    """Harmônicos de uma f0 variável, sílabas de ~4 Hz, 20% de pausa e ruído leve."""
+    gerador = np.random.default_rng(semente)
+    tempo = np.arange(int(segundos * TAXA)) / TAXA
+    f0 = gerador.uniform(110, 220) * (1 + 0.1 * np.sin(2 * np.pi * 0.5 * tempo))
+    fase = 2 * np.pi * np.cumsum(f0) / TAXA
+    sinal = sum(np.sin(k * fase) / k for k in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 4 * tempo + gerador.uniform(0, 6)), 0, None)
+    envelope[int(0.8 * len(tempo)) :] = 0  # pausa no fim da fala
+    sinal = 0.2 * sinal * envelope + 0.002 * gerador.standard_normal(len(tempo))
+    return (np.clip(sinal, -1, 1) * 32767).astype(np.int16)
+
+
+def medir(falas, diretorio: Path, extensao: str, banda: float) -> tuple[int, float]:
+    """Grava e relê todas as falas; devolve (bytes gravados, segundos)."""
+    gravados = 0
+    inicio = time.perf_counter()
+    caminhos = []
+    for i, fala in enumerate(falas):
+        caminho = diretorio / f"segment_{i}{extensao}"
+        gravar_pcm16(caminho, fala, TAXA)
+        tamanho = caminho.stat().st_size
+        gravados += tamanho
+        if banda:
+            time.sleep(tamanho / banda)
+        caminhos.append(caminho)
+    for caminho, fala in zip(caminhos, falas):
+        lida, _ = ler_pcm16(caminho)
+        if banda:
+            time.sleep(caminho.stat().st_size / banda)
+        assert np.array_equal(lida, fala)
+    return gravados, time.perf_counter() - inicio
+
+
+def main() -> None:
+    minutos = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    banda_limitada = float(sys.argv[2]) * 1e6 if len(sys.argv) > 2 else 20e6
+
+    gerador = np.random.default_rng(0)
+    falas = []
+    while sum(map(len, falas)) < minutos * 60 * TAXA:
+        falas.append(fala_sintetica(float(gerador.uniform(1.0, 6.0)), len(falas)))
+
+    print(f"{len(falas)} falas, {minutos:.0f} min de áudio a {TAXA} Hz")
+    print(f"{'disco':>18} | {'formato':>7} | {'MB gravados':>11} | {'tempo (s)':>9}")
+    for rotulo, banda in (("local", 0.0), (f"{banda_limitada / 1e6:.0f} MB/s", banda_limitada)):
+        for extensao in (".wav", ".flac"):
+            with tempfile.TemporaryDirectory() as diretorio:
+                gravados, segundos = medir(falas, Path(diretorio), extensao, banda)
+            print(
+                f"{rotulo:>18} | {extensao[1:]:>7} | {gravados / 1e6:11.1f} | {segundos:9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
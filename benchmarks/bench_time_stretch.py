@@ -0,0 +1,48 @@
+"""
+Benchmark: compressão WSOLA (`esticar_tempo`) em um episódio sintético.
+
+Simula um episódio com segmentos de fala de duração variada e comprime todos
+por um fator fixo, medindo quantas vezes mais rápido que o tempo real é o
+processamento em um único núcleo.
+
+Execute com:
+    poetry run python benchmarks/bench_time_stretch.py [minutos] [fator]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from autodub.utils.thread_budget import aplicar_threads
+from autodub.utils.time_stretch import esticar_tempo
+
+TAXA = 16000
+
+
+def main():
+    minutos = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+    fator = float(sys.argv[2]) if len(sys.argv) > 2 else 0.8
+    aplicar_threads(1)
+
+    gerador = np.random.default_rng(0)
+    duracoes = []
+    while sum(duracoes) < minutos * 60:
+        duracoes.append(float(gerador.uniform(1.0, 8.0)))
+    segmentos = [
+        gerador.standard_normal(int(duracao * TAXA)).astype(np.float32) * 0.1
+        for duracao in duracoes
+    ]
+
+    inicio = time.perf_counter()
+    for segmento in segmentos:
+        esticar_tempo(segmento, fator)
+    decorrido = time.perf_counter() - inicio
+
+    audio_segundos = sum(duracoes)
+    print(f"segmentos: {len(segmentos)} | áudio: {audio_segundos / 60:.1f} min")
+    print(f"tempo: {decorrido:.2f} s | {audio_segundos / decorrido:.0f}x tempo real (1 núcleo)")
+
+
+if __name__ == "__main__":
+    main()
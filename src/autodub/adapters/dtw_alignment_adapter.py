@@ -0,0 +1,332 @@
+"""
+Alinhamento forçado texto-áudio em CPU com DTW em banda (Sakoe-Chiba).
+
+Cada caractere das palavras vira uma "unidade" com características esperadas
+(vogais: energia alta; fricativas: muitos cruzamentos por zero; demais
+consoantes: intermediárias). O áudio vira uma sequência de quadros de 10 ms com
+energia e taxa de cruzamentos por zero. O DTW casa as duas sequências dentro de
+uma banda em torno da diagonal, e os limites das palavras saem do caminho.
+
+Implementação:
+- Os segmentos de um episódio são alinhados em lotes: a recorrência percorre
+  os quadros (colunas) e cada passo é vetorizado sobre os segmentos do lote e
+  toda a banda.
+- Só a banda é guardada: custo O(S·B) por coluna e ponteiros de retorno
+  booleanos O(M_max·S·B_max) por lote, em vez de matrizes O(N·M) por segmento.
+  Os lotes agrupam segmentos da mesma ordem de grandeza de quadros e de banda,
+  então M_max < 2·M_s e B_max < 2·B_s: no total, os ponteiros ocupam menos de
+  4·Σ M_s·B_s, e um segmento longo não infla a memória dos curtos.
+- Energia e cruzamentos por zero vêm de `AudioCaracteristicas`: calculados uma
+  vez para o episódio inteiro (em blocos, sobre o WAV mapeado em memória) e
+  recortados por segmento.
+
+Funções principais:
+- AlinhadorDtw.alinhar: um texto contra um arquivo inteiro.
+- AlinhadorDtw.alinhar_lote: todos os segmentos de um episódio em uma chamada.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from autodub.adapters.mocks.mock_alignment import alinhar_palavras
+from autodub.interfaces.alignment_interface import IAlignment
+from autodub.utils.audio_features import (
+    AudioCaracteristicas,
+    energia_log,
+    numero_quadros,
+    taxa_cruzamentos_zero,
+)
+
+_VOGAIS = set("aeiouyáàâãéêíóôõúüäëïöœæ")
+_FRICATIVAS = set("fsxzjhçvc")
+
+# Características esperadas por classe de caractere: (energia, cruzamentos por zero)
+_PERFIL_VOGAL = (1.0, 0.2)
+_PERFIL_FRICATIVA = (0.45, 1.0)
+_PERFIL_CONSOANTE = (0.5, 0.4)
+
+
+def _perfil_caractere(caractere: str) -> Tuple[float, float]:
+    caractere = caractere.lower()
+    if caractere in _VOGAIS:
+        return _PERFIL_VOGAL
+    if caractere in _FRICATIVAS:
+        return _PERFIL_FRICATIVA
+    return _PERFIL_CONSOANTE
+
+
+def unidades_do_texto(texto: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Converte o texto em unidades (caracteres alfanuméricos) com características esperadas.
+
+    Returns:
+        Tuple[List[str], np.ndarray, np.ndarray]: (palavras, características
+        (N, 2) das unidades, índice da primeira unidade de cada palavra).
+    """
+    palavras = texto.strip().split()
+    perfis: List[Tuple[float, float]] = []
+    primeiras = np.zeros(len(palavras), dtype=np.int64)
+    for k, palavra in enumerate(palavras):
+        primeiras[k] = len(perfis)
+        caracteres = [c for c in palavra if c.isalnum()] or ["-"]
+        perfis.extend(_perfil_caractere(c) for c in caracteres)
+    return palavras, np.array(perfis, dtype=np.float32).reshape(-1, 2), primeiras
+
+
+def _normalizar_quadros(energia: np.ndarray, cruzamentos: np.ndarray) -> np.ndarray:
+    """Leva energia e cruzamentos por zero para [0, 1] dentro do trecho: (M, 2)."""
+    baixo, alto = np.percentile(energia, [10, 90])
+    energia = np.clip((energia - baixo) / max(alto - baixo, 1e-6), 0.0, 1.0)
+    cruzamentos = np.clip(cruzamentos / max(np.percentile(cruzamentos, 95), 1e-6), 0.0, 1.0)
+    return np.stack([energia, cruzamentos], axis=1).astype(np.float32)
+
+
+def _janela_e_passo(
+    taxa: int, passo_segundos: float, janela_segundos: float
+) -> Tuple[int, int]:
+    passo = max(1, int(round(passo_segundos * taxa)))
+    return max(passo, int(round(janela_segundos * taxa))), passo
+
+
+def caracteristicas_quadros(
+    audio: np.ndarray, taxa: int, passo_segundos: float = 0.01, janela_segundos: float = 0.025
+) -> np.ndarray:
+    """
+    Energia e taxa de cruzamentos por zero por quadro, normalizadas em [0, 1].
+
+    Returns:
+        np.ndarray: (M, 2) float32.
+    """
+    janela, passo = _janela_e_passo(taxa, passo_segundos, janela_segundos)
+    audio = np.asarray(audio, dtype=np.float32)
+    return _normalizar_quadros(
+        energia_log(audio, janela, passo), taxa_cruzamentos_zero(audio, janela, passo)
+    )
+
+
+def _ler_banda(custo_acumulado: np.ndarray, indice: np.ndarray) -> np.ndarray:
+    """Lê posições da banda anterior; fora da banda o custo é infinito."""
+    largura = custo_acumulado.shape[1]
+    valores = np.take_along_axis(custo_acumulado, np.clip(indice, 0, largura - 1), axis=1)
+    return np.where((indice >= 0) & (indice < largura), valores, np.inf)
+
+
+def dtw_em_banda_lote(
+    unidades: Sequence[np.ndarray], quadros: Sequence[np.ndarray], meia_banda: int
+) -> List[np.ndarray]:
+    """
+    DTW em banda (passos diagonal e horizontal) para vários pares de uma vez.
+
+    Cada unidade ocupa pelo menos um quadro, então é preciso `N <= M` em cada par.
+    Os ponteiros de retorno ocupam `max(M) × pares × (2·meia_banda + 1)` bytes:
+    pares de tamanhos muito diferentes devem ir em chamadas separadas (ver
+    `AlinhadorDtw.alinhar_lote`).
+
+    Args:
+        unidades: Para cada segmento, características (N_s, F) das unidades.
+        quadros: Para cada segmento, características (M_s, F) dos quadros.
+        meia_banda (int): Meia largura da banda, em unidades.
+
+    Returns:
+        List[np.ndarray]: Para cada segmento, o primeiro quadro de cada unidade (N_s,).
+    """
+    quantidade = len(unidades)
+    n = np.array([len(u) for u in unidades], dtype=np.int64)
+    m = np.array([len(q) for q in quadros], dtype=np.int64)
+    if np.any(n > m) or np.any(n == 0):
+        raise ValueError("Cada segmento precisa de 1 <= unidades <= quadros.")
+
+    largura = 2 * meia_banda + 1
+    n_max, m_max = int(n.max()), int(m.max())
+    dimensao = unidades[0].shape[1]
+    u = np.zeros((quantidade, n_max, dimensao), dtype=np.float32)
+    x = np.zeros((quantidade, m_max, dimensao), dtype=np.float32)
+    for s in range(quantidade):
+        u[s, : n[s]] = unidades[s]
+        x[s, : m[s]] = quadros[s]
+
+    # Início da banda de cada coluna: centrada na diagonal, presa aos limites
+    colunas = np.arange(m_max)
+    inclinacao = (n - 1) / np.maximum(m - 1, 1)
+    centro = np.rint(colunas[None, :] * inclinacao[:, None]).astype(np.int64)
+    inicio_banda = np.clip(
+        centro - meia_banda, 0, np.maximum(n - largura, 0)[:, None]
+    ).T  # (M, S)
+
+    deslocamentos = np.arange(largura)
+    linhas = np.arange(quantidade)[:, None]
+    diagonal = np.zeros((m_max, quantidade, largura), dtype=bool)
+    custo_acumulado = np.full((quantidade, largura), np.inf, dtype=np.float64)
+
+    for j in range(m_max):
+        unidade = inicio_banda[j][:, None] + deslocamentos  # (S, B)
+        valida = unidade < n[:, None]
+        caracteristicas = u[linhas, np.minimum(unidade, n_max - 1)]
+        custo = np.sum((caracteristicas - x[:, j][:, None, :]) ** 2, axis=2)
+        custo = np.where(valida, custo, np.inf)
+
+        if j == 0:
+            novo = np.where(unidade == 0, custo, np.inf)
+        else:
+            k = unidade - inicio_banda[j - 1][:, None]  # posição na banda anterior
+            horizontal = _ler_banda(custo_acumulado, k)
+            vindo_diagonal = _ler_banda(custo_acumulado, k - 1)
+            diagonal[j] = vindo_diagonal < horizontal
+            novo = custo + np.minimum(horizontal, vindo_diagonal)
+
+        ativo = (j < m)[:, None]
+        custo_acumulado = np.where(ativo, novo, custo_acumulado)
+
+    # Retrocesso: o primeiro quadro de cada unidade
+    primeiros_quadros = []
+    for s in range(quantidade):
+        primeiro = np.zeros(n[s], dtype=np.int64)
+        i = int(n[s]) - 1
+        for j in range(int(m[s]) - 1, 0, -1):
+            if diagonal[j, s, i - inicio_banda[j, s]]:
+                primeiro[i] = j
+                i -= 1
+        primeiros_quadros.append(primeiro)
+    return primeiros_quadros
+
+
+class AlinhadorDtw(IAlignment):
+    """
+    Alinhador forçado em CPU por DTW em banda.
+
+    Devolve a mesma estrutura de `alinhar_palavras`:
+    `[{"palavra": str, "start": float, "end": float}, ...]`.
+
+    Args:
+        largura_banda (float): Meia largura da banda como fração do número de
+            unidades do segmento.
+        banda_minima (int): Meia largura mínima da banda, em unidades.
+        passo_segundos (float): Passo entre quadros de áudio.
+        janela_segundos (float): Duração de cada quadro de áudio.
+    """
+
+    def __init__(
+        self,
+        largura_banda: float = 0.15,
+        banda_minima: int = 8,
+        passo_segundos: float = 0.01,
+        janela_segundos: float = 0.025,
+    ) -> None:
+        self.largura_banda = largura_banda
+        self.banda_minima = banda_minima
+        self.passo_segundos = passo_segundos
+        self.janela_segundos = janela_segundos
+
+    @staticmethod
+    def _abrir_audio(caminho_audio: Union[str, Path]) -> AudioCaracteristicas:
+        """WAV PCM16 mono é mapeado em memória; outros formatos são lidos com soundfile."""
+        try:
+            return AudioCaracteristicas(caminho_audio)
+        except ValueError:
+            import soundfile as sf
+
+            audio, taxa = sf.read(str(caminho_audio), dtype="float32", always_2d=True)
+            return AudioCaracteristicas(audio.mean(axis=1), taxa)
+
+    def alinhar(self, texto: str, caminho_audio: str) -> List[Dict[str, float]]:
+        """Alinha um texto a um arquivo de áudio inteiro."""
+        audio = self._abrir_audio(caminho_audio)
+        return self.alinhar_lote([texto], caminho_audio, [0.0], [audio.duracao], audio=audio)[0]
+
+    def alinhar_lote(
+        self,
+        textos: Sequence[str],
+        caminho_audio: Union[str, Path],
+        inicios: Sequence[float],
+        fins: Sequence[float],
+        audio: Optional[Union[AudioCaracteristicas, Tuple[np.ndarray, int]]] = None,
+    ) -> List[List[Dict[str, float]]]:
+        """
+        Alinha todos os segmentos de um episódio em uma chamada.
+
+        Args:
+            textos: Texto de cada segmento.
+            caminho_audio: Áudio do episódio (lido uma única vez).
+            inicios / fins: Limites de cada segmento, em segundos.
+            audio (AudioCaracteristicas | Tuple[np.ndarray, int], opcional):
+                Características já abertas (compartilhadas com outras etapas) ou
+                (amostras mono, taxa) em memória, para não reler o arquivo.
+
+        Returns:
+            List[List[Dict]]: Palavras com `start`/`end` absolutos, por segmento.
+            Segmentos curtos demais para o DTW (mais caracteres que quadros)
+            recebem a distribuição uniforme de `alinhar_palavras`.
+        """
+        if audio is None:
+            audio = self._abrir_audio(caminho_audio)
+        elif not isinstance(audio, AudioCaracteristicas):
+            audio = AudioCaracteristicas(*audio)
+        taxa = audio.taxa
+        janela, passo = _janela_e_passo(taxa, self.passo_segundos, self.janela_segundos)
+        energia = audio.energia_log(janela, passo)
+        cruzamentos = audio.cruzamentos_zero(janela, passo)
+
+        resultados: List[List[Dict[str, float]]] = [[] for _ in textos]
+        pendentes, unidades, quadros, palavras_e_primeiras = [], [], [], []
+
+        for s, (texto, inicio, fim) in enumerate(zip(textos, inicios, fins)):
+            palavras, caracteristicas, primeiras = unidades_do_texto(texto)
+            if not palavras:
+                continue
+            primeira_amostra = int(round(inicio * taxa))
+            primeiro_quadro = min(primeira_amostra // passo, len(energia) - 1)
+            recorte = slice(
+                primeiro_quadro,
+                primeiro_quadro
+                + numero_quadros(int(round(fim * taxa)) - primeira_amostra, janela, passo),
+            )
+            caracteristicas_audio = _normalizar_quadros(energia[recorte], cruzamentos[recorte])
+            if len(caracteristicas) > len(caracteristicas_audio):
+                resultados[s] = alinhar_palavras(texto, inicio, fim - inicio)
+                continue
+            pendentes.append(s)
+            unidades.append(caracteristicas)
+            quadros.append(caracteristicas_audio)
+            palavras_e_primeiras.append((palavras, primeiras))
+
+        if not pendentes:
+            return resultados
+
+        # Um lote por (ordem de grandeza dos quadros, da banda): cada segmento usa
+        # no máximo o dobro dos quadros e da banda que usaria sozinho
+        bandas = [
+            max(self.banda_minima, math.ceil(self.largura_banda * len(u))) for u in unidades
+        ]
+        lotes: Dict[Tuple[int, int], List[int]] = {}
+        for k, (quadros_segmento, banda) in enumerate(zip(quadros, bandas)):
+            chave = (len(quadros_segmento).bit_length(), banda.bit_length())
+            lotes.setdefault(chave, []).append(k)
+        primeiros_quadros: List[np.ndarray] = [np.zeros(0, dtype=np.int64)] * len(pendentes)
+        for membros in lotes.values():
+            resultado_lote = dtw_em_banda_lote(
+                [unidades[k] for k in membros],
+                [quadros[k] for k in membros],
+                max(bandas[k] for k in membros),
+            )
+            for k, primeiro in zip(membros, resultado_lote):
+                primeiros_quadros[k] = primeiro
+
+        for s, (palavras, primeiras), primeiro in zip(
+            pendentes, palavras_e_primeiras, primeiros_quadros
+        ):
+            limites = inicios[s] + primeiro[primeiras] * self.passo_segundos
+            limites = np.append(np.minimum(limites, fins[s]), fins[s])
+            resultados[s] = [
+                {
+                    "palavra": palavra,
+                    "start": round(float(limites[k]), 3),
+                    "end": round(float(limites[k + 1]), 3),
+                }
+                for k, palavra in enumerate(palavras)
+            ]
+        return resultados
@@ -9,10 +9,16 @@ do locutor — útil para identificação, clonagem ou correspondência de vozes
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
 import numpy as np
+import torch
 from resemblyzer import VoiceEncoder, preprocess_wav
+from resemblyzer.audio import wav_to_mel_spectrogram
 
 from autodub.interfaces.embedding_interface import IEmbeddingExtractor
+from autodub.utils.audio_sampling import amostrar_fala
 
 
 class ResemblyzerEmbedding(IEmbeddingExtractor):
@@ -23,15 +29,56 @@ class ResemblyzerEmbedding(IEmbeddingExtractor):
     para gerar vetores representativos da voz de um locutor.
     """
 
-    def __init__(self, device: str | None = None) -> None:
+    def __init__(
+        self,
+        device: str | None = None,
+        max_segundos_amostra: Optional[float] = None,
+        janela_segundos: float = 1.0,
+        trabalhadores_preprocessamento: int = 4,
+        tamanho_lote: int = 64,
+    ) -> None:
         """
         Inicializa o encoder do Resemblyzer.
 
         Args:
             device (str, opcional): Define o dispositivo de execução ('cpu' ou 'cuda').
                                     Se None, o Resemblyzer escolhe automaticamente.
+            max_segundos_amostra (float, opcional): Ativa o modo amostrado: usa no
+                                    máximo estes segundos das janelas de fala mais
+                                    fortes, limitando tempo e memória. Se None,
+                                    processa o arquivo inteiro.
+            janela_segundos (float): Duração de cada janela no modo amostrado.
+            trabalhadores_preprocessamento (int): Threads usadas por `extrair_lote`
+                                    para pré-processar os arquivos em paralelo.
+            tamanho_lote (int): Máximo de fatias parciais por passada do encoder
+                                    em `extrair_lote` (limita o pico de memória).
         """
         self.encoder = VoiceEncoder(device=device)
+        self.max_segundos_amostra = max_segundos_amostra
+        self.janela_segundos = janela_segundos
+        self.trabalhadores_preprocessamento = trabalhadores_preprocessamento
+        self.tamanho_lote = tamanho_lote
+
+    def definir_threads(self, threads: int) -> None:
+        """
+        Limita as threads do torch e do pré-processamento em lote.
+
+        Args:
+            threads (int): Número de threads do orçamento deste trabalhador.
+        """
+        torch.set_num_threads(threads)
+        self.trabalhadores_preprocessamento = threads
+
+    def _preprocessar(self, caminho_audio: str) -> np.ndarray:
+        """Pré-processa o áudio inteiro ou apenas os trechos amostrados."""
+        if self.max_segundos_amostra is not None:
+            amostra, taxa = amostrar_fala(
+                caminho_audio, self.max_segundos_amostra, self.janela_segundos
+            )
+            if amostra.size:
+                return preprocess_wav(amostra, source_sr=taxa)
+
+        return preprocess_wav(caminho_audio)
 
     def extrair(self, caminho_audio: str) -> np.ndarray:
         """
@@ -45,7 +92,7 @@ class ResemblyzerEmbedding(IEmbeddingExtractor):
         """
         try:
             # Pré-processa o áudio para o formato esperado (16 kHz, mono)
-            wav = preprocess_wav(caminho_audio)
+            wav = self._preprocessar(caminho_audio)
 
             # Extrai o vetor de características da voz
             embedding = self.encoder.embed_utterance(wav)
@@ -58,3 +105,68 @@ class ResemblyzerEmbedding(IEmbeddingExtractor):
 
         except Exception as e:
             raise RuntimeError(f"Falha ao extrair embedding de {caminho_audio}: {e}") from e
+
+    def _preprocessar_lote(self, caminho_audio: str) -> np.ndarray:
+        """Pré-processa um arquivo do lote, padronizando a mensagem de erro."""
+        try:
+            return self._preprocessar(caminho_audio)
+        except Exception as e:
+            raise RuntimeError(f"Falha ao extrair embedding de {caminho_audio}: {e}") from e
+
+    def _fatias_mel(self, wav: np.ndarray) -> np.ndarray:
+        """
+        Divide o áudio nas fatias parciais de mel usadas pelo encoder.
+
+        Reproduz o recorte feito por `VoiceEncoder.embed_utterance`, para que o
+        resultado em lote seja equivalente ao da extração individual.
+        """
+        fatias_wav, fatias_mel = self.encoder.compute_partial_slices(len(wav))
+        tamanho_maximo = fatias_wav[-1].stop
+        if tamanho_maximo >= len(wav):
+            wav = np.pad(wav, (0, tamanho_maximo - len(wav)), "constant")
+
+        mel = wav_to_mel_spectrogram(wav)
+        return np.array([mel[fatia] for fatia in fatias_mel])
+
+    def _codificar_parciais(self, mels: np.ndarray) -> np.ndarray:
+        """Executa uma passada do encoder sobre um lote de fatias de mel."""
+        with torch.no_grad():
+            entrada = torch.from_numpy(mels).to(self.encoder.device)
+            return self.encoder(entrada).cpu().numpy()
+
+    def extrair_lote(self, caminhos_audio: List[str]) -> List[np.ndarray]:
+        """
+        Extrai os embeddings de vários arquivos de uma vez.
+
+        O pré-processamento roda em paralelo (threads) e as fatias parciais de
+        todos os arquivos são agrupadas em passadas de até `tamanho_lote` fatias
+        pelo encoder, em vez de uma passada por arquivo.
+
+        Args:
+            caminhos_audio (List[str]): Caminhos para os arquivos de áudio.
+
+        Returns:
+            List[np.ndarray]: Um embedding normalizado por arquivo, na mesma ordem.
+        """
+        if not caminhos_audio:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.trabalhadores_preprocessamento) as executor:
+            wavs = list(executor.map(self._preprocessar_lote, caminhos_audio))
+
+        fatias = [self._fatias_mel(wav) for wav in wavs]
+        todas = np.concatenate(fatias, axis=0)
+        parciais = np.concatenate(
+            [
+                self._codificar_parciais(todas[inicio : inicio + self.tamanho_lote])
+                for inicio in range(0, len(todas), self.tamanho_lote)
+            ],
+            axis=0,
+        )
+
+        limites = np.cumsum([len(fatia) for fatia in fatias])[:-1]
+        embeddings = []
+        for grupo in np.split(parciais, limites):
+            media = grupo.mean(axis=0)
+            embeddings.append((media / np.linalg.norm(media, 2)).astype(np.float32))
+        return embeddings
@@ -8,12 +8,13 @@ from .ffmpeg_wrapper import FakeFFmpegWrapper
 from .mock_asr import MockASR
 from .mock_embedding import MockEmbedding
 from .mock_tts import MockTTS
-from .mock_vocoder import MockVocoder
+from .mock_vocoder import MockVocoder, MockVocoderStreaming
 
 __all__ = [
     "MockASR",
     "MockTTS",
     "MockEmbedding",
     "MockVocoder",
+    "MockVocoderStreaming",
     "FakeFFmpegWrapper",
 ]
@@ -1,3 +1,11 @@
+import time
+from typing import Iterator
+
+import numpy as np
+
+from autodub.utils.audio_features import localizar_dados_wav
+
+
 class FakeFFmpegWrapper:
     """
     Mock simples do ffmpeg para testes de pipeline.
@@ -18,3 +26,75 @@ class FakeFFmpegWrapper:
         """
         with open(out_video_path, "wb") as f:
             f.write(b"FAKE_VIDEO_WITH_AUDIO")
+
+    def mux_faixas(self, video_path: str, faixas, out_video_path: str, keep_original=False):
+        """
+        Simula o mux de várias faixas de áudio (uma por idioma) em um vídeo.
+        """
+        with open(out_video_path, "wb") as f:
+            f.write(b"FAKE_VIDEO_WITH_AUDIO")
+
+    def mux_pcm(
+        self,
+        video_path: str,
+        blocos,
+        sample_rate: int,
+        out_video_path: str,
+        language=None,
+        keep_original=False,
+    ) -> None:
+        """
+        Simula o mux de áudio recebido em blocos PCM16 (consome todos os blocos).
+        """
+        for _ in blocos:
+            pass
+        with open(out_video_path, "wb") as f:
+            f.write(b"FAKE_VIDEO_WITH_AUDIO")
+
+    def stream_audio(
+        self,
+        source: str,
+        chunk_samples: int = 8000,
+        sample_rate: int = 16000,
+        follow: bool = False,
+        poll_interval: float = 0.05,
+        idle_timeout: float = 1.0,
+    ) -> Iterator[np.ndarray]:
+        """
+        Substituto local da entrada ao vivo: lê um WAV PCM16 mono em blocos.
+
+        Com `follow`, o arquivo é tratado como crescente (o tamanho declarado no
+        cabeçalho é ignorado): novos dados são lidos assim que aparecem, e a
+        leitura termina após `idle_timeout` segundos sem crescimento.
+        """
+        deslocamento, tamanho, taxa = localizar_dados_wav(source)
+        if taxa != sample_rate:
+            raise ValueError(f"{source} tem {taxa} Hz; esperado {sample_rate} Hz.")
+
+        restante = None if follow else tamanho
+        tamanho_bloco = chunk_samples * 2
+        pendente = b""
+        with open(source, "rb") as f:
+            f.seek(deslocamento)
+            ultimo_dado = time.monotonic()
+            while True:
+                limite = tamanho_bloco - len(pendente)
+                dados = f.read(limite if restante is None else min(limite, restante))
+                if dados:
+                    pendente += dados
+                    ultimo_dado = time.monotonic()
+                    if restante is not None:
+                        restante -= len(dados)
+                if len(pendente) == tamanho_bloco:
+                    yield np.frombuffer(pendente, dtype="<i2")
+                    pendente = b""
+                elif not follow:
+                    if not dados or restante == 0:
+                        break
+                elif not dados:
+                    if time.monotonic() - ultimo_dado >= idle_timeout:
+                        break
+                    time.sleep(poll_interval)
+
+        if len(pendente) >= 2:
+            yield np.frombuffer(pendente[: len(pendente) - len(pendente) % 2], dtype="<i2")
@@ -1,4 +1,7 @@
-from typing import Dict, List
+from itertools import chain
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 
 def alinhar_palavras(
@@ -40,3 +43,101 @@ def alinhar_palavras(
         tempo_atual += duracao_por_palavra
 
     return alinhamento
+
+
+class AlinhamentoLote:
+    """
+    Alinhamento de palavras de vários segmentos em arrays planos.
+
+    A palavra `k` pertence ao segmento `segmento[k]`; as palavras do segmento `s`
+    ocupam as posições `deslocamentos[s]:deslocamentos[s + 1]`.
+
+    Attributes:
+        palavras (List[str]): Todas as palavras, em ordem.
+        deslocamentos (np.ndarray): (S + 1,) início de cada segmento nos arrays.
+        start / end (np.ndarray): (P,) tempos de cada palavra, em segundos.
+        segmento (np.ndarray): (P,) índice do segmento de cada palavra.
+    """
+
+    def __init__(
+        self,
+        palavras: List[str],
+        deslocamentos: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+        segmento: np.ndarray,
+    ) -> None:
+        self.palavras = palavras
+        self.deslocamentos = deslocamentos
+        self.start = start
+        self.end = end
+        self.segmento = segmento
+
+    def __len__(self) -> int:
+        return len(self.deslocamentos) - 1
+
+    def __getitem__(self, indice: int) -> List[Dict[str, float]]:
+        """Palavras do segmento `indice` no formato de `alinhar_palavras`."""
+        inicio, fim = self.deslocamentos[indice], self.deslocamentos[indice + 1]
+        starts = self.start[inicio:fim].tolist()
+        ends = self.end[inicio:fim].tolist()
+        return [
+            {"palavra": palavra, "start": s, "end": e}
+            for palavra, s, e in zip(self.palavras[inicio:fim], starts, ends)
+        ]
+
+    def para_dicts(self) -> List[List[Dict[str, float]]]:
+        """Visão compatível: uma lista de `alinhar_palavras` por segmento."""
+        return [self[indice] for indice in range(len(self))]
+
+
+def alinhar_palavras_lote(
+    textos: Sequence[str],
+    inicios: Sequence[float],
+    duracoes: Optional[Sequence[Optional[float]]] = None,
+) -> AlinhamentoLote:
+    """
+    Versão em lote de `alinhar_palavras`: todos os segmentos em uma passada vetorizada.
+
+    Args:
+        textos: Texto de cada segmento.
+        inicios: Tempo inicial de cada segmento.
+        duracoes: Duração de cada segmento (None/NaN = 0.5 s por palavra, como no mock).
+
+    Returns:
+        AlinhamentoLote: Tempos em arrays planos (arredondados a 3 casas, como
+        em `alinhar_palavras`), com visão em dicts via `para_dicts`.
+    """
+    por_segmento = [texto.strip().split() for texto in textos]
+    contagens = np.fromiter(map(len, por_segmento), dtype=np.int64, count=len(por_segmento))
+    deslocamentos = np.concatenate(([0], np.cumsum(contagens)))
+    segmento = np.repeat(np.arange(len(por_segmento)), contagens)
+
+    if duracoes is None:
+        duracoes = np.full(len(por_segmento), np.nan)
+    duracoes = np.array([np.nan if d is None else d for d in duracoes], dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        por_palavra = np.where(np.isnan(duracoes), 0.5, duracoes / np.maximum(contagens, 1))
+
+    # Mesma soma acumulada de `alinhar_palavras` (inicio + d + d + ..., não
+    # inicio + k·d): vetorizada por posição da palavra, em todos os segmentos
+    inicio_palavra = np.empty(deslocamentos[-1], dtype=np.float64)
+    primeiras = deslocamentos[:-1]
+    com_palavras = contagens > 0
+    inicio_palavra[primeiras[com_palavras]] = np.asarray(inicios, dtype=np.float64)[
+        com_palavras
+    ]
+    for k in range(1, int(contagens.max(initial=0))):
+        indices = primeiras[contagens > k] + k
+        inicio_palavra[indices] = inicio_palavra[indices - 1] + por_palavra[segmento[indices]]
+    fim_palavra = inicio_palavra + por_palavra[segmento]
+
+    # `round` do Python (correto para o decimal mais próximo), como no mock;
+    # `np.round` escala por 1000 e pode divergir em 1 ms
+    return AlinhamentoLote(
+        palavras=list(chain.from_iterable(por_segmento)),
+        deslocamentos=deslocamentos,
+        start=np.array([round(t, 3) for t in inicio_palavra.tolist()], dtype=np.float64),
+        end=np.array([round(t, 3) for t in fim_palavra.tolist()], dtype=np.float64),
+        segmento=segmento,
+    )
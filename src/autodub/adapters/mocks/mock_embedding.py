@@ -3,8 +3,20 @@ class MockEmbedding:
     Mock simples para extração de embeddings de áudio, timbre do voz.
     """
 
+    def extrair(self, caminho_audio: str) -> list[float]:
+        """
+        Retorna um vetor fixo para testes determinísticos (conforme `IEmbeddingExtractor`).
+        """
+        return [0.1, 0.2, 0.3]
+
+    def extrair_lote(self, caminhos_audio: list[str]) -> list[list[float]]:
+        """
+        Retorna um vetor fixo por arquivo, permitindo medir pipelines em lote offline.
+        """
+        return [self.extrair(caminho_audio) for caminho_audio in caminhos_audio]
+
     def extrair_embedding(self, audio_path: str) -> list[float]:
         """
         Retorna um vetor fixo para testes determinísticos.
         """
-        return [0.1, 0.2, 0.3]
+        return self.extrair(audio_path)
@@ -11,6 +11,8 @@ from typing import Protocol
 class ITranslator(Protocol):
     def traduzir(self, texto: str, target_lang: str) -> str: ...
 
+    def condensar(self, texto: str, target_lang: str, max_segundos: float) -> str: ...
+
 
 class MockTranslator:
     """Mock simples de tradutor — usado apenas em modo debug."""
@@ -21,3 +23,11 @@ class MockTranslator:
         Exemplo: "[pt-br] Texto gerado devido ao uso de Mock"
         """
         return f"[{target_lang}] Texto gerado devido ao uso de Mock"
+
+    def condensar(self, texto: str, target_lang: str, max_segundos: float) -> str:
+        """
+        Condensação simulada: mantém as primeiras palavras, ~3 por segundo.
+        Exemplo: "um dois três quatro", 1.0 → "um dois três"
+        """
+        palavras = texto.split()
+        return " ".join(palavras[: max(1, int(max_segundos * 3))])
@@ -1,3 +1,8 @@
+import numpy as np
+
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+
+
 class MockVocoder:
     """
     Mock simples de vocoder para testes.
@@ -8,3 +13,28 @@ class MockVocoder:
         Simula a conversão de espectrograma mel em áudio.
         """
         return b"FAKE_VOCODER_AUDIO"
+
+
+class MockVocoderStreaming:
+    """
+    Mock determinístico de vocoder de streaming (`IVocoderStreaming`).
+
+    Cada quadro mel vira um período de senoide com `amostras_por_quadro`
+    amostras, com amplitude dada pela média do quadro (sigmoide do log-mel).
+    Como cada quadro depende só de si mesmo, o áudio em blocos é idêntico ao
+    áudio do mel inteiro — útil para testar o overlap-add.
+    """
+
+    def __init__(self, taxa_amostragem: int = 16000, amostras_por_quadro: int = 160) -> None:
+        self.taxa_amostragem = taxa_amostragem
+        self.amostras_por_quadro = amostras_por_quadro
+        fase = 2 * np.pi * np.arange(amostras_por_quadro) / amostras_por_quadro
+        self._periodo = np.sin(fase).astype(np.float32)
+
+    def sintetizar_bloco(self, mel: np.ndarray) -> np.ndarray:
+        mel = np.asarray(mel, dtype=np.float32).reshape(len(mel), -1)
+        amplitude = 0.5 / (1.0 + np.exp(-mel.mean(axis=1)))
+        return (amplitude[:, None] * self._periodo).reshape(-1).astype(np.float32)
+
+    def sintetizar_from_mel(self, mel) -> bytes:
+        return pcm16_para_wav_bytes(self.sintetizar_bloco(mel), self.taxa_amostragem)
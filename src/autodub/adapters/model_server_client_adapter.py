@@ -0,0 +1,125 @@
+"""
+Adapters cliente do servidor local de modelos (`autodub.model_server`).
+
+Implementam `IAsr`, `IEmbeddingExtractor` e `ITts` sem carregar nenhum modelo:
+cada chamada é repassada ao servidor pelo socket Unix. Os caminhos de áudio são
+enviados como texto (cliente e servidor estão no mesmo nó), e só os resultados
+binários (embeddings, áudio) trafegam no corpo da mensagem.
+"""
+
+from __future__ import annotations
+
+import socket
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from autodub.interfaces.asr_interface import IAsr
+from autodub.interfaces.embedding_interface import IEmbeddingExtractor
+from autodub.interfaces.tts_interface import ITts
+from autodub.model_server import CAMINHO_SOCKET_PADRAO, enviar_mensagem, receber_mensagem
+from autodub.utils.segment_table import TabelaSegmentos
+
+
+class ClienteServidorModelos:
+    """
+    Conexão com o servidor de modelos (uma conexão curta por pedido).
+
+    Args:
+        caminho_socket (str | Path): Caminho do socket Unix do servidor.
+        timeout (float, opcional): Tempo máximo de espera por resposta, em segundos.
+    """
+
+    def __init__(
+        self,
+        caminho_socket: Union[str, Path] = CAMINHO_SOCKET_PADRAO,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.caminho_socket = str(caminho_socket)
+        self.timeout = timeout
+
+    def chamar(
+        self, operacao: str, argumentos: Optional[Dict] = None, corpo: bytes = b""
+    ) -> Tuple[Dict, bytes]:
+        """
+        Envia um pedido e devolve (cabeçalho, corpo) da resposta.
+
+        Raises:
+            RuntimeError: Se o servidor estiver inacessível ou responder com erro.
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+                conexao.settimeout(self.timeout)
+                conexao.connect(self.caminho_socket)
+                enviar_mensagem(
+                    conexao, {"operacao": operacao, "argumentos": argumentos or {}}, corpo
+                )
+                cabecalho, corpo_resposta = receber_mensagem(conexao)
+        except OSError as exc:
+            raise RuntimeError(
+                f"Servidor de modelos inacessível em {self.caminho_socket}: {exc}"
+            ) from exc
+
+        if "erro" in cabecalho:
+            raise RuntimeError(
+                f"Servidor de modelos falhou em '{operacao}': {cabecalho['erro']}"
+            )
+        return cabecalho, corpo_resposta
+
+    def status(self) -> Dict:
+        """Retorna os modelos carregados e o PID do servidor."""
+        return self.chamar("status")[0]
+
+
+def _matriz_da_resposta(cabecalho: Dict, corpo: bytes) -> np.ndarray:
+    return np.frombuffer(corpo, dtype=np.float32).reshape(cabecalho["formato"]).copy()
+
+
+class AsrServidorModelos(IAsr):
+    """ASR executado pelo servidor de modelos."""
+
+    def __init__(self, cliente: Optional[ClienteServidorModelos] = None) -> None:
+        self.cliente = cliente or ClienteServidorModelos()
+
+    def transcrever(self, caminho_audio: str) -> TabelaSegmentos:
+        cabecalho, _ = self.cliente.chamar(
+            "transcrever", {"caminho_audio": str(Path(caminho_audio).resolve())}
+        )
+        return TabelaSegmentos.de_dicts(cabecalho["segmentos"])
+
+
+class EmbeddingServidorModelos(IEmbeddingExtractor):
+    """Extração de embedding executada pelo servidor de modelos."""
+
+    def __init__(self, cliente: Optional[ClienteServidorModelos] = None) -> None:
+        self.cliente = cliente or ClienteServidorModelos()
+
+    def extrair(self, caminho_audio: str) -> np.ndarray:
+        cabecalho, corpo = self.cliente.chamar(
+            "extrair", {"caminho_audio": str(Path(caminho_audio).resolve())}
+        )
+        return _matriz_da_resposta(cabecalho, corpo)
+
+    def extrair_lote(self, caminhos_audio: List[str]) -> List[np.ndarray]:
+        cabecalho, corpo = self.cliente.chamar(
+            "extrair_lote",
+            {"caminhos_audio": [str(Path(caminho).resolve()) for caminho in caminhos_audio]},
+        )
+        return list(_matriz_da_resposta(cabecalho, corpo))
+
+
+class TtsServidorModelos(ITts):
+    """Síntese de voz executada pelo servidor de modelos."""
+
+    def __init__(self, cliente: Optional[ClienteServidorModelos] = None) -> None:
+        self.cliente = cliente or ClienteServidorModelos()
+
+    def sintetizar(
+        self, texto: str, embedding: Optional[Union[list, np.ndarray]] = None
+    ) -> bytes:
+        corpo = b""
+        if embedding is not None:
+            corpo = np.asarray(list(embedding), dtype=np.float32).tobytes()
+        _, audio = self.cliente.chamar("sintetizar", {"texto": texto}, corpo)
+        return audio
@@ -1,29 +1,71 @@
 # src/autodub/adapters/real_ffmpeg_wrapper.py
 from __future__ import annotations
 
+import json
 import logging
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+# Codecs de áudio aceitos na saída → encoder do ffmpeg
+CODECS_AUDIO = {"aac": "aac", "opus": "libopus"}
+
+# ISO 639-1 → ISO 639-2 (metadado de idioma das faixas em MP4/MKV)
+IDIOMAS_ISO639_2 = {
+    "pt": "por",
+    "es": "spa",
+    "en": "eng",
+    "fr": "fra",
+    "it": "ita",
+    "de": "deu",
+    "ja": "jpn",
+    "zh": "zho",
+}
+
+
+def codigo_idioma(idioma: str) -> str:
+    """'pt-br' → 'por'; códigos desconhecidos são mantidos (só a parte base)."""
+    base = idioma.lower().replace("_", "-").split("-")[0]
+    return IDIOMAS_ISO639_2.get(base, base)
+
+
 class RealFFmpegWrapper:
     """
     Wrapper mínimo para operações com ffmpeg:
     - extract_audio(video_path, out_audio_path)
+    - probe(media_path) / duration(media_path): fluxos e duração (ffprobe)
     - mux_audio(video_path, audio_path, out_video_path)
+    - mux_faixas(video_path, faixas, out_video_path): várias faixas em um passo
+    - mux_pcm(video_path, blocos, sample_rate, out_video_path): áudio via stdin
+    - stream_audio(source, ...): blocos PCM16 de uma entrada contínua
 
     Usa o executável 'ffmpeg' disponível no PATH do sistema.
+
+    Args:
+        audio_codec (str): Codec das faixas dubladas ("aac" ou "opus").
+        audio_bitrate (str): Taxa de bits das faixas dubladas (ex.: "128k").
     """
 
+    def __init__(self, audio_codec: str = "aac", audio_bitrate: str = "128k") -> None:
+        if audio_codec not in CODECS_AUDIO:
+            raise ValueError(
+                f"audio_codec deve ser um de {sorted(CODECS_AUDIO)}, não {audio_codec!r}."
+            )
+        self.audio_codec = audio_codec
+        self.audio_bitrate = audio_bitrate
+
     def extract_audio(
         self, video_path: Union[str, Path], out_audio_path: Union[str, Path]
     ) -> None:
         video_path = str(video_path)
         out_audio_path = str(out_audio_path)
-        # Força WAV PCM 16kHz mono (bom para ASR)
+        # Força 16kHz mono (bom para ASR): WAV PCM, ou FLAC se a extensão pedir
         cmd = [
             "ffmpeg",
             "-y",  # overwrite
@@ -31,7 +73,7 @@ class RealFFmpegWrapper:
             video_path,
             "-vn",  # no video
             "-acodec",
-            "pcm_s16le",
+            "flac" if out_audio_path.lower().endswith(".flac") else "pcm_s16le",
             "-ac",
             "1",
             "-ar",
@@ -49,37 +91,282 @@ class RealFFmpegWrapper:
             logger.error("ffmpeg extract_audio falhou: %s", stderr)
             raise RuntimeError(f"ffmpeg failed to extract audio: {stderr}") from exc
 
+    def probe(self, media_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Inspeciona o arquivo com ffprobe, sem decodificar nada.
+
+        Returns:
+            Dict: `{"formato", "duracao", "fluxos": [{"tipo", "codec", "taxa",
+            "canais"}]}` (campos ausentes ficam None).
+
+        Raises:
+            RuntimeError: Se o ffprobe falhar (arquivo inexistente ou ilegível).
+        """
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_format",
+            "-show_streams",
+            "-of",
+            "json",
+            str(media_path),
+        ]
+        try:
+            resultado = subprocess.run(cmd, check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            stderr = getattr(exc, "stderr", None)
+            mensagem = stderr.decode(errors="replace") if stderr else str(exc)
+            logger.error("ffprobe falhou: %s", mensagem)
+            raise RuntimeError(f"ffprobe failed to inspect {media_path}: {mensagem}") from exc
+
+        dados = json.loads(resultado.stdout or b"{}")
+        formato = dados.get("format", {})
+
+        def numero(valor, tipo):
+            try:
+                return tipo(valor)
+            except (TypeError, ValueError):
+                return None
+
+        return {
+            "formato": formato.get("format_name"),
+            "duracao": numero(formato.get("duration"), float),
+            "fluxos": [
+                {
+                    "tipo": fluxo.get("codec_type"),
+                    "codec": fluxo.get("codec_name"),
+                    "taxa": numero(fluxo.get("sample_rate"), int),
+                    "canais": numero(fluxo.get("channels"), int),
+                }
+                for fluxo in dados.get("streams", [])
+            ],
+        }
+
+    def duration(self, media_path: Union[str, Path]) -> Optional[float]:
+        """Duração do arquivo em segundos (ffprobe), ou None se desconhecida."""
+        try:
+            return self.probe(media_path)["duracao"]
+        except RuntimeError as exc:
+            logger.warning("ffprobe não obteve a duração de %s: %s", media_path, exc)
+            return None
+
     def mux_audio(
         self,
         video_path: Union[str, Path],
         audio_path: Union[str, Path],
         out_video_path: Union[str, Path],
     ) -> None:
-        video_path = str(video_path)
-        audio_path = str(audio_path)
-        out_video_path = str(out_video_path)
-        # Copia vídeo e substitui a trilha de áudio
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            video_path,
-            "-i",
-            audio_path,
+        """Copia o vídeo e substitui a trilha de áudio (codificada direto no codec)."""
+        self.mux_faixas(video_path, [(None, audio_path)], out_video_path)
+
+    def comando_mux(
+        self,
+        video_path: Union[str, Path],
+        faixas: Sequence[Tuple[Optional[str], Union[str, Path]]],
+        out_video_path: Union[str, Path],
+        keep_original: bool = False,
+        pcm_sample_rate: int = 16000,
+    ) -> List[str]:
+        """
+        Monta o comando de `mux_faixas` (uma única invocação do ffmpeg).
+
+        O vídeo (se houver) é copiado (`-c:v copy`); as faixas dubladas são
+        codificadas em `audio_codec`/`audio_bitrate`, com metadado de idioma, e a
+        primeira é a padrão. Com `keep_original`, a primeira faixa de áudio do
+        vídeo (se existir) vai por último, copiada sem recodificar. Uma faixa
+        "pipe:0" é lida da entrada padrão como PCM16 mono cru a `pcm_sample_rate`.
+        """
+        cmd = ["ffmpeg", "-y", "-i", str(video_path)]
+        for _, audio_path in faixas:
+            if str(audio_path) == "pipe:0":
+                cmd += ["-f", "s16le", "-ar", str(pcm_sample_rate), "-ac", "1"]
+            cmd += ["-i", str(audio_path)]
+        cmd += ["-map", "0:v:0?"]
+        for k in range(len(faixas)):
+            cmd += ["-map", f"{k + 1}:a:0"]
+        if keep_original:
+            cmd += ["-map", "0:a:0?"]
+
+        cmd += [
             "-c:v",
             "copy",
-            "-map",
-            "0:v:0",
-            "-map",
-            "1:a:0",
-            out_video_path,
+            "-c:a",
+            CODECS_AUDIO[self.audio_codec],
+            "-b:a",
+            self.audio_bitrate,
         ]
+        if keep_original:
+            cmd += [f"-c:a:{len(faixas)}", "copy"]
+
+        for k, (idioma, _) in enumerate(faixas):
+            if idioma:
+                cmd += [
+                    f"-metadata:s:a:{k}",
+                    f"language={codigo_idioma(idioma)}",
+                    f"-metadata:s:a:{k}",
+                    f"title={idioma}",
+                ]
+            cmd += [f"-disposition:a:{k}", "default" if k == 0 else "0"]
+        if keep_original:
+            cmd += [f"-disposition:a:{len(faixas)}", "0"]
+
+        return cmd + [str(out_video_path)]
+
+    def mux_faixas(
+        self,
+        video_path: Union[str, Path],
+        faixas: Sequence[Tuple[Optional[str], Union[str, Path]]],
+        out_video_path: Union[str, Path],
+        keep_original: bool = False,
+    ) -> None:
+        """
+        Substitui o áudio do vídeo por várias faixas (uma por idioma) em um passo.
+
+        Args:
+            faixas: Pares (idioma, caminho do áudio); idioma None não gera metadado.
+            keep_original (bool): Mantém a faixa original como última faixa.
+        """
+        if not faixas:
+            raise ValueError("mux_faixas exige ao menos uma faixa de áudio.")
+        cmd = self.comando_mux(video_path, faixas, out_video_path, keep_original)
         try:
             subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             logger.debug(
-                "RealFFmpegWrapper.mux_audio executado com sucesso: %s", out_video_path
+                "RealFFmpegWrapper.mux_faixas executado com sucesso: %s (%d faixas)",
+                out_video_path,
+                len(faixas),
             )
         except subprocess.CalledProcessError as exc:
             stderr = exc.stderr.decode() if exc.stderr else str(exc)
-            logger.error("ffmpeg mux_audio falhou: %s", stderr)
+            logger.error("ffmpeg mux_faixas falhou: %s", stderr)
             raise RuntimeError(f"ffmpeg failed to mux audio: {stderr}") from exc
+
+    def mux_pcm(
+        self,
+        video_path: Union[str, Path],
+        blocos: Iterable[np.ndarray],
+        sample_rate: int,
+        out_video_path: Union[str, Path],
+        language: Optional[str] = None,
+        keep_original: bool = False,
+    ) -> None:
+        """
+        Como `mux_audio`, mas o áudio chega em blocos PCM16 mono pela entrada
+        padrão do ffmpeg, sem WAV intermediário em disco.
+
+        A codificação e o mux acontecem enquanto os blocos são produzidos; o
+        consumo de `blocos` e o trabalho do ffmpeg se sobrepõem.
+
+        Args:
+            blocos: Blocos int16 mono, na ordem.
+            sample_rate (int): Taxa das amostras de `blocos`.
+            language (str, opcional): Idioma da faixa (metadado).
+        """
+        cmd = self.comando_mux(
+            video_path,
+            [(language, "pipe:0")],
+            out_video_path,
+            keep_original,
+            pcm_sample_rate=sample_rate,
+        )
+        # stderr em arquivo: um pipe cheio travaria o ffmpeg enquanto escrevemos
+        with tempfile.TemporaryFile() as stderr:
+            processo = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr
+            )
+            try:
+                try:
+                    for bloco in blocos:
+                        processo.stdin.write(np.asarray(bloco, dtype="<i2").tobytes())
+                except BrokenPipeError:
+                    pass  # ffmpeg encerrou antes; o código de saída explica
+                except BaseException:
+                    # Fechar a entrada seria um EOF limpo e o ffmpeg finalizaria
+                    # uma saída truncada, mas válida: mata antes, depois apaga
+                    processo.kill()
+                    processo.wait()
+                    self._fechar_entrada(processo)
+                    Path(out_video_path).unlink(missing_ok=True)
+                    raise
+                self._fechar_entrada(processo)
+                codigo = processo.wait()
+            finally:
+                if processo.poll() is None:
+                    processo.kill()
+                    processo.wait()
+
+            if codigo != 0:
+                stderr.seek(0)
+                mensagem = stderr.read().decode(errors="replace")
+                logger.error("ffmpeg mux_pcm falhou: %s", mensagem)
+                raise RuntimeError(f"ffmpeg failed to mux audio: {mensagem}")
+        logger.debug("RealFFmpegWrapper.mux_pcm executado com sucesso: %s", out_video_path)
+
+    @staticmethod
+    def _fechar_entrada(processo: subprocess.Popen) -> None:
+        try:
+            processo.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    def stream_audio(
+        self,
+        source: Union[str, Path],
+        chunk_samples: int = 8000,
+        sample_rate: int = 16000,
+        follow: bool = False,
+    ) -> Iterator[np.ndarray]:
+        """
+        Lê uma entrada contínua como blocos PCM16 mono, à medida que chegam.
+
+        Args:
+            source: Arquivo, URL ou "-" (entrada padrão deste processo, ex.: pipe).
+            chunk_samples (int): Amostras por bloco (o último pode ser menor).
+            sample_rate (int): Taxa de saída.
+            follow (bool): Continua lendo um arquivo que ainda está crescendo
+                (`-follow 1` do protocolo file do ffmpeg).
+
+        Yields:
+            np.ndarray: Blocos int16.
+        """
+        cmd = [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            *(["-follow", "1"] if follow else []),
+            "-i",
+            "pipe:0" if str(source) == "-" else str(source),
+            "-vn",
+            "-f",
+            "s16le",
+            "-acodec",
+            "pcm_s16le",
+            "-ac",
+            "1",
+            "-ar",
+            str(sample_rate),
+            "pipe:1",
+        ]
+        processo = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            resto = b""
+            while True:
+                dados = processo.stdout.read(chunk_samples * 2)
+                if not dados:
+                    break
+                dados = resto + dados
+                util = len(dados) - len(dados) % 2
+                resto = dados[util:]
+                yield np.frombuffer(dados[:util], dtype="<i2")
+
+            if processo.wait() != 0:
+                stderr = processo.stderr.read().decode(errors="replace")
+                logger.error("ffmpeg stream_audio falhou: %s", stderr)
+                raise RuntimeError(f"ffmpeg failed to stream audio: {stderr}")
+        finally:
+            if processo.poll() is None:
+                processo.kill()
+                processo.wait()
+            processo.stdout.close()
+            processo.stderr.close()
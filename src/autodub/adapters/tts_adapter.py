@@ -10,12 +10,17 @@ de locutores (gerados via Resemblyzer) para clonagem de voz.
 from __future__ import annotations
 
 import io
-from typing import Optional
+from typing import Iterator, Optional
 
 import numpy as np
 import soundfile as sf
 
 from autodub.interfaces.tts_interface import ITts
+from autodub.interfaces.vocoder_interface import IVocoderStreaming
+from autodub.utils.audio_features import mel_espectrograma
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+from autodub.utils.streaming_vocoder import VocoderEmBlocos
+from autodub.utils.synthetic_audio import frequencia_do_texto, gerar_tom, tom_wav_bytes
 
 
 def load_model(model_path: str, device: str):
@@ -54,12 +59,53 @@ class YourTTSAdapter(ITts):
     Args:
         model_path (str): Caminho ou nome do modelo.
         device (str): 'cuda' ou 'cpu'.
+        vocoder (IVocoderStreaming, opcional): Vocoder de streaming; quando
+            informado, o áudio sai do mel em blocos com overlap-add.
+        quadros_por_bloco (int): Quadros mel por chamada ao vocoder.
+        sobreposicao (int): Quadros sobrepostos entre blocos.
     """
 
-    def __init__(self, model_path: str = "yourtts_base.pt", device: str = "cpu"):
+    def __init__(
+        self,
+        model_path: str = "yourtts_base.pt",
+        device: str = "cpu",
+        vocoder: Optional[IVocoderStreaming] = None,
+        quadros_por_bloco: int = 64,
+        sobreposicao: int = 8,
+    ):
         self.device = device
         self.model = load_model(model_path, device)
-        self.vocoder = load_vocoder(device)
+        self.vocoder = vocoder if vocoder is not None else load_vocoder(device)
+        self.vocoder_em_blocos = (
+            VocoderEmBlocos(self.vocoder, quadros_por_bloco, sobreposicao)
+            if hasattr(self.vocoder, "sintetizar_bloco")
+            else None
+        )
+
+    def _texto_para_mel(self, texto: str, embedding: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Mel do texto (quadros, 80).
+
+        Placeholder: mel do tom simulado. Com modelo real:
+        `model.text_to_mel(texto, embedding)`.
+        """
+        sr = self.vocoder.taxa_amostragem
+        tom = gerar_tom(frequencia_do_texto(texto, base=220), int(sr * 0.8), sr, amplitude=0.2)
+        return mel_espectrograma(tom / 32768.0, sr, passo=self.vocoder.amostras_por_quadro)
+
+    def sintetizar_streaming(
+        self, texto: str, embedding: Optional[np.ndarray] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Gera a fala em trechos float32, na ordem, assim que cada bloco fica pronto.
+
+        Sem vocoder de streaming, o áudio completo sai como um único trecho.
+        """
+        if self.vocoder_em_blocos is None:
+            audio, _ = sf.read(io.BytesIO(self.sintetizar(texto, embedding)), dtype="float32")
+            yield audio
+            return
+        yield from self.vocoder_em_blocos.fluxo(self._texto_para_mel(texto, embedding))
 
     def sintetizar(self, texto: str, embedding: Optional[np.ndarray] = None) -> bytes:
         """
@@ -72,17 +118,16 @@ class YourTTSAdapter(ITts):
         Returns:
             bytes: Áudio WAV 16kHz PCM16.
         """
-        # --- Simulação (mock funcional) ---
-        # Gera senoide simples para debug
-        import numpy as np
+        if self.vocoder_em_blocos is not None:
+            trechos = list(self.sintetizar_streaming(texto, embedding))
+            return pcm16_para_wav_bytes(np.concatenate(trechos), self.vocoder.taxa_amostragem)
 
+        # --- Simulação (mock funcional) ---
+        # Gera senoide simples para debug (gerador compartilhado, com cache)
         sr = 16000
-        t = np.linspace(0, 0.8, int(sr * 0.8), endpoint=False)
-        freq = 220 + (hash(texto) % 200)
-        audio = 0.2 * np.sin(2 * np.pi * freq * t)
+        freq = frequencia_do_texto(texto, base=220)
 
         # futuro: usar modelo real
         # mel = model.text_to_mel(texto, embedding)
         # audio = vocoder(mel)
-        wav_bytes = wav_bytes_from_array(audio, sr=sr)
-        return wav_bytes
+        return tom_wav_bytes(freq, int(sr * 0.8), sr, amplitude=0.2)
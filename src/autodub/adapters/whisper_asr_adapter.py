@@ -1,8 +1,14 @@
 # src/autodub/adapters/whisper_asr.py
 
+import math
+
 import whisper
 
 from autodub.interfaces.asr_interface import IAsr
+from autodub.utils.segment_table import TabelaSegmentos
+
+# Métricas por segmento do Whisper usadas para descartar não-fala e alucinações
+METRICAS_QUALIDADE = ("no_speech_prob", "avg_logprob", "compression_ratio")
 
 
 class WhisperAsr(IAsr):
@@ -17,6 +23,17 @@ class WhisperAsr(IAsr):
         self.model_name = model_name
         self.model = whisper.load_model(model_name)
 
+    def definir_threads(self, threads: int) -> None:
+        """
+        Limita as threads intra-op do torch usadas pelo Whisper.
+
+        Args:
+            threads (int): Número de threads do orçamento deste trabalhador.
+        """
+        import torch
+
+        torch.set_num_threads(threads)
+
     def transcrever(self, audio_path: str):
         """
         Transcreve o áudio usando Whisper.
@@ -25,8 +42,10 @@ class WhisperAsr(IAsr):
             audio_path (str): Caminho para o arquivo de áudio.
 
         Returns:
-            list[dict]: Lista de segmentos no formato
-                        {"texto": str, "inicio": float, "fim": float}
+            TabelaSegmentos: Segmentos com as colunas `texto`, `inicio` e `fim`
+                             (cada linha se comporta como o dict antigo), mais
+                             as métricas de qualidade do Whisper
+                             (`no_speech_prob`, `avg_logprob`, `compression_ratio`).
 
         Raises:
             RuntimeError: Se a transcrição com o Whisper falhar.
@@ -34,10 +53,16 @@ class WhisperAsr(IAsr):
         try:
             # Tenta executar a transcrição
             result = self.model.transcribe(audio_path)
-            return [
-                {"texto": seg["text"], "inicio": seg["start"], "fim": seg["end"]}
-                for seg in result["segments"]
-            ]
+            segmentos = result["segments"]
+            return TabelaSegmentos(
+                inicio=[seg["start"] for seg in segmentos],
+                fim=[seg["end"] for seg in segmentos],
+                textos={"texto": [seg["text"] for seg in segmentos]},
+                numericas={
+                    metrica: [seg.get(metrica, math.nan) for seg in segmentos]
+                    for metrica in METRICAS_QUALIDADE
+                },
+            )
         except Exception as e:
             # Se qualquer erro ocorrer, captura e lança um erro padronizado
             raise RuntimeError("Falha na transcrição com Whisper") from e
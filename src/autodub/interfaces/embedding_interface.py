@@ -21,3 +21,18 @@ class IEmbeddingExtractor(Protocol):
         Returns:
             List[float]: Vetor numérico representando o embedding do locutor.
         """
+
+    def extrair_lote(self, caminhos_audio: List[str]) -> List[List[float]]:
+        """
+        Extrai os embeddings de vários arquivos de áudio.
+
+        A implementação padrão chama `extrair` em sequência; implementações
+        podem sobrescrevê-la para processar o lote de forma mais eficiente.
+
+        Args:
+            caminhos_audio (List[str]): Caminhos para os arquivos de áudio.
+
+        Returns:
+            List[List[float]]: Um embedding por arquivo, na mesma ordem da entrada.
+        """
+        return [self.extrair(caminho_audio) for caminho_audio in caminhos_audio]
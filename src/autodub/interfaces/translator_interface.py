@@ -24,3 +24,20 @@ class ITranslator(Protocol):
             str: Texto traduzido.
         """
         ...
+
+    def condensar(self, texto: str, target_lang: str, max_segundos: float) -> str:
+        """
+        Reescreve uma tradução para caber em `max_segundos` de fala.
+
+        Opcional: a implementação padrão devolve o texto sem mudanças, e a
+        pipeline só registra o segmento como excedente.
+
+        Args:
+            texto (str): Texto já traduzido.
+            target_lang (str): Idioma do texto.
+            max_segundos (float): Duração do trecho original.
+
+        Returns:
+            str: Texto condensado (ou o próprio `texto`).
+        """
+        return texto
@@ -16,6 +16,9 @@ import numpy as np
 class ITts(Protocol):
     """
     Interface para sistemas de Text-to-Speech (TTS).
+
+    Atributo opcional `seguro_para_threads` (bool): só com True a pipeline
+    chama `sintetizar` de várias threads ao mesmo tempo.
     """
 
     def sintetizar(
@@ -0,0 +1,50 @@
+# src/autodub/interfaces/vocoder_interface.py
+
+"""
+Interface para vocoders (espectrograma mel → forma de onda).
+
+Um vocoder completo recebe o mel inteiro e devolve o áudio inteiro. Um vocoder
+de streaming converte blocos de quadros mel, e `VocoderEmBlocos` costura os
+blocos com sobreposição para entregar o áudio aos poucos.
+"""
+
+from typing import Protocol
+
+import numpy as np
+
+
+class IVocoder(Protocol):
+    def sintetizar_from_mel(self, mel) -> bytes:
+        """
+        Converte um espectrograma mel completo em áudio.
+
+        Args:
+            mel: Espectrograma (quadros, n_mels).
+
+        Returns:
+            bytes: Áudio gerado.
+        """
+
+
+class IVocoderStreaming(Protocol):
+    """
+    Vocoder que converte blocos de quadros mel de forma independente.
+
+    Atributos:
+        taxa_amostragem (int): Taxa do áudio gerado.
+        amostras_por_quadro (int): Amostras geradas por quadro mel (hop).
+    """
+
+    taxa_amostragem: int
+    amostras_por_quadro: int
+
+    def sintetizar_bloco(self, mel: np.ndarray) -> np.ndarray:
+        """
+        Converte um bloco de quadros mel em amostras.
+
+        Args:
+            mel (np.ndarray): Bloco (quadros, n_mels).
+
+        Returns:
+            np.ndarray: Amostras float32 mono, `quadros * amostras_por_quadro`.
+        """
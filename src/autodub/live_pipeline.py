@@ -0,0 +1,267 @@
+"""
+Modo ao vivo: dublagem de uma entrada contínua em janelas móveis.
+
+`Pipeline.executar` precisa do vídeo completo e só entrega a saída no fim. A
+`PipelineAoVivo` consome o áudio à medida que ele chega (pipe, arquivo
+crescente ou URL, via `ffmpeg.stream_audio`) e, a cada janela, passa os
+segmentos por ASR → tradução → TTS, entregando cada trecho dublado assim que
+fica pronto.
+
+- A janela tem metade da latência alvo; a outra metade é o orçamento de
+  processamento.
+- Um segmento que termina colado no fim da janela provavelmente foi cortado no
+  meio da fala: ele fica para a próxima janela, que recomeça no início dele.
+- Cada etapa tem um histograma de latência, e a latência ponta a ponta de cada
+  trecho (da chegada do seu último bloco de áudio até a entrega) é comparada
+  com a latência alvo.
+"""
+
+from __future__ import annotations
+
+import bisect
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from autodub.pipeline import logger
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+from autodub.utils.latency_histogram import HistogramaLatencia
+from autodub.utils.segment_table import TabelaSegmentos
+
+ETAPAS = ("asr", "traducao", "tts", "ponta_a_ponta")
+
+
+class PipelineAoVivo:
+    """
+    Dubla áudio contínuo em janelas móveis.
+
+    Args:
+        asr: Implementação de `IAsr` (recebe o caminho do WAV da janela).
+        tts: Implementação de `ITts`.
+        ffmpeg (opcional): Wrapper com `stream_audio`, usado quando a entrada é
+            um caminho/URL/"-".
+        translator (opcional): Tradutor com `traduzir(texto, idioma)`.
+        latencia_alvo (float): Latência ponta a ponta desejada, em segundos.
+        janela_segundos (float, opcional): Duração da janela (padrão: metade da
+            latência alvo).
+        margem_segundos (float): Segmentos que terminam a menos disso do fim da
+            janela são adiados para a próxima.
+        sample_rate (int): Taxa do áudio de entrada.
+        diretorio_saida (str | Path, opcional): Se informado, cada trecho dublado
+            também é gravado como `trecho_000000.wav`.
+        relogio (Callable[[], float]): Fonte de tempo (injetável nos testes).
+    """
+
+    def __init__(
+        self,
+        asr,
+        tts,
+        ffmpeg=None,
+        translator=None,
+        latencia_alvo: float = 4.0,
+        janela_segundos: Optional[float] = None,
+        margem_segundos: float = 0.3,
+        sample_rate: int = 16000,
+        diretorio_saida: Optional[Union[str, Path]] = None,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not all([asr, tts]):
+            raise ValueError("asr e tts são obrigatórios para criar a PipelineAoVivo")
+        janela_segundos = janela_segundos or latencia_alvo / 2
+        if not 0 <= margem_segundos < janela_segundos:
+            raise ValueError("margem_segundos deve estar em [0, janela_segundos).")
+
+        self.asr = asr
+        self.tts = tts
+        self.ffmpeg = ffmpeg
+        self.translator = translator
+        self.latencia_alvo = latencia_alvo
+        self.janela_segundos = janela_segundos
+        self.margem_segundos = margem_segundos
+        self.sample_rate = sample_rate
+        self.diretorio_saida = Path(diretorio_saida) if diretorio_saida else None
+        self.relogio = relogio
+        self.histogramas: Dict[str, HistogramaLatencia] = {}
+        self.relatorio: Dict[str, Any] = {}
+
+    def _blocos(self, entrada, seguir: bool) -> Iterable[np.ndarray]:
+        if isinstance(entrada, (str, Path)):
+            if self.ffmpeg is None or not hasattr(self.ffmpeg, "stream_audio"):
+                raise ValueError("Entrada por caminho exige um ffmpeg com stream_audio.")
+            return self.ffmpeg.stream_audio(
+                str(entrada), sample_rate=self.sample_rate, follow=seguir
+            )
+        return entrada
+
+    def _medir(self, etapa: str, funcao: Callable, *args):
+        inicio = self.relogio()
+        resultado = funcao(*args)
+        self.histogramas[etapa].registrar(self.relogio() - inicio)
+        return resultado
+
+    def executar(
+        self,
+        entrada: Union[str, Path, Iterable[np.ndarray]],
+        target_lang: str = "pt-br",
+        seguir: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Dubla a entrada, entregando cada trecho assim que fica pronto.
+
+        Args:
+            entrada: Caminho/URL/"-" (lido com `ffmpeg.stream_audio`) ou um
+                iterável de blocos int16 mono.
+            target_lang (str): Idioma de destino.
+            seguir (bool): Trata o arquivo de entrada como crescente.
+
+        Yields:
+            Dict: `{"indice", "inicio", "fim", "texto", "texto_traduzido", "wav",
+            "latencia", "arquivo"}`, com tempos absolutos na entrada.
+        """
+        self.histogramas = {etapa: HistogramaLatencia() for etapa in ETAPAS}
+        self.relatorio = {
+            "latencia_alvo": self.latencia_alvo,
+            "janela_segundos": self.janela_segundos,
+            "janelas": 0,
+            "trechos": 0,
+            "acima_da_latencia_alvo": 0,
+        }
+        if self.diretorio_saida:
+            self.diretorio_saida.mkdir(parents=True, exist_ok=True)
+
+        janela = int(round(self.janela_segundos * self.sample_rate))
+        tmpdir = Path(tempfile.mkdtemp(prefix="autodub_ao_vivo_"))
+        logger.info(
+            f"Modo ao vivo: janelas de {self.janela_segundos:.2f}s, "
+            f"latência alvo {self.latencia_alvo:.2f}s"
+        )
+
+        # Estado da janela: blocos pendentes, amostra absoluta do início e
+        # (amostra final, instante de chegada) de cada bloco
+        pendentes: List[np.ndarray] = []
+        inicio_buffer = 0
+        chegadas: List[Tuple[int, float]] = []
+
+        try:
+            for bloco in self._blocos(entrada, seguir):
+                bloco = np.asarray(bloco, dtype=np.int16)
+                if len(bloco) == 0:
+                    continue
+                pendentes.append(bloco)
+                fim_recebido = (chegadas[-1][0] if chegadas else 0) + len(bloco)
+                chegadas.append((fim_recebido, self.relogio()))
+
+                while fim_recebido - inicio_buffer >= janela:
+                    audio = np.concatenate(pendentes)
+                    corte = yield from self._processar_janela(
+                        audio, inicio_buffer, chegadas, tmpdir, target_lang, final=False
+                    )
+                    pendentes = [audio[corte:]]
+                    inicio_buffer += corte
+
+            if pendentes and sum(map(len, pendentes)):
+                yield from self._processar_janela(
+                    np.concatenate(pendentes),
+                    inicio_buffer,
+                    chegadas,
+                    tmpdir,
+                    target_lang,
+                    final=True,
+                )
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            self.relatorio["latencias"] = {
+                etapa: histograma.resumo() for etapa, histograma in self.histogramas.items()
+            }
+            ponta = self.relatorio["latencias"]["ponta_a_ponta"]
+            logger.info(
+                f"Modo ao vivo: {self.relatorio['trechos']} trechos em "
+                f"{self.relatorio['janelas']} janelas, latência p50 {ponta['p50']:.2f}s / "
+                f"p90 {ponta['p90']:.2f}s ({self.relatorio['acima_da_latencia_alvo']} "
+                "acima do alvo)"
+            )
+
+    def _processar_janela(
+        self,
+        audio: np.ndarray,
+        inicio_buffer: int,
+        chegadas: List[Tuple[int, float]],
+        tmpdir: Path,
+        target_lang: str,
+        final: bool,
+    ):
+        """
+        Transcreve, traduz e sintetiza uma janela (gerador de trechos).
+
+        Returns:
+            int: Amostras da janela já consumidas; o restante (segmentos adiados)
+            abre a próxima janela.
+        """
+        self.relatorio["janelas"] += 1
+        caminho = tmpdir / f"janela_{self.relatorio['janelas']:06d}.wav"
+        caminho.write_bytes(pcm16_para_wav_bytes(audio, self.sample_rate))
+        segmentos = TabelaSegmentos.de_segmentos(
+            self._medir("asr", self.asr.transcrever, str(caminho))
+        )
+        caminho.unlink()
+
+        duracao = len(audio) / self.sample_rate
+        adiados = segmentos.fim > duracao - self.margem_segundos
+        corte = len(audio)
+        if not final and adiados.any():
+            candidato = int(round(float(segmentos.inicio[adiados].min()) * self.sample_rate))
+            # O que fica para depois precisa ser menor que uma janela; senão (ex.:
+            # um segmento ocupando a janela inteira) a janela seria refeita em laço
+            if len(audio) - candidato < self.janela_segundos * self.sample_rate:
+                corte = candidato
+        processar = segmentos.inicio * self.sample_rate < corte
+
+        textos = segmentos.textos("texto")
+        fins_chegada = [fim for fim, _ in chegadas]
+        for i in range(len(segmentos)):
+            if not processar[i]:
+                continue
+            texto = textos[i] or ""
+            traduzido = (
+                self._medir("traducao", self.translator.traduzir, texto, target_lang)
+                if self.translator
+                else None
+            )
+            wav = self._medir("tts", self.tts.sintetizar, traduzido or texto)
+
+            fim_absoluto = inicio_buffer + min(
+                int(round(segmentos.fim[i] * self.sample_rate)), len(audio)
+            )
+            chegada = chegadas[
+                min(bisect.bisect_left(fins_chegada, fim_absoluto), len(chegadas) - 1)
+            ][1]
+            latencia = self.relogio() - chegada
+            self.histogramas["ponta_a_ponta"].registrar(latencia)
+            if latencia > self.latencia_alvo:
+                self.relatorio["acima_da_latencia_alvo"] += 1
+
+            trecho = {
+                "indice": self.relatorio["trechos"],
+                "inicio": inicio_buffer / self.sample_rate + float(segmentos.inicio[i]),
+                "fim": inicio_buffer / self.sample_rate + float(segmentos.fim[i]),
+                "texto": texto,
+                "texto_traduzido": traduzido,
+                "wav": wav,
+                "latencia": latencia,
+                "arquivo": None,
+            }
+            if self.diretorio_saida:
+                arquivo = self.diretorio_saida / f"trecho_{trecho['indice']:06d}.wav"
+                arquivo.write_bytes(wav)
+                trecho["arquivo"] = str(arquivo)
+            self.relatorio["trechos"] += 1
+            yield trecho
+
+        # Blocos já totalmente consumidos não são mais consultados
+        while len(chegadas) > 1 and chegadas[0][0] <= inicio_buffer + corte:
+            chegadas.pop(0)
+        return corte
@@ -0,0 +1,293 @@
+"""
+Servidor local de modelos compartilhado por várias execuções da pipeline.
+
+Um único processo de longa duração mantém os modelos de ASR, embedding e TTS
+carregados e atende pedidos por um socket Unix. Cada trabalho usa os adapters
+cliente (`autodub.adapters.model_server_client_adapter`), que não carregam
+pesos: o custo de inicialização por trabalho cai para quase zero e todos os
+trabalhos do nó compartilham uma única cópia dos modelos na memória.
+
+Protocolo (por conexão, um pedido e uma resposta):
+    [4 bytes big-endian: tamanho do cabeçalho][cabeçalho JSON][corpo binário]
+O cabeçalho informa `tamanho_corpo`; o corpo carrega dados binários (embeddings
+float32, áudio WAV) sem passar por JSON.
+
+Execute com:
+    poetry run python -m autodub.model_server --socket /tmp/autodub_modelos.sock
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from autodub.utils.segment_table import TabelaSegmentos
+
+logger = logging.getLogger(__name__)
+
+CAMINHO_SOCKET_PADRAO = "/tmp/autodub_modelos.sock"
+_TAMANHO_PREFIXO = struct.Struct(">I")
+
+
+def _receber_exato(conexao: socket.socket, tamanho: int) -> bytes:
+    """Lê exatamente `tamanho` bytes do socket."""
+    partes = []
+    restante = tamanho
+    while restante:
+        parte = conexao.recv(min(restante, 1 << 20))
+        if not parte:
+            raise ConnectionError("Conexão encerrada antes do fim da mensagem.")
+        partes.append(parte)
+        restante -= len(parte)
+    return b"".join(partes)
+
+
+def _servidor_ativo(caminho: Path) -> bool:
+    """Se algum processo aceita conexões no socket `caminho`."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sonda:
+        sonda.settimeout(1.0)
+        try:
+            sonda.connect(str(caminho))
+        except OSError:
+            return False
+    return True
+
+
+def enviar_mensagem(conexao: socket.socket, cabecalho: Dict, corpo: bytes = b"") -> None:
+    """Envia um cabeçalho JSON seguido de um corpo binário opcional."""
+    dados_cabecalho = json.dumps(
+        {**cabecalho, "tamanho_corpo": len(corpo)}, ensure_ascii=False
+    ).encode("utf-8")
+    conexao.sendall(_TAMANHO_PREFIXO.pack(len(dados_cabecalho)) + dados_cabecalho)
+    if corpo:
+        conexao.sendall(corpo)
+
+
+def receber_mensagem(conexao: socket.socket) -> Tuple[Dict, bytes]:
+    """Recebe uma mensagem enviada por `enviar_mensagem`."""
+    (tamanho_cabecalho,) = _TAMANHO_PREFIXO.unpack(
+        _receber_exato(conexao, _TAMANHO_PREFIXO.size)
+    )
+    cabecalho = json.loads(_receber_exato(conexao, tamanho_cabecalho).decode("utf-8"))
+    corpo = _receber_exato(conexao, cabecalho.get("tamanho_corpo", 0))
+    return cabecalho, corpo
+
+
+class _TratadorPedidos(socketserver.BaseRequestHandler):
+    """Atende um pedido por conexão, delegando ao `ServidorModelos`."""
+
+    def handle(self) -> None:
+        servidor_modelos: ServidorModelos = self.server.servidor_modelos
+        try:
+            cabecalho, corpo = receber_mensagem(self.request)
+        except (ConnectionError, ValueError) as exc:
+            logger.warning("Pedido inválido no servidor de modelos: %s", exc)
+            return
+
+        try:
+            resposta, corpo_resposta = servidor_modelos.atender(cabecalho, corpo)
+        except Exception as exc:
+            logger.error("Falha ao atender '%s': %s", cabecalho.get("operacao"), exc)
+            resposta, corpo_resposta = {"erro": str(exc)}, b""
+
+        enviar_mensagem(self.request, resposta, corpo_resposta)
+
+
+class ServidorModelos:
+    """
+    Mantém os modelos carregados e atende pedidos pelo socket Unix.
+
+    Cada modelo tem sua própria trava: pedidos para modelos diferentes rodam em
+    paralelo, pedidos para o mesmo modelo são serializados (os modelos não são
+    seguros para uso concorrente).
+
+    Args:
+        caminho_socket (str | Path): Caminho do socket Unix.
+        asr: Implementação de `IAsr` (opcional).
+        embedding: Implementação de `IEmbeddingExtractor` (opcional).
+        tts: Implementação de `ITts` (opcional).
+    """
+
+    def __init__(
+        self,
+        caminho_socket: Union[str, Path] = CAMINHO_SOCKET_PADRAO,
+        asr=None,
+        embedding=None,
+        tts=None,
+    ) -> None:
+        self.caminho_socket = Path(caminho_socket)
+        self.modelos = {"asr": asr, "embedding": embedding, "tts": tts}
+        self._travas = {nome: threading.Lock() for nome in self.modelos}
+        self._servidor: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _modelo(self, nome: str):
+        modelo = self.modelos[nome]
+        if modelo is None:
+            raise RuntimeError(f"Modelo '{nome}' não está carregado neste servidor.")
+        return modelo
+
+    def atender(self, cabecalho: Dict, corpo: bytes) -> Tuple[Dict, bytes]:
+        """
+        Executa uma operação e devolve (cabeçalho de resposta, corpo binário).
+
+        Raises:
+            ValueError: Se a operação for desconhecida.
+            RuntimeError: Se o modelo necessário não estiver carregado.
+        """
+        operacao = cabecalho.get("operacao")
+        argumentos = cabecalho.get("argumentos", {})
+
+        if operacao == "status":
+            carregados = [nome for nome, modelo in self.modelos.items() if modelo is not None]
+            return {"modelos": carregados, "pid": os.getpid()}, b""
+
+        if operacao == "transcrever":
+            with self._travas["asr"]:
+                segmentos = self._modelo("asr").transcrever(argumentos["caminho_audio"])
+            return {"segmentos": TabelaSegmentos.de_segmentos(segmentos).para_dicts()}, b""
+
+        if operacao == "extrair":
+            with self._travas["embedding"]:
+                vetor = self._modelo("embedding").extrair(argumentos["caminho_audio"])
+            matriz = np.asarray(list(vetor), dtype=np.float32)
+            return {"formato": list(matriz.shape)}, matriz.tobytes()
+
+        if operacao == "extrair_lote":
+            caminhos = argumentos["caminhos_audio"]
+            with self._travas["embedding"]:
+                extrator = self._modelo("embedding")
+                if hasattr(extrator, "extrair_lote"):
+                    vetores = extrator.extrair_lote(caminhos)
+                else:
+                    vetores = [extrator.extrair(caminho) for caminho in caminhos]
+            matriz = np.asarray([list(vetor) for vetor in vetores], dtype=np.float32)
+            return {"formato": list(matriz.shape)}, matriz.tobytes()
+
+        if operacao == "sintetizar":
+            with self._travas["tts"]:
+                tts = self._modelo("tts")
+                if corpo:
+                    embedding = np.frombuffer(corpo, dtype=np.float32)
+                    audio = tts.sintetizar(argumentos["texto"], embedding)
+                else:
+                    audio = tts.sintetizar(argumentos["texto"])
+            return {}, audio
+
+        raise ValueError(f"Operação desconhecida: {operacao}")
+
+    def iniciar(self) -> None:
+        """
+        Cria o socket (permissão só para o dono) e começa a aceitar conexões.
+
+        Um arquivo deixado por um servidor encerrado é removido; um servidor que
+        ainda atende no caminho não é tocado.
+
+        Raises:
+            RuntimeError: Se já houver um servidor ativo em `caminho_socket`.
+        """
+        if self.caminho_socket.exists() or self.caminho_socket.is_symlink():
+            if _servidor_ativo(self.caminho_socket):
+                raise RuntimeError(
+                    f"Já há um servidor de modelos ativo em {self.caminho_socket}."
+                )
+            self.caminho_socket.unlink()
+
+        # Restringe o socket a 0600 entre o bind e o listen: antes do listen
+        # ninguém consegue conectar, e a umask (global ao processo) fica intacta
+        servidor = socketserver.ThreadingUnixStreamServer(
+            str(self.caminho_socket), _TratadorPedidos, bind_and_activate=False
+        )
+        try:
+            servidor.server_bind()
+            os.chmod(self.caminho_socket, 0o600)
+            servidor.server_activate()
+        except BaseException:
+            servidor.server_close()
+            self.caminho_socket.unlink(missing_ok=True)
+            raise
+        self._servidor = servidor
+        self._servidor.daemon_threads = True
+        self._servidor.servidor_modelos = self
+        logger.info("Servidor de modelos ouvindo em %s", self.caminho_socket)
+
+    def servir(self) -> None:
+        """Atende pedidos até `encerrar` ser chamado (bloqueante)."""
+        if self._servidor is None:
+            self.iniciar()
+        self._servidor.serve_forever()
+
+    def iniciar_em_segundo_plano(self) -> None:
+        """Inicia o servidor em uma thread daemon (útil em testes e embutido)."""
+        self.iniciar()
+        self._thread = threading.Thread(
+            target=self._servidor.serve_forever, kwargs={"poll_interval": 0.1}, daemon=True
+        )
+        self._thread.start()
+
+    def encerrar(self) -> None:
+        """Para de atender, fecha o socket e remove o arquivo (só se foi criado aqui)."""
+        if self._servidor is None:
+            return
+        if self._thread is not None:
+            self._servidor.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._servidor.server_close()
+        self._servidor = None
+        self.caminho_socket.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ServidorModelos":
+        self.iniciar_em_segundo_plano()
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        self.encerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m autodub.model_server",
+        description="Mantém ASR, embedding e TTS carregados e os serve por socket Unix.",
+    )
+    parser.add_argument("--socket", default=CAMINHO_SOCKET_PADRAO, help="Caminho do socket")
+    parser.add_argument("--modelo-whisper", default="base", help="Modelo do Whisper")
+    parser.add_argument("--nucleos", type=int, default=None, help="Núcleos de CPU do servidor")
+    argumentos = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(name)s - %(message)s")
+
+    from autodub.adapters.embedding_extractor_adapter import ResemblyzerEmbedding
+    from autodub.adapters.tts_adapter import YourTTSAdapter
+    from autodub.adapters.whisper_asr_adapter import WhisperAsr
+    from autodub.utils.thread_budget import aplicar_threads, calcular_alocacao
+
+    if argumentos.nucleos is not None:
+        aplicar_threads(calcular_alocacao(argumentos.nucleos)["threads_por_trabalhador"])
+
+    servidor = ServidorModelos(
+        argumentos.socket,
+        asr=WhisperAsr(model_name=argumentos.modelo_whisper),
+        embedding=ResemblyzerEmbedding(),
+        tts=YourTTSAdapter(),
+    )
+    try:
+        servidor.servir()
+    except KeyboardInterrupt:
+        logger.info("Encerrando servidor de modelos")
+    finally:
+        servidor.encerrar()
+
+
+if __name__ == "__main__":
+    main()
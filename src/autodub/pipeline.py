@@ -8,14 +8,42 @@ usando apenas as assinaturas públicas dos componentes.
 
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
 import json
 import logging
+import os
+import queue
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from autodub.utils.artifact_writer import EscritorArtefatos
+from autodub.utils.audio_features import localizar_dados_wav
+from autodub.utils.audio_storage import (
+    com_formato,
+    gravar_pcm16,
+    gravar_wav_bytes,
+    ler_pcm16,
+    taxa_arquivo,
+    validar_formato,
+)
+from autodub.utils.disk_budget import MonitorDisco, estimar_uso_disco
+from autodub.utils.preflight import planejar, vincular_ou_copiar
+from autodub.utils.progress import RelatorProgresso
+from autodub.utils.segment_table import TabelaSegmentos
+from autodub.utils.thread_budget import aplicar_threads, calcular_alocacao
+from autodub.utils.time_stretch import ajustar_ao_trecho
 
 # --- CORES ANSI ---
 RESET = "\033[0m"
@@ -25,13 +53,23 @@ RED = "\033[91m"
 
 # --- EMOJIS PARA A PIPELINE ---
 EMOJIS = {
+    "preflight": "🔎",
     "criando diretório temporário": "📂",
     "extraindo áudio": "🎵",
     "áudio extraído": "🎵",
     "extraindo embedding": "🧠",
     "embedding extraído": "✨",
     "embedding salvo": "💾",
+    "biblioteca de vozes": "📚",
+    "orçamento de threads": "🧵",
+    "relatório": "📊",
+    "artefatos de debug": "💾",
     "transcrevendo áudio": "📝",
+    "ressegmentação": "🧩",
+    "filtro de segmentos": "🧹",
+    "previsão de duração": "⏱️",
+    "modo ao vivo": "📡",
+    "redublagem": "🩹",
     "obtidos": "✂️",
     "traduzindo segmentos": "🌍",
     "tradução salva": "💾",
@@ -44,9 +82,26 @@ EMOJIS = {
 }
 
 
+# Artefatos de debug usados pela redublagem incremental (`Pipeline.redublar`)
+ARQUIVO_MANIFESTO = "manifesto_sintese.json"
+ARQUIVO_TRILHA = "trilha_dublada.wav"
+
+# Uma única busca por mensagem (as chaves mais antigas têm prioridade no empate)
+# Lookahead: em cada posição, a primeira chave (na ordem de EMOJIS) que começa ali,
+# inclusive chaves sobrepostas; vence a de menor posição em EMOJIS, como na busca
+# chave a chave
+_PADRAO_EMOJIS = re.compile("(?=(" + "|".join(map(re.escape, EMOJIS)) + "))", re.IGNORECASE)
+_ORDEM_EMOJIS = {chave: ordem for ordem, chave in enumerate(EMOJIS)}
+
+
+def _emoji_da_mensagem(mensagem: str) -> str:
+    chaves = {encontrado.group(1).lower() for encontrado in _PADRAO_EMOJIS.finditer(mensagem)}
+    return EMOJIS[min(chaves, key=_ORDEM_EMOJIS.__getitem__)] if chaves else ""
+
+
 class ColorFormatter(logging.Formatter):
     def format(self, record):
-        msg = record.getMessage().lower()
+        mensagem = record.getMessage()
 
         # Cor do nível
         if record.levelno == logging.INFO:
@@ -59,15 +114,84 @@ class ColorFormatter(logging.Formatter):
             levelname = record.levelname
 
         # Emoji de acordo com a mensagem
-        emoji = next((icon for key, icon in EMOJIS.items() if key in msg), "")
+        emoji = _emoji_da_mensagem(mensagem)
+
+        return f"{levelname}: {record.name}.py - {record.module}: {emoji} {mensagem}"
+
+
+class JsonFormatter(logging.Formatter):
+    """Uma linha JSON por registro, sem cores nem emojis (saída que não é terminal)."""
+
+    def format(self, record):
+        dados = {
+            "tempo": round(record.created, 3),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "modulo": record.module,
+            "mensagem": record.getMessage(),
+        }
+        if record.exc_info:
+            dados["excecao"] = self.formatException(record.exc_info)
+        return json.dumps(dados, ensure_ascii=False)
+
+
+class FilaDeLogs(QueueHandler):
+    """
+    `QueueHandler` que entrega a exceção ao formatador do ouvinte.
+
+    O `prepare` padrão formata o registro na thread de origem, junta o traceback
+    à mensagem e apaga `exc_info`: no JSON, a chave "excecao" sumiria só no modo
+    assíncrono. Aqui só a mensagem é resolvida (`args` podem mudar depois), e
+    `exc_info`/`stack_info` seguem intactos — a fila é do próprio processo.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
 
-        return f"{levelname}: {record.name}.py - {record.module}: {emoji} {record.getMessage()}"
+_ouvinte_logs: Optional[QueueListener] = None
+_formato_logs: Optional[str] = None
 
 
-def setup_logger():
+def _parar_ouvinte_logs() -> None:
+    global _ouvinte_logs
+    if _ouvinte_logs is not None:
+        _ouvinte_logs.stop()
+        _ouvinte_logs = None
+
+
+def setup_logger(assincrono: bool = True, formato: Optional[str] = None):
+    """
+    Configura o logger da pipeline.
+
+    Args:
+        assincrono (bool): Se True, os registros vão para uma fila e uma thread
+            (`QueueListener`) escreve no stdout — o log não bloqueia a pipeline.
+        formato (str, opcional): "cor" ou "json". Padrão: variável de ambiente
+            `AUTODUB_LOG_FORMATO` ou, na falta dela, "cor" em terminal e "json"
+            caso contrário (ex.: coletores de log).
+    """
+    global _ouvinte_logs, _formato_logs
+
     logging.captureWarnings(True)
+    formato = formato or os.environ.get("AUTODUB_LOG_FORMATO")
+    if formato is None:
+        formato = "cor" if sys.stdout.isatty() else "json"
+    _formato_logs = formato
+
     handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(ColorFormatter())
+    handler.setFormatter(JsonFormatter() if formato == "json" else ColorFormatter())
+
+    _parar_ouvinte_logs()
+    if assincrono:
+        fila: "queue.SimpleQueue" = queue.SimpleQueue()
+        _ouvinte_logs = QueueListener(fila, handler)
+        _ouvinte_logs.start()
+        handler = FilaDeLogs(fila)
 
     # Logger principal da pipeline
     logger = logging.getLogger("autodub.pipeline")
@@ -83,6 +207,15 @@ def setup_logger():
     return logger
 
 
+def _reiniciar_logs_no_filho() -> None:
+    # Processos criados por fork não herdam a thread do ouvinte
+    if _ouvinte_logs is not None:
+        setup_logger(formato=_formato_logs)
+
+
+atexit.register(_parar_ouvinte_logs)
+os.register_at_fork(after_in_child=_reiniciar_logs_no_filho)
+
 logger = setup_logger()
 
 
@@ -97,7 +230,50 @@ class Pipeline:
         embedding=None,
         vocoder=None,
         translator=None,
+        biblioteca_vozes=None,
+        filtro_segmentos=None,
+        ressegmentador=None,
+        preditor_duracao=None,
+        razao_maxima_esticamento: Optional[float] = None,
+        nucleos: Optional[int] = None,
+        trabalhadores: int = 1,
+        mux_por_pipe: bool = False,
+        diretorio_trabalho: Optional[Union[str, Path]] = None,
+        orcamento_disco: Optional[int] = None,
+        formato_intermediario: str = "wav",
     ) -> None:
+        """
+        Args:
+            filtro_segmentos (opcional): Etapa logo após o ASR que descarta segmentos
+                sem fala e colapsa repetições (ex.: `FiltroSegmentos`).
+            ressegmentador (opcional): Etapa entre ASR e tradução que une fragmentos
+                curtos e divide segmentos longos (ex.: `Ressegmentador`).
+            preditor_duracao (opcional): Prevê, antes do TTS, os segmentos cuja fala
+                não deve caber no trecho original (ex.: `PreditorDuracao`). Esses
+                segmentos passam por `translator.condensar` (ver `ITranslator`).
+            razao_maxima_esticamento (float, opcional): Se informado, a trilha é
+                montada em memória na linha do tempo original e cada fala maior
+                que seu trecho é comprimida (WSOLA) até essa razão (ex.: 1.25).
+                Sem ele, os segmentos são apenas concatenados pelo ffmpeg.
+            nucleos (int, opcional): Total de núcleos de CPU para este trabalho. Se
+                informado, limita as threads de torch/OpenMP/BLAS do processo e de
+                cada adapter (via `definir_threads`, quando existir).
+            trabalhadores (int): Quantos trabalhadores dividem `nucleos` (ex.: vários
+                processos da execução em lote, cada um com sua Pipeline).
+            mux_por_pipe (bool): Com linha do tempo (`razao_maxima_esticamento`) e
+                um ffmpeg com `mux_pcm`, a trilha vai direto para o mux pela
+                entrada padrão, sem `combined_audio.wav`. Execuções com debug
+                continuam em arquivo (a trilha é um artefato).
+            diretorio_trabalho (str | Path, opcional): Onde criar o diretório
+                temporário de cada execução (ex.: um tmpfs); padrão: o do sistema.
+            orcamento_disco (int, opcional): Bytes de intermediários permitidos.
+                Antes da extração, o uso é estimado pela duração da fonte (exige
+                `ffmpeg.duration`) e a execução falha se passar do orçamento ou
+                do espaço livre.
+            formato_intermediario (str): "wav" (PCM) ou "flac" (sem perdas, menos
+                bytes de I/O) para áudio extraído, falas e trilha; cada etapa lê
+                o formato pela extensão.
+        """
         if not all([asr, tts, ffmpeg]):
             raise ValueError("asr, tts e ffmpeg são obrigatórios para criar a Pipeline")
 
@@ -107,6 +283,117 @@ class Pipeline:
         self.vocoder = vocoder
         self.ffmpeg = ffmpeg
         self.translator = translator
+        self.biblioteca_vozes = biblioteca_vozes
+        self.filtro_segmentos = filtro_segmentos
+        self.ressegmentador = ressegmentador
+        self.preditor_duracao = preditor_duracao
+        self.razao_maxima_esticamento = razao_maxima_esticamento
+        self.mux_por_pipe = mux_por_pipe
+        self.diretorio_trabalho = Path(diretorio_trabalho) if diretorio_trabalho else None
+        self.orcamento_disco = orcamento_disco
+        validar_formato(formato_intermediario)
+        self.formato_intermediario = formato_intermediario
+        self._monitor_disco: Optional[MonitorDisco] = None
+        # Compartilhada pelas cópias de `executar_multilingue` (cópia rasa)
+        self._trava_tts = threading.Lock()
+        self.relatorio: Dict[str, Any] = {}
+        self.alocacao_threads: Optional[Dict[str, Any]] = None
+        if nucleos is not None:
+            self.alocacao_threads = self._aplicar_orcamento_threads(nucleos, trabalhadores)
+
+    def _aplicar_orcamento_threads(self, nucleos: int, trabalhadores: int) -> Dict[str, Any]:
+        """
+        Aplica o orçamento de threads no processo e em cada adapter.
+
+        As etapas de uma Pipeline rodam em sequência, então cada adapter recebe
+        todas as threads do seu trabalhador.
+        """
+        alocacao = calcular_alocacao(nucleos, trabalhadores)
+        threads = alocacao["threads_por_trabalhador"]
+        alocacao["processo"] = aplicar_threads(threads)
+        alocacao["adaptadores"] = {}
+
+        for nome in ("asr", "tts", "embedding", "vocoder", "translator"):
+            adaptador = getattr(self, nome)
+            if hasattr(adaptador, "definir_threads"):
+                adaptador.definir_threads(threads)
+                alocacao["adaptadores"][nome] = threads
+
+        logger.info(
+            f"Orçamento de threads: {alocacao['nucleos_totais']} núcleos, "
+            f"{alocacao['trabalhadores']} trabalhador(es), {threads} thread(s) cada"
+        )
+        return alocacao
+
+    def _filtrar_segmentos(self, segmentos: TabelaSegmentos) -> TabelaSegmentos:
+        """Descarta não-fala/alucinações e registra os itens ignorados no relatório."""
+        mantidos = self.filtro_segmentos.filtrar(segmentos)
+        ignorados = list(getattr(self.filtro_segmentos, "ultimos_ignorados", []))
+        self.relatorio["segmentos_ignorados"] = ignorados
+        logger.info(
+            f"Filtro de segmentos: {len(segmentos) - len(mantidos)} descartados, "
+            f"{len(mantidos)} mantidos"
+        )
+        return mantidos
+
+    def _ressegmentar(self, segmentos: TabelaSegmentos) -> TabelaSegmentos:
+        """Aplica o ressegmentador e registra as chamadas de modelo economizadas."""
+        novos = self.ressegmentador.ressegmentar(segmentos)
+        resumo = dict(getattr(self.ressegmentador, "ultimo_resumo", {}))
+        # Cada segmento custa uma síntese e, com tradutor, uma tradução
+        chamadas_por_segmento = 2 if self.translator else 1
+        resumo["chamadas_economizadas"] = (len(segmentos) - len(novos)) * chamadas_por_segmento
+        self.relatorio["ressegmentacao"] = resumo
+        logger.info(
+            f"Ressegmentação: {len(segmentos)} → {len(novos)} segmentos "
+            f"({resumo['chamadas_economizadas']} chamadas de modelo economizadas)"
+        )
+        return novos
+
+    def _prever_excesso(
+        self, segmentos: TabelaSegmentos, textos: List[str], target_lang: str
+    ) -> List[str]:
+        """
+        Sinaliza os segmentos que devem exceder o trecho original e, se o tradutor
+        souber condensar, pede uma versão mais curta antes de qualquer síntese.
+        """
+        preditor = self.preditor_duracao
+        duracoes = segmentos.duracao
+        previstas = preditor.prever(textos, target_lang)
+        excedentes = np.flatnonzero(preditor.sinalizar_excesso(textos, duracoes, target_lang))
+        condensar = getattr(self.translator, "condensar", None)
+
+        registros = []
+        for i in excedentes.tolist():
+            registro = {
+                "indice": i,
+                "duracao_trecho": float(duracoes[i]),
+                "duracao_prevista": float(previstas[i]),
+                "condensado": False,
+            }
+            if condensar is not None:
+                condensado = condensar(textos[i], target_lang, float(duracoes[i]))
+                if condensado != textos[i]:
+                    textos[i] = condensado
+                    registro["condensado"] = True
+            registros.append(registro)
+
+        condensados = [registro["indice"] for registro in registros if registro["condensado"]]
+        if condensados:
+            previstas = preditor.prever(textos, target_lang)
+            # Só os condensados mudam: traduções vazias continuam vazias na tabela
+            traduzidos = segmentos.textos("texto_traduzido")
+            for i in condensados:
+                traduzidos[i] = textos[i]
+            segmentos.definir_coluna_texto("texto_traduzido", traduzidos)
+        segmentos.definir_coluna_numerica("duracao_prevista", previstas)
+
+        self.relatorio["excesso_previsto"] = registros
+        logger.info(
+            f"Previsão de duração: {len(registros)} de {len(textos)} segmentos "
+            "devem exceder o trecho original"
+        )
+        return textos
 
     def _save_bytes(self, data: bytes, path: Union[str, Path]) -> None:
         """Salva bytes binários em disco."""
@@ -115,17 +402,35 @@ class Pipeline:
         with open(path, "wb") as f:
             f.write(data)
 
+    def _salvar_fala(self, dados: bytes, caminho: Path) -> Path:
+        """
+        Grava a saída do TTS no formato dos intermediários.
+
+        Se o formato exigir decodificar e os bytes não forem WAV PCM16 mono, a
+        fala é gravada como veio, com extensão .wav (que é o que ela declara ser).
+
+        Returns:
+            Path: Caminho efetivamente gravado.
+        """
+        try:
+            gravar_wav_bytes(caminho, dados)
+        except ValueError:
+            caminho = caminho.with_suffix(".wav")
+            self._save_bytes(dados, caminho)
+        return caminho
+
     def _concatenar_segmentos(self, arquivos: List[Path], destino: Path) -> None:
-        """Concatena arquivos WAV em um único áudio usando ffmpeg."""
+        """Concatena arquivos de áudio em um único áudio (formato de `destino`) com ffmpeg."""
         if not arquivos:
             from autodub.adapters.mocks.mock_tts import MockTTS
 
+            # MockTTS usa o gerador sintético vetorizado (WAV em cache)
             logger.warning("Nenhum segmento para combinar — criando áudio vazio.")
             empty_bytes = MockTTS(duration_seconds=0.1).sintetizar("")
-            self._save_bytes(empty_bytes, destino)
+            gravar_wav_bytes(destino, empty_bytes)
             return
 
-        if len(arquivos) == 1:
+        if len(arquivos) == 1 and arquivos[0].suffix == destino.suffix:
             shutil.copyfile(arquivos[0], destino)
             return
 
@@ -142,7 +447,7 @@ class Pipeline:
             "-ac",
             "1",
             "-c:a",
-            "pcm_s16le",
+            "flac" if destino.suffix == ".flac" else "pcm_s16le",
             str(destino),
         ]
 
@@ -158,113 +463,941 @@ class Pipeline:
             stderr = exc.stderr.decode() if exc.stderr else str(exc)
             raise RuntimeError(f"Falha ao concatenar segmentos com ffmpeg: {stderr}") from exc
 
+    def _posicionar_falas(
+        self, audios: Iterable[np.ndarray], segmentos: TabelaSegmentos, taxa: int
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Posiciona cada fala (int16) no `inicio` do seu segmento, na ordem.
+
+        Falas maiores que o trecho (`fim - inicio`) são comprimidas até
+        `razao_maxima_esticamento`; o que ainda sobrar empurra as falas seguintes.
+        Ao terminar, registra as contagens em `relatorio["esticamento"]`.
+
+        Yields:
+            Tuple[int, np.ndarray]: Posição na trilha e fala em float32.
+        """
+        inicios = np.round(segmentos.inicio * taxa).astype(np.int64)
+        trechos = np.round(segmentos.duracao * taxa).astype(np.int64)
+        cursor, esticados, deslocados = 0, 0, 0
+
+        for amostras, inicio, trecho in zip(audios, inicios.tolist(), trechos.tolist()):
+            fala = amostras.astype(np.float32) / 32768.0
+            if len(fala) > trecho > 0:
+                fala = ajustar_ao_trecho(fala, trecho, self.razao_maxima_esticamento)
+                esticados += 1
+            if cursor > inicio:
+                deslocados += 1
+            posicao = max(inicio, cursor)
+            yield posicao, fala
+            cursor = posicao + len(fala)
+
+        self.relatorio["esticamento"] = {
+            "razao_maxima": self.razao_maxima_esticamento,
+            "segmentos_esticados": esticados,
+            "segmentos_deslocados": deslocados,
+        }
+        logger.info(
+            f"Trilha montada em memória: {esticados} segmentos comprimidos, "
+            f"{deslocados} deslocados"
+        )
+
+    def _montar_trilha(
+        self,
+        arquivos: List[Path],
+        segmentos: TabelaSegmentos,
+        destino: Path,
+        descartar: bool = False,
+    ) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Monta a trilha dublada em memória (ver `_posicionar_falas`) e a grava.
+
+        Com `descartar`, as falas são apagadas do disco logo após a leitura.
+
+        Returns:
+            Tuple[int, List[Tuple[int, int]]]: Taxa de amostragem e, por segmento,
+            (posição, amostras) da fala na trilha.
+
+        Raises:
+            ValueError: Se algum segmento não for WAV PCM16 mono ou se as taxas de
+                amostragem forem diferentes.
+        """
+        audios = [ler_pcm16(arquivo) for arquivo in arquivos]
+        taxas = {taxa for _, taxa in audios}
+        if len(taxas) > 1:
+            raise ValueError(f"Segmentos com taxas de amostragem diferentes: {sorted(taxas)}")
+        taxa = taxas.pop() if taxas else 16000
+        if descartar:
+            self._descartar(arquivos)
+
+        posicionados = list(
+            self._posicionar_falas((amostras for amostras, _ in audios), segmentos, taxa)
+        )
+        cursor = posicionados[-1][0] + len(posicionados[-1][1]) if posicionados else 0
+        trilha = np.zeros(cursor, dtype=np.float32)
+        for posicao, fala in posicionados:
+            trilha[posicao : posicao + len(fala)] = fala
+        gravar_pcm16(destino, trilha, taxa)
+        return taxa, [(posicao, len(fala)) for posicao, fala in posicionados]
+
+    def _fluxo_trilha(
+        self, arquivos: List[Path], segmentos: TabelaSegmentos, descartar: bool = False
+    ) -> Tuple[int, Iterator[np.ndarray]]:
+        """
+        Trilha da linha do tempo em blocos int16, sem montá-la inteira.
+
+        Cada fala é lida só quando o bloco anterior já foi consumido, então a
+        montagem se sobrepõe a quem consome os blocos (ex.: o ffmpeg codificando).
+        Com `descartar`, cada fala é apagada do disco assim que é lida.
+
+        Returns:
+            Tuple[int, Iterator[np.ndarray]]: Taxa e gerador de blocos (silêncio
+            até cada fala, depois a fala).
+
+        Raises:
+            ValueError: Como `_montar_trilha` (verificado antes do primeiro bloco,
+                só pelos cabeçalhos).
+        """
+        taxas = {taxa_arquivo(arquivo) for arquivo in arquivos}
+        if len(taxas) > 1:
+            raise ValueError(f"Segmentos com taxas de amostragem diferentes: {sorted(taxas)}")
+        taxa = taxas.pop()
+
+        def ler(arquivo: Path) -> np.ndarray:
+            amostras = ler_pcm16(arquivo)[0]
+            if descartar:
+                self._descartar([arquivo])
+            return amostras
+
+        def blocos() -> Iterator[np.ndarray]:
+            audios = (ler(arquivo) for arquivo in arquivos)
+            escrito = 0
+            for posicao, fala in self._posicionar_falas(audios, segmentos, taxa):
+                if posicao > escrito:
+                    yield np.zeros(posicao - escrito, dtype=np.int16)
+                yield (np.clip(fala, -1.0, 1.0) * 32767.0).astype(np.int16)
+                escrito = posicao + len(fala)
+
+        return taxa, blocos()
+
+    def _combinar(
+        self,
+        arquivos: List[Path],
+        segmentos: TabelaSegmentos,
+        destino: Path,
+        descartar: bool = False,
+    ) -> Optional[Tuple[int, List[Tuple[int, int]]]]:
+        """
+        Combina as falas em `destino`: na linha do tempo (se configurado) ou por
+        concatenação. Devolve a colocação das falas quando há linha do tempo.
+
+        Com `descartar`, as falas são apagadas assim que a montagem as consome.
+        """
+        if self.razao_maxima_esticamento and arquivos:
+            try:
+                return self._montar_trilha(arquivos, segmentos, destino, descartar)
+            except ValueError as exc:
+                logger.warning(f"Falha ao montar trilha em memória ({exc}); usando ffmpeg")
+        self._concatenar_segmentos(arquivos, destino)
+        if descartar:
+            self._descartar(arquivos)
+        return None
+
+    def _descartar(self, arquivos: Iterable[Path]) -> None:
+        """Apaga intermediários já consumidos (ausentes são ignorados)."""
+        for arquivo in arquivos:
+            Path(arquivo).unlink(missing_ok=True)
+
+    def _medir_disco(self) -> None:
+        """Ponto de controle do pico de uso do diretório de trabalho."""
+        if self._monitor_disco is not None:
+            self._monitor_disco.medir()
+
+    def _preflight(self, video_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """
+        Inspeciona a entrada (`ffmpeg.probe`) e registra o plano no relatório.
+
+        Returns:
+            Dict | None: Plano de `planejar`; None se o ffmpeg não tiver `probe`.
+
+        Raises:
+            ValueError: Se a entrada não tiver fluxo de áudio.
+        """
+        if not hasattr(self.ffmpeg, "probe"):
+            return None
+        plano = planejar(self.ffmpeg.probe(str(video_path)), self.formato_intermediario)
+        self.relatorio["preflight"] = plano
+        duracao = f"{plano['duracao']:.1f}s" if plano["duracao"] is not None else "duração ?"
+        logger.info(
+            f"Preflight: {duracao}, fluxos {plano['fluxos']}, extração {plano['extracao']}"
+        )
+        return plano
+
+    def _criar_diretorio_trabalho(
+        self,
+        video_path: Union[str, Path],
+        idiomas: int = 1,
+        plano: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        Verifica o orçamento de disco (se houver) e cria o diretório temporário.
+
+        A duração vem do `plano` do preflight, ou de `ffmpeg.duration`.
+
+        A seção "disco" do relatório recebe o diretório, a estimativa e o pico
+        de uso, atualizado nos pontos de controle de cada etapa.
+
+        Raises:
+            RuntimeError: Se o uso estimado passar do orçamento ou do espaço livre.
+        """
+        raiz = self.diretorio_trabalho
+        if raiz is not None:
+            raiz.mkdir(parents=True, exist_ok=True)
+        disco: Dict[str, Any] = {"orcamento_bytes": self.orcamento_disco}
+
+        if self.orcamento_disco is not None:
+            if plano is not None:
+                duracao = plano["duracao"]
+            elif hasattr(self.ffmpeg, "duration"):
+                duracao = self.ffmpeg.duration(str(video_path))
+            else:
+                duracao = None
+            if duracao is None:
+                logger.warning(
+                    "Duração da fonte desconhecida — orçamento de disco não verificado"
+                )
+            else:
+                estimativa = estimar_uso_disco(duracao, idiomas=idiomas)
+                livre = shutil.disk_usage(raiz or tempfile.gettempdir()).free
+                disco.update(estimativa_bytes=estimativa, livre_bytes=livre)
+                if estimativa > min(self.orcamento_disco, livre):
+                    raise RuntimeError(
+                        f"Intermediários estimados em {estimativa / 1e6:.1f} MB para "
+                        f"{duracao:.0f}s de fonte; orçamento "
+                        f"{self.orcamento_disco / 1e6:.1f} MB, livre {livre / 1e6:.1f} MB"
+                    )
+
+        tmpdir = Path(tempfile.mkdtemp(prefix="autodub_pipeline_", dir=raiz))
+        logger.info(f"Criando diretório temporário em {tmpdir}")
+        disco["diretorio"] = str(tmpdir)
+        self.relatorio["disco"] = disco
+        self._monitor_disco = MonitorDisco(tmpdir, disco)
+        return tmpdir
+
+    def _mux_direto(
+        self,
+        video_path: Union[str, Path],
+        output_path: Path,
+        arquivos: List[Path],
+        segmentos: TabelaSegmentos,
+        target_lang: str,
+    ) -> bool:
+        """
+        Monta a trilha em blocos e a entrega ao `ffmpeg.mux_pcm`, sem WAV em disco.
+
+        Returns:
+            bool: False se o modo pipe não se aplica (desligado, sem linha do
+            tempo, ffmpeg sem `mux_pcm` ou segmentos incompatíveis); nesse caso
+            nada foi feito e o modo arquivo segue normalmente.
+        """
+        if not (
+            self.mux_por_pipe
+            and self.razao_maxima_esticamento
+            and arquivos
+            and hasattr(self.ffmpeg, "mux_pcm")
+        ):
+            return False
+        try:
+            taxa, blocos = self._fluxo_trilha(arquivos, segmentos, descartar=True)
+        except ValueError as exc:
+            logger.warning(f"Mux por pipe indisponível ({exc}); usando arquivo")
+            return False
+
+        logger.info(f"Realizando mux de áudio em vídeo por pipe → {output_path}")
+        self.ffmpeg.mux_pcm(str(video_path), blocos, taxa, str(output_path), target_lang)
+        self.relatorio["mux"] = "pipe"
+        return True
+
+    def _chaves_voz(self, embedding_vetor, segmentos: TabelaSegmentos) -> List[str]:
+        """
+        Identifica os parâmetros de voz de cada segmento (TTS, embedding, locutor).
+
+        Uma fala só precisa ser ressintetizada se o texto ou esta chave mudar.
+        """
+        base = hashlib.sha1(type(self.tts).__name__.encode())
+        if embedding_vetor is not None:
+            # Mesma conversão de `gravar_embedding` (o .npy é relido por `redublar`)
+            vetor = np.array(
+                list(embedding_vetor)
+                if isinstance(embedding_vetor, (set, frozenset))
+                else embedding_vetor,
+                dtype=np.float32,
+            )
+            base.update(vetor.tobytes())
+        chaves = []
+        for locutor in segmentos.locutor.tolist():
+            chave = base.copy()
+            chave.update(str(locutor).encode())
+            chaves.append(chave.hexdigest()[:16])
+        return chaves
+
+    def _salvar_artefatos_sintese(
+        self,
+        escritor: EscritorArtefatos,
+        segmentos: TabelaSegmentos,
+        textos: Sequence[str],
+        arquivos: List[Path],
+        trilha: Path,
+        vozes: Sequence[str],
+        target_lang: str,
+        colocacao: Optional[Tuple[int, List[Tuple[int, int]]]],
+        prefixo: str = "",
+    ) -> None:
+        """
+        Guarda as falas, a trilha e o manifesto usados pela redublagem incremental.
+
+        Os caminhos do manifesto são relativos ao diretório do próprio manifesto.
+        """
+        taxa, posicoes = colocacao if colocacao else (None, [(None, None)] * len(arquivos))
+        itens = []
+        for i, (arquivo, texto, voz, (posicao, amostras)) in enumerate(
+            zip(arquivos, textos, vozes, posicoes)
+        ):
+            nome = f"segmentos/segment_{i:05d}{arquivo.suffix}"
+            escritor.vincular_audio(prefixo + nome, arquivo)
+            itens.append(
+                {
+                    "indice": i,
+                    "inicio": float(segmentos.inicio[i]),
+                    "fim": float(segmentos.fim[i]),
+                    "texto": texto,
+                    "voz": voz,
+                    "arquivo": nome,
+                    "posicao": posicao,
+                    "amostras": amostras,
+                }
+            )
+        if trilha.exists():
+            escritor.vincular_audio(
+                prefixo + com_formato(ARQUIVO_TRILHA, self.formato_intermediario), trilha
+            )
+        escritor.gravar_json(
+            prefixo + ARQUIVO_MANIFESTO,
+            {
+                "idioma": target_lang,
+                "formato": self.formato_intermediario,
+                "linha_do_tempo": colocacao is not None,
+                "taxa": taxa,
+                "segmentos": itens,
+            },
+        )
+
+    def _obter_embedding(self, extracted_audio: Path, locutor: Optional[str]):
+        """
+        Obtém o embedding do locutor, reaproveitando a biblioteca de vozes quando possível.
+
+        - Se `locutor` já estiver na biblioteca, a extração é pulada.
+        - Caso contrário, extrai o embedding e procura uma voz conhecida parecida;
+          havendo correspondência, usa o embedding da biblioteca (voz consistente
+          entre episódios).
+        - Sem correspondência e com `locutor` informado, cadastra a nova voz.
+        """
+        biblioteca = self.biblioteca_vozes
+
+        if biblioteca is not None and locutor and locutor in biblioteca:
+            logger.info(f"Reutilizando voz '{locutor}' da biblioteca de vozes")
+            return biblioteca.obter(locutor)
+
+        if not self.embedding:
+            return None
+
+        logger.info(f"Extraindo embedding do locutor de {extracted_audio}")
+        embedding_vetor = self.embedding.extrair(str(extracted_audio))
+
+        if biblioteca is None:
+            return embedding_vetor
+
+        vetor = np.asarray(list(embedding_vetor), dtype=np.float32)
+        correspondencia = biblioteca.buscar(vetor)[0]
+        if correspondencia is not None:
+            nome, similaridade = correspondencia
+            logger.info(
+                f"Voz correspondente na biblioteca de vozes: '{nome}' "
+                f"(similaridade {similaridade:.3f})"
+            )
+            return biblioteca.obter(nome)
+
+        if locutor:
+            biblioteca.adicionar(locutor, vetor)
+            biblioteca.salvar()
+            logger.info(f"Voz '{locutor}' cadastrada na biblioteca de vozes")
+
+        return embedding_vetor
+
+    def _etapas_compartilhadas(
+        self,
+        video_path: Union[str, Path],
+        tmpdir: Path,
+        escritor: Optional[EscritorArtefatos],
+        locutor: Optional[str],
+        plano: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, TabelaSegmentos]:
+        """
+        Extração, embedding e transcrição (com filtro e ressegmentação).
+
+        Se o `plano` do preflight indicar extração direta, a entrada já está no
+        formato dos intermediários e é só vinculada (ou copiada), sem ffmpeg.
+        """
+        # 1) Extração de áudio
+        extracted_audio = tmpdir / com_formato(
+            "extracted_audio.wav", self.formato_intermediario
+        )
+        if plano is not None and plano["extracao"] == "direta":
+            plano["extracao_realizada"] = vincular_ou_copiar(video_path, extracted_audio)
+            logger.info(
+                f"Áudio extraído sem recodificar ({plano['extracao_realizada']}): "
+                f"{video_path} → {extracted_audio}"
+            )
+        else:
+            logger.info(f"Extraindo áudio de {video_path} → {extracted_audio}")
+            self.ffmpeg.extract_audio(str(video_path), extracted_audio)
+
+        if escritor:
+            escritor.vincular_audio(
+                com_formato("audio_extraido.wav", self.formato_intermediario), extracted_audio
+            )
+
+        # 2) Embedding
+        embedding_vetor = self._obter_embedding(extracted_audio, locutor)
+        if embedding_vetor is not None:
+            logger.info(f"Embedding extraído: {len(embedding_vetor)} dimensões")
+            if escritor:
+                escritor.gravar_embedding("embedding.npy", embedding_vetor)
+
+        # 3) Transcrição
+        logger.info(f"Transcrevendo áudio {extracted_audio}")
+        segmentos = TabelaSegmentos.de_segmentos(self.asr.transcrever(str(extracted_audio)))
+        self._medir_disco()
+        if not escritor:
+            # Sem debug, o áudio extraído não é mais lido
+            self._descartar([extracted_audio])
+
+        logger.info(f"Obtidos {len(segmentos)} segmentos")
+        if escritor:
+            escritor.gravar_segmentos("transcricao.jsonl", segmentos)
+
+        if self.filtro_segmentos:
+            segmentos = self._filtrar_segmentos(segmentos)
+
+        if self.ressegmentador:
+            segmentos = self._ressegmentar(segmentos)
+
+        return embedding_vetor, segmentos
+
+    def _dublar_idioma(
+        self,
+        video_path: Union[str, Path],
+        output_path: Path,
+        segmentos: TabelaSegmentos,
+        embedding_vetor,
+        target_lang: str,
+        tmpdir: Path,
+        escritor: Optional[EscritorArtefatos],
+        prefixo: str = "",
+        mux: bool = True,
+    ) -> Path:
+        """
+        Tradução, síntese, montagem da trilha e (se `mux`) mux de um idioma.
+
+        Args:
+            prefixo (str): Prefixo dos artefatos de debug deste idioma (ex.: "es/").
+
+        Returns:
+            Path: Trilha dublada (`combined_audio.wav` em `tmpdir`; não existe se
+            o mux foi feito por pipe).
+        """
+        combined_audio = tmpdir / com_formato("combined_audio.wav", self.formato_intermediario)
+
+        # 4) Tradução
+        if self.translator:
+            logger.info(f"Traduzindo segmentos para {target_lang}")
+            segmentos.definir_coluna_texto(
+                "texto_traduzido",
+                [
+                    self.translator.traduzir(texto or "", target_lang)
+                    for texto in segmentos.textos("texto")
+                ],
+            )
+
+            if escritor:
+                escritor.gravar_segmentos(f"{prefixo}transcricao_traduzida.jsonl", segmentos)
+        else:
+            logger.info("Nenhum tradutor configurado — etapa ignorada.")
+
+        # 5) Síntese
+        segment_files: List[Path] = []
+        textos_sintese = [
+            traduzido or original or ""
+            for traduzido, original in zip(
+                segmentos.textos("texto_traduzido"), segmentos.textos("texto")
+            )
+        ]
+        if self.preditor_duracao:
+            textos_sintese = self._prever_excesso(segmentos, textos_sintese, target_lang)
+
+        progresso = RelatorProgresso(logger, "Sintetizando", total=len(textos_sintese))
+        for idx, texto in enumerate(textos_sintese):
+            logger.debug("Sintetizando segmento %d: %s", idx, texto)
+            audio_bytes = self._sintetizar(texto)
+            seg_file = tmpdir / com_formato(f"segment_{idx}.wav", self.formato_intermediario)
+            segment_files.append(self._salvar_fala(audio_bytes, seg_file))
+            if self.preditor_duracao:
+                self.preditor_duracao.registrar_wav(texto, target_lang, audio_bytes)
+            progresso.avancar()
+        progresso.concluir()
+        if self.preditor_duracao:
+            self.preditor_duracao.salvar()
+        self._medir_disco()
+
+        # 6 e 7) Trilha direto para o mux, se possível
+        if (
+            mux
+            and not escritor
+            and self._mux_direto(video_path, output_path, segment_files, segmentos, target_lang)
+        ):
+            return combined_audio
+
+        # 6) Concatenação (sem debug, as falas são apagadas assim que consumidas)
+        logger.info(f"Combinando {len(segment_files)} segmentos em {combined_audio}")
+        colocacao = self._combinar(
+            segment_files, segmentos, combined_audio, descartar=not escritor
+        )
+        self._medir_disco()
+
+        # 7) Mux final
+        if mux:
+            logger.info(f"Realizando mux de áudio em vídeo → {output_path}")
+            self.ffmpeg.mux_audio(str(video_path), combined_audio, str(output_path))
+            self.relatorio["mux"] = "arquivo"
+
+        if escritor:
+            if prefixo and embedding_vetor is not None:
+                # Cada idioma tem seus artefatos completos (`redublar` usa o embedding)
+                escritor.gravar_embedding(f"{prefixo}embedding.npy", embedding_vetor)
+            self._salvar_artefatos_sintese(
+                escritor,
+                segmentos,
+                textos_sintese,
+                segment_files,
+                combined_audio,
+                self._chaves_voz(embedding_vetor, segmentos),
+                target_lang,
+                colocacao,
+                prefixo,
+            )
+        return combined_audio
+
     def executar(
         self,
         video_path: Union[str, Path],
         output_path: Union[str, Path],
         target_lang: str = "pt-br",
         debug: bool = False,
+        locutor: Optional[str] = None,
     ) -> Path:
         """
         Executa o fluxo ponta a ponta da dublagem:
-        1) Extrai áudio
-        2) Extrai embedding
-        3) Transcreve
+        0) Preflight (se o ffmpeg tiver `probe`): rejeita entradas sem áudio e
+           registra o plano no relatório
+        1) Extrai áudio (ou vincula a entrada, se já estiver no formato)
+        2) Extrai embedding (ou reutiliza a voz `locutor` da biblioteca de vozes)
+        3) Transcreve (depois filtra e ressegmenta, se configurado)
         4) Traduz
         5) Sintetiza
-        6) Concatena
+        6) Concatena (ou monta a trilha na linha do tempo, comprimindo falas longas)
         7) Faz o mux final
         """
         output_path = Path(output_path)
-        tmpdir = Path(tempfile.mkdtemp(prefix="autodub_pipeline_"))
-        logger.info(f"Criando diretório temporário em {tmpdir}")
+        self.relatorio = {"video": str(video_path), "idioma": target_lang}
+        if self.alocacao_threads is not None:
+            self.relatorio["threads"] = self.alocacao_threads
+
+        plano = self._preflight(video_path)
+        tmpdir = self._criar_diretorio_trabalho(video_path, plano=plano)
+        # Artefatos de debug são gravados em segundo plano, fora do caminho crítico
+        escritor = EscritorArtefatos(output_path.parent) if debug else None
 
         try:
-            combined_audio = tmpdir / "combined_audio.wav"
+            embedding_vetor, segmentos = self._etapas_compartilhadas(
+                video_path, tmpdir, escritor, locutor, plano
+            )
+            self._dublar_idioma(
+                video_path,
+                output_path,
+                segmentos,
+                embedding_vetor,
+                target_lang,
+                tmpdir,
+                escritor,
+            )
 
-            # 1) Extração de áudio
-            extracted_audio = tmpdir / "extracted_audio.wav"
-            logger.info(f"Extraindo áudio de {video_path} → {extracted_audio}")
-            self.ffmpeg.extract_audio(str(video_path), extracted_audio)
+            if escritor:
+                escritor.gravar_json("relatorio_execucao.json", self.relatorio)
 
-            if debug:
-                debug_audio_copy = output_path.parent / "audio_extraido.wav"
-                shutil.copyfile(extracted_audio, debug_audio_copy)
-                logger.info(f"Áudio extraído salvo para debug em {debug_audio_copy}")
-
-            # 2) Embedding
-            if self.embedding:
-                logger.info(f"Extraindo embedding do locutor de {extracted_audio}")
-                embedding_vetor = self.embedding.extrair(str(extracted_audio))
-                emb_list = (
-                    embedding_vetor.tolist()
-                    if hasattr(embedding_vetor, "tolist")
-                    else list(embedding_vetor)
-                )
-                logger.info(f"Embedding extraído: {len(emb_list)} dimensões")
-                if debug:
-                    emb_path = output_path.parent / "embedding.json"
-                    with open(emb_path, "w", encoding="utf-8") as f:
-                        json.dump(emb_list, f, ensure_ascii=False)
-                    logger.info(f"Embedding salvo para debug em {emb_path}")
-
-            # 3) Transcrição
-            logger.info(f"Transcrevendo áudio {extracted_audio}")
-            segmentos: List[Dict] = self.asr.transcrever(str(extracted_audio))
-
-            if debug:
-                transcript_file = output_path.parent / "transcricao.jsonl"
-                with open(transcript_file, "w", encoding="utf-8") as tf:
-                    for seg in segmentos:
-                        tf.write(json.dumps(seg, ensure_ascii=False) + "\n")
-                logger.info(
-                    f"Obtidos {len(segmentos)} segmentos "
-                    f"(transcrição salva em {transcript_file})"
+            logger.info(f"Execução concluída ✅ Saída final em: {output_path}")
+            return output_path
+
+        except Exception as exc:
+            logger.error(f"Erro durante execução: {exc}")
+            raise
+
+        finally:
+            self._finalizar(escritor, output_path.parent, tmpdir)
+
+    def _finalizar(
+        self, escritor: Optional[EscritorArtefatos], diretorio: Path, tmpdir: Path
+    ) -> None:
+        # O escritor precisa terminar antes da limpeza (o áudio pode ser copiado do tmpdir)
+        if escritor:
+            for nome, erro in escritor.encerrar():
+                logger.warning(f"Falha ao gravar artefato de debug {nome}: {erro}")
+            logger.info(f"Artefatos de debug salvos em {diretorio}")
+        self._monitor_disco = None
+        try:
+            shutil.rmtree(tmpdir)
+        except Exception as cleanup_err:
+            logger.warning(f"Falha ao limpar temporários {tmpdir}: {cleanup_err}")
+
+    def _sintetizar(self, texto: str) -> bytes:
+        """
+        Chama o TTS, uma síntese por vez.
+
+        Modelos torch/Coqui não garantem uso concorrente da mesma instância, e
+        os idiomas de `executar_multilingue` compartilham o adapter. Um TTS com
+        `seguro_para_threads = True` dispensa a trava.
+        """
+        if getattr(self.tts, "seguro_para_threads", False):
+            return self.tts.sintetizar(texto)
+        with self._trava_tts:
+            return self.tts.sintetizar(texto)
+
+    def _paralelismo_idiomas(self, idiomas: int) -> Dict[str, Any]:
+        """
+        Quantos idiomas dublar ao mesmo tempo.
+
+        Com orçamento de núcleos, no máximo um idioma por thread do trabalhador;
+        sem ele, um por núcleo. As threads de torch/BLAS do processo não mudam:
+        salvo com `tts.seguro_para_threads`, as sínteses são serializadas e cada
+        uma usa todas as threads do trabalhador, enquanto tradução, montagem e
+        mux dos outros idiomas se sobrepõem a ela.
+        """
+        nucleos = (
+            self.alocacao_threads["threads_por_trabalhador"]
+            if self.alocacao_threads is not None
+            else None
+        )
+        return {
+            "idiomas_simultaneos": calcular_alocacao(nucleos, idiomas)["trabalhadores"],
+            "tts": (
+                "paralelo" if getattr(self.tts, "seguro_para_threads", False) else "serializado"
+            ),
+        }
+
+    def executar_multilingue(
+        self,
+        video_path: Union[str, Path],
+        idiomas: Sequence[str],
+        output_path: Union[str, Path],
+        debug: bool = False,
+        locutor: Optional[str] = None,
+        faixa_unica: bool = False,
+    ) -> Dict[str, Path]:
+        """
+        Dubla o vídeo em vários idiomas com uma única extração, embedding e ASR.
+
+        As etapas compartilhadas (1–3 de `executar`) rodam uma vez; tradução,
+        síntese e montagem (4–6) rodam por idioma, em paralelo, dentro do
+        orçamento de núcleos. As chamadas ao TTS compartilhado são serializadas
+        (ver `_sintetizar`).
+
+        Args:
+            idiomas: Idiomas de destino (ex.: ["es", "en", "fr"]).
+            output_path: Sem `faixa_unica`, cada idioma sai em
+                `<nome>.<idioma><extensão>` ao lado dele (ex.: `out.es.mp4`).
+            faixa_unica (bool): Um único contêiner em `output_path`, com uma
+                faixa de áudio por idioma (exige `ffmpeg.mux_faixas`).
+
+        Returns:
+            Dict[str, Path]: Saída de cada idioma.
+
+        Raises:
+            ValueError: Se `idiomas` estiver vazio, repetido, ou se `faixa_unica`
+                for pedido sem suporte no ffmpeg.
+        """
+        idiomas = list(idiomas)
+        if not idiomas or len(set(idiomas)) != len(idiomas):
+            raise ValueError("idiomas deve ter ao menos um idioma, sem repetições.")
+        if faixa_unica and not hasattr(self.ffmpeg, "mux_faixas"):
+            raise ValueError("faixa_unica exige um ffmpeg com mux_faixas.")
+
+        output_path = Path(output_path)
+        saidas = {
+            idioma: output_path
+            if faixa_unica
+            else output_path.with_name(f"{output_path.stem}.{idioma}{output_path.suffix}")
+            for idioma in idiomas
+        }
+        paralelismo = self._paralelismo_idiomas(len(idiomas))
+        self.relatorio = {
+            "video": str(video_path),
+            "idiomas": {},
+            "paralelismo": paralelismo,
+        }
+        if self.alocacao_threads is not None:
+            self.relatorio["threads"] = self.alocacao_threads
+
+        plano = self._preflight(video_path)
+        tmpdir = self._criar_diretorio_trabalho(video_path, len(idiomas), plano)
+        escritor = EscritorArtefatos(output_path.parent) if debug else None
+
+        def dublar(idioma: str) -> Tuple[Dict[str, Any], Path]:
+            # Cópia rasa: mesmos adapters, relatório próprio por idioma
+            pipeline_idioma = copy.copy(self)
+            pipeline_idioma.relatorio = {"idioma": idioma}
+            diretorio = tmpdir / idioma
+            diretorio.mkdir()
+            trilha = pipeline_idioma._dublar_idioma(
+                video_path,
+                saidas[idioma],
+                segmentos.copia(),
+                embedding_vetor,
+                idioma,
+                diretorio,
+                escritor,
+                prefixo=f"{idioma}/",
+                mux=not faixa_unica,
+            )
+            return pipeline_idioma.relatorio, trilha
+
+        try:
+            embedding_vetor, segmentos = self._etapas_compartilhadas(
+                video_path, tmpdir, escritor, locutor, plano
+            )
+
+            logger.info(
+                f"Dublando {len(idiomas)} idiomas, "
+                f"{paralelismo['idiomas_simultaneos']} por vez"
+            )
+            with ThreadPoolExecutor(paralelismo["idiomas_simultaneos"]) as executor:
+                resultados = dict(zip(idiomas, executor.map(dublar, idiomas)))
+
+            for idioma, (relatorio_idioma, _) in resultados.items():
+                self.relatorio["idiomas"][idioma] = relatorio_idioma
+
+            if faixa_unica:
+                logger.info(f"Realizando mux de {len(idiomas)} faixas em vídeo → {output_path}")
+                self.ffmpeg.mux_faixas(
+                    str(video_path),
+                    [(idioma, trilha) for idioma, (_, trilha) in resultados.items()],
+                    str(output_path),
                 )
 
-            # 4) Tradução
-            if self.translator:
-                logger.info(f"Traduzindo segmentos para {target_lang}")
-                for seg in segmentos:
-                    seg_text = seg.get("texto", "")
-                    seg["texto_traduzido"] = self.translator.traduzir(seg_text, target_lang)
-
-                if debug:
-                    trad_path = output_path.parent / "transcricao_traduzida.jsonl"
-                    with open(trad_path, "w", encoding="utf-8") as tf:
-                        for seg in segmentos:
-                            tf.write(json.dumps(seg, ensure_ascii=False) + "\n")
-                    logger.info(f"Tradução salva em {trad_path}")
-            else:
-                logger.info("Nenhum tradutor configurado — etapa ignorada.")
-
-            # 5) Síntese
-            segment_files: List[Path] = []
-            for idx, seg in enumerate(segmentos):
-                texto = seg.get("texto_traduzido") or seg.get("texto", "")
-                logger.info(f"Sintetizando segmento {idx}: {texto}")
-                audio_bytes = self.tts.sintetizar(texto)
-                seg_file = tmpdir / f"segment_{idx}.wav"
-                self._save_bytes(audio_bytes, seg_file)
-                segment_files.append(seg_file)
-
-            # 6) Concatenação
-            logger.info(f"Combinando {len(segment_files)} segmentos em {combined_audio}")
-            self._concatenar_segmentos(segment_files, combined_audio)
-
-            # 7) Mux final
-            logger.info(f"Realizando mux de áudio em vídeo → {output_path}")
-            self.ffmpeg.mux_audio(str(video_path), combined_audio, str(output_path))
+            if escritor:
+                escritor.gravar_json("relatorio_execucao.json", self.relatorio)
 
-            logger.info(f"Execução concluída ✅ Saída final em: {output_path}")
-            return output_path
+            logger.info(f"Execução concluída ✅ Saídas finais: {sorted(set(saidas.values()))}")
+            return saidas
 
         except Exception as exc:
             logger.error(f"Erro durante execução: {exc}")
             raise
 
         finally:
-            try:
-                shutil.rmtree(tmpdir)
-            except Exception as cleanup_err:
-                logger.warning(f"Falha ao limpar temporários {tmpdir}: {cleanup_err}")
+            self._finalizar(escritor, output_path.parent, tmpdir)
+
+    def _remendar_trilha(
+        self,
+        trilha: Path,
+        segmentos: TabelaSegmentos,
+        itens: List[Dict[str, Any]],
+        indices: Sequence[int],
+        taxa: int,
+        diretorio: Path,
+    ) -> None:
+        """
+        Substitui, direto no arquivo (memmap), as falas dos segmentos `indices`.
+
+        Cada nova fala é comprimida como em `_montar_trilha` e precisa caber antes
+        da fala seguinte.
+
+        Raises:
+            ValueError: Se a trilha não for WAV PCM16 mono na taxa esperada (ex.:
+                trilha em FLAC) ou se uma fala não couber no espaço disponível.
+        """
+        deslocamento, tamanho, taxa_trilha = localizar_dados_wav(trilha)
+        if taxa_trilha != taxa:
+            raise ValueError(f"Trilha em {taxa_trilha} Hz; manifesto diz {taxa} Hz.")
+        amostras = np.memmap(
+            trilha, dtype="<i2", mode="r+", offset=deslocamento, shape=(tamanho // 2,)
+        )
+        try:
+            novas = {}
+            for i in indices:
+                fala_pcm, taxa_fala = ler_pcm16(diretorio / itens[i]["arquivo"])
+                if taxa_fala != taxa:
+                    raise ValueError(f"Segmento {i} em {taxa_fala} Hz; trilha em {taxa} Hz.")
+                fala = fala_pcm.astype(np.float32) / 32768.0
+                trecho = int(round(float(segmentos.duracao[i]) * taxa))
+                if len(fala) > trecho > 0:
+                    fala = ajustar_ao_trecho(fala, trecho, self.razao_maxima_esticamento)
+                posicao = itens[i]["posicao"]
+                limite = itens[i + 1]["posicao"] if i + 1 < len(itens) else len(amostras)
+                if posicao + len(fala) > limite:
+                    raise ValueError(f"A nova fala do segmento {i} não cabe na trilha.")
+                novas[i] = fala
+
+            # Só altera o arquivo depois de validar todas as falas
+            for i, fala in novas.items():
+                posicao = itens[i]["posicao"]
+                amostras[posicao : posicao + itens[i]["amostras"]] = 0
+                amostras[posicao : posicao + len(fala)] = (
+                    np.clip(fala, -1.0, 1.0) * 32767
+                ).astype(np.int16)
+                itens[i]["amostras"] = len(fala)
+            amostras.flush()
+        finally:
+            del amostras
+
+    def redublar(
+        self,
+        video_path: Union[str, Path],
+        output_path: Union[str, Path],
+        traducao_editada: Union[str, Path],
+        artefatos: Optional[Union[str, Path]] = None,
+    ) -> Path:
+        """
+        Redublagem incremental a partir de uma tradução revisada.
+
+        Usa os artefatos de uma execução anterior com `debug=True` (manifesto,
+        falas, trilha e embedding) e refaz só o necessário, sem ASR:
+        1) Compara a tradução editada com o manifesto (texto e chave de voz)
+        2) Ressintetiza apenas os segmentos alterados
+        3) Remenda a trilha no próprio arquivo; se os tempos mudaram ou a fala
+           não cabe, remonta a trilha a partir das falas já salvas
+        4) Refaz o mux
+
+        Args:
+            video_path: Vídeo original.
+            output_path: Vídeo dublado de saída.
+            traducao_editada: `transcricao_traduzida.jsonl` revisado.
+            artefatos (opcional): Diretório dos artefatos (padrão: pasta de `output_path`).
+
+        Raises:
+            ValueError: Se não houver manifesto de uma execução anterior.
+        """
+        output_path = Path(output_path)
+        diretorio = Path(artefatos) if artefatos else output_path.parent
+        caminho_manifesto = diretorio / ARQUIVO_MANIFESTO
+        if not caminho_manifesto.exists():
+            raise ValueError(
+                f"{caminho_manifesto} não existe; execute a pipeline com debug=True antes."
+            )
+        manifesto = json.loads(caminho_manifesto.read_text(encoding="utf-8"))
+        anteriores = manifesto["segmentos"]
+        target_lang = manifesto["idioma"]
+        formato = manifesto.get("formato", "wav")
+        self.relatorio = {"video": str(video_path), "idioma": target_lang}
+
+        segmentos = TabelaSegmentos.carregar_jsonl(traducao_editada)
+        textos = [
+            traduzido or original or ""
+            for traduzido, original in zip(
+                segmentos.textos("texto_traduzido"), segmentos.textos("texto")
+            )
+        ]
+        caminho_embedding = diretorio / "embedding.npy"
+        embedding_vetor = np.load(caminho_embedding) if caminho_embedding.exists() else None
+        vozes = self._chaves_voz(embedding_vetor, segmentos)
+
+        mesmos_tempos = len(segmentos) == len(anteriores) and bool(
+            np.allclose(segmentos.inicio, [item["inicio"] for item in anteriores])
+            and np.allclose(segmentos.fim, [item["fim"] for item in anteriores])
+        )
+        alterados = [
+            i
+            for i in range(len(segmentos))
+            if i >= len(anteriores)
+            or anteriores[i]["texto"] != textos[i]
+            or anteriores[i]["voz"] != vozes[i]
+        ]
+        logger.info(f"Redublagem: {len(alterados)} de {len(segmentos)} segmentos alterados")
+
+        itens = [
+            {
+                "indice": i,
+                "inicio": float(segmentos.inicio[i]),
+                "fim": float(segmentos.fim[i]),
+                "texto": textos[i],
+                "voz": vozes[i],
+                "arquivo": (
+                    anteriores[i]["arquivo"]
+                    if i < len(anteriores)
+                    else com_formato(f"segmentos/segment_{i:05d}.wav", formato)
+                ),
+                "posicao": anteriores[i]["posicao"] if mesmos_tempos else None,
+                "amostras": anteriores[i]["amostras"] if mesmos_tempos else None,
+            }
+            for i in range(len(segmentos))
+        ]
+        progresso = RelatorProgresso(logger, "Sintetizando", total=len(alterados))
+        for i in alterados:
+            logger.debug("Sintetizando segmento %d: %s", i, textos[i])
+            arquivo = self._salvar_fala(
+                self._sintetizar(textos[i]), diretorio / itens[i]["arquivo"]
+            )
+            itens[i]["arquivo"] = arquivo.relative_to(diretorio).as_posix()
+            progresso.avancar()
+        progresso.concluir()
+
+        trilha = diretorio / com_formato(ARQUIVO_TRILHA, formato)
+        colocacao = None
+        modo = "inalterada"
+        if alterados or not trilha.exists():
+            modo = "remontada"
+            if (
+                mesmos_tempos
+                and manifesto["linha_do_tempo"]
+                and self.razao_maxima_esticamento
+                and trilha.exists()
+            ):
+                try:
+                    self._remendar_trilha(
+                        trilha, segmentos, itens, alterados, manifesto["taxa"], diretorio
+                    )
+                    modo = "remendada"
+                except ValueError as exc:
+                    logger.warning(f"Não foi possível remendar a trilha ({exc}); remontando")
+            if modo == "remontada":
+                arquivos = [diretorio / item["arquivo"] for item in itens]
+                colocacao = self._combinar(arquivos, segmentos, trilha)
+                posicoes = colocacao[1] if colocacao else [(None, None)] * len(itens)
+                for item, (posicao, amostras) in zip(itens, posicoes):
+                    item["posicao"], item["amostras"] = posicao, amostras
+
+        logger.info(f"Realizando mux de áudio em vídeo → {output_path}")
+        self.ffmpeg.mux_audio(str(video_path), trilha, str(output_path))
+
+        if modo == "remontada":
+            manifesto["linha_do_tempo"] = colocacao is not None
+            manifesto["taxa"] = colocacao[0] if colocacao else None
+        manifesto["segmentos"] = itens
+        temporario = caminho_manifesto.with_suffix(".tmp")
+        temporario.write_text(json.dumps(manifesto, ensure_ascii=False, indent=2), "utf-8")
+        os.replace(temporario, caminho_manifesto)
+
+        self.relatorio["redublagem"] = {
+            "segmentos": len(segmentos),
+            "ressintetizados": len(alterados),
+            "trilha": modo,
+        }
+        logger.info(f"Execução concluída ✅ Saída final em: {output_path}")
+        return output_path
@@ -5,34 +5,51 @@ e os demais componentes ainda mockados.
 
 Execute com:
     poetry run python -m autodub.pipeline_manual tests/samples/video_teste.mp4
+
+Com um servidor de modelos já em execução (`python -m autodub.model_server`),
+os modelos não são recarregados a cada execução:
+    poetry run python -m autodub.pipeline_manual video.mp4 \
+        --servidor-modelos /tmp/autodub_modelos.sock
+
+Vários vídeos podem ser processados em lote, dividindo os núcleos da máquina
+entre processos trabalhadores (cada um com sua própria Pipeline):
+    poetry run python -m autodub.pipeline_manual a.mp4 b.mp4 --nucleos 8 --trabalhadores 2
+
+Vários idiomas de uma vez (extração, ASR e embedding feitos uma única vez):
+    poetry run python -m autodub.pipeline_manual video.mp4 --idiomas es en fr
+
+Com ffmpeg instalado, cada entrada passa antes por um preflight (ffprobe):
+entradas sem áudio são rejeitadas antes de carregar os modelos e, sem
+`--trabalhadores`, a divisão dos núcleos do lote é escolhida pelas durações.
 """
 
+import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from shutil import which
+from typing import Any, Dict, List, Optional, Sequence
 
-from autodub.adapters.embedding_extractor_adapter import ResemblyzerEmbedding
 from autodub.adapters.mocks.ffmpeg_wrapper import FakeFFmpegWrapper
 from autodub.adapters.mocks.mock_translator import MockTranslator
 from autodub.adapters.mocks.mock_tts import MockTTS
 from autodub.adapters.mocks.mock_vocoder import MockVocoder
-from autodub.adapters.whisper_asr_adapter import WhisperAsr
 from autodub.pipeline import Pipeline
+from autodub.utils.preflight import planejar, sugerir_paralelismo
+from autodub.utils.thread_budget import calcular_alocacao, inicializar_trabalhador
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Uso: poetry run python -m autodub.pipeline_manual tests/samples/video_teste.mp4")
-        sys.exit(1)
-
-    video_entrada = Path(sys.argv[1])
-
-    if not video_entrada.exists():
-        print(f"❌ Erro: arquivo de entrada não encontrado: {video_entrada}")
-        sys.exit(1)
-
-    video_saida = video_entrada.with_stem(f"{video_entrada.stem}_dublado")
+def criar_pipeline(
+    nucleos: Optional[int] = None,
+    trabalhadores: int = 1,
+    servidor_modelos: Optional[str] = None,
+) -> Pipeline:
+    """
+    Monta a pipeline manual (Whisper + Resemblyzer reais, demais mockados).
 
+    Com `servidor_modelos`, ASR e embedding são atendidos pelo servidor local
+    de modelos, sem carregar pesos neste processo.
+    """
     # Detecta ffmpeg
     if which("ffmpeg"):
         from autodub.adapters.real_ffmpeg_wrapper_adapter import (
@@ -45,19 +62,173 @@ def main():
         ffmpeg_adapter = FakeFFmpegWrapper()
         print("⚠️  ffmpeg não encontrado — usando FakeFFmpegWrapper (modo simulado)")
 
-    # Monta pipeline completa
-    pipeline = Pipeline(
-        asr=WhisperAsr(model_name="base"),
+    if servidor_modelos:
+        from autodub.adapters.model_server_client_adapter import (
+            AsrServidorModelos,
+            ClienteServidorModelos,
+            EmbeddingServidorModelos,
+        )
+
+        cliente = ClienteServidorModelos(servidor_modelos)
+        print(f"ℹ️  Usando servidor de modelos em {servidor_modelos}: {cliente.status()}")
+        asr, embedding = AsrServidorModelos(cliente), EmbeddingServidorModelos(cliente)
+    else:
+        from autodub.adapters.embedding_extractor_adapter import ResemblyzerEmbedding
+        from autodub.adapters.whisper_asr_adapter import WhisperAsr
+
+        asr, embedding = WhisperAsr(model_name="base"), ResemblyzerEmbedding()
+
+    return Pipeline(
+        asr=asr,
         tts=MockTTS(),
         ffmpeg=ffmpeg_adapter,
         vocoder=MockVocoder(),
-        embedding=ResemblyzerEmbedding(),
+        embedding=embedding,
         translator=MockTranslator(),
+        nucleos=nucleos,
+        trabalhadores=trabalhadores,
+    )
+
+
+_pipeline_do_trabalhador: Optional[Pipeline] = None
+
+
+def dublar_video(
+    video_entrada: Path,
+    nucleos: Optional[int],
+    trabalhadores: int,
+    servidor_modelos: Optional[str] = None,
+    idiomas: Sequence[str] = ("pt-br",),
+):
+    """Dubla um vídeo, reaproveitando a pipeline já carregada neste processo."""
+    global _pipeline_do_trabalhador
+    if _pipeline_do_trabalhador is None:
+        _pipeline_do_trabalhador = criar_pipeline(nucleos, trabalhadores, servidor_modelos)
+
+    video_saida = video_entrada.with_stem(f"{video_entrada.stem}_dublado")
+    if len(idiomas) > 1:
+        saidas = _pipeline_do_trabalhador.executar_multilingue(
+            video_entrada, idiomas, video_saida, debug=True
+        )
+        return ", ".join(str(saida) for saida in saidas.values())
+    return _pipeline_do_trabalhador.executar(
+        video_entrada, video_saida, target_lang=idiomas[0], debug=True
+    )
+
+
+def preflight(videos: Sequence[Path]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Inspeciona as entradas com ffprobe antes de qualquer modelo ser carregado.
+
+    Returns:
+        List[Dict] | None: Plano de cada vídeo (`planejar`); None sem ffmpeg/ffprobe.
+
+    Raises:
+        ValueError: Se algum vídeo não tiver fluxo de áudio.
+        RuntimeError: Se o ffprobe não conseguir ler algum vídeo.
+    """
+    if not which("ffprobe"):
+        return None
+    from autodub.adapters.real_ffmpeg_wrapper_adapter import RealFFmpegWrapper
+
+    ffmpeg_adapter = RealFFmpegWrapper()
+    planos = []
+    for video_entrada in videos:
+        try:
+            planos.append(planejar(ffmpeg_adapter.probe(video_entrada)))
+        except ValueError as exc:
+            raise ValueError(f"{video_entrada}: {exc}") from exc
+    return planos
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m autodub.pipeline_manual",
+        description="Executa o pipeline manual de dublagem em um ou mais vídeos.",
     )
+    parser.add_argument("videos", nargs="+", type=Path, help="Vídeos de entrada")
+    parser.add_argument(
+        "--nucleos", type=int, default=None, help="Total de núcleos de CPU para o lote"
+    )
+    parser.add_argument(
+        "--trabalhadores",
+        type=int,
+        default=None,
+        help="Processos trabalhadores em paralelo (padrão: pelas durações, ou 1)",
+    )
+    parser.add_argument(
+        "--servidor-modelos",
+        default=None,
+        help="Socket de um servidor de modelos (python -m autodub.model_server)",
+    )
+    parser.add_argument(
+        "--idiomas",
+        nargs="+",
+        default=["pt-br"],
+        help="Idiomas de destino (vários: ASR e embedding compartilhados)",
+    )
+    argumentos = parser.parse_args()
+
+    for video_entrada in argumentos.videos:
+        if not video_entrada.exists():
+            print(f"❌ Erro: arquivo de entrada não encontrado: {video_entrada}")
+            sys.exit(1)
+
+    try:
+        planos = preflight(argumentos.videos)
+    except (ValueError, RuntimeError) as exc:
+        print(f"❌ Erro no preflight: {exc}")
+        sys.exit(1)
+    if planos:
+        for video_entrada, plano in zip(argumentos.videos, planos):
+            print(
+                f"🔎 {video_entrada}: {plano['duracao']}s, fluxos {plano['fluxos']}, "
+                f"extração {plano['extracao']}"
+            )
+
+    trabalhadores = argumentos.trabalhadores
+    if trabalhadores is None and planos:
+        duracoes = [plano["duracao"] for plano in planos]
+        trabalhadores = sugerir_paralelismo(duracoes, argumentos.nucleos)["trabalhadores"]
 
     print("🚀 Executando pipeline manual...\n")
-    saida = pipeline.executar(video_entrada, video_saida, target_lang="pt-br", debug=True)
-    print(f"\n✅ Pipeline finalizado com sucesso! Saída: {saida}")
+    trabalhadores = min(trabalhadores or 1, len(argumentos.videos))
+
+    if trabalhadores <= 1:
+        for video_entrada in argumentos.videos:
+            saida = dublar_video(
+                video_entrada,
+                argumentos.nucleos,
+                1,
+                argumentos.servidor_modelos,
+                argumentos.idiomas,
+            )
+            print(f"\n✅ Pipeline finalizado com sucesso! Saída: {saida}")
+        return
+
+    alocacao = calcular_alocacao(argumentos.nucleos, trabalhadores)
+    print(
+        f"🧵 {alocacao['nucleos_totais']} núcleos para {alocacao['trabalhadores']} "
+        f"trabalhadores ({alocacao['threads_por_trabalhador']} threads cada)"
+    )
+    with ProcessPoolExecutor(
+        max_workers=alocacao["trabalhadores"],
+        initializer=inicializar_trabalhador,
+        initargs=(alocacao["threads_por_trabalhador"],),
+    ) as executor:
+        futuros = [
+            executor.submit(
+                dublar_video,
+                video_entrada,
+                alocacao["nucleos_totais"],
+                alocacao["trabalhadores"],
+                argumentos.servidor_modelos,
+                argumentos.idiomas,
+            )
+            for video_entrada in argumentos.videos
+        ]
+        for futuro in futuros:
+            print(f"\n✅ Pipeline finalizado com sucesso! Saída: {futuro.result()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+"""
+Gravação de artefatos de debug em segundo plano.
+
+Com `debug=True`, a pipeline entrega os artefatos (transcrições, embedding,
+áudio extraído) a uma fila e segue em frente; uma thread trabalhadora grava
+tudo em disco. Os formatos são compactos: embeddings em `.npy` e áudio grande
+ligado por hard link (cópia só quando o link não é possível, ex.: outro disco).
+
+Funções principais:
+- EscritorArtefatos.gravar_*: enfileiram um artefato sem esperar pela gravação.
+- EscritorArtefatos.encerrar: espera a fila esvaziar e devolve as falhas.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, List, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_FIM = object()
+
+
+class EscritorArtefatos:
+    """
+    Fila de gravação de artefatos atendida por uma thread em segundo plano.
+
+    Os dados são capturados no momento da chamada (cópias baratas), então a
+    pipeline pode continuar alterando suas estruturas sem afetar o que será
+    gravado. Erros de gravação não interrompem a execução: são acumulados e
+    devolvidos por `aguardar`/`encerrar`.
+
+    Args:
+        diretorio (str | Path): Diretório de destino dos artefatos.
+    """
+
+    def __init__(self, diretorio: Union[str, Path]) -> None:
+        self.diretorio = Path(diretorio)
+        self.gravados: List[Path] = []
+        self._falhas: List[Tuple[str, Exception]] = []
+        self._fila: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._trabalhar, name="autodub-artefatos", daemon=True
+        )
+        self._thread.start()
+
+    def _trabalhar(self) -> None:
+        while True:
+            tarefa = self._fila.get()
+            try:
+                if tarefa is _FIM:
+                    return
+                nome, gravar = tarefa
+                destino = self.diretorio / nome
+                try:
+                    destino.parent.mkdir(parents=True, exist_ok=True)
+                    gravar(destino)
+                    self.gravados.append(destino)
+                except Exception as exc:
+                    logger.warning("Falha ao gravar artefato %s: %s", destino, exc)
+                    self._falhas.append((nome, exc))
+            finally:
+                self._fila.task_done()
+
+    def _enfileirar(self, nome: str, gravar: Callable[[Path], None]) -> None:
+        if not self._thread.is_alive():
+            raise RuntimeError("EscritorArtefatos já foi encerrado.")
+        self._fila.put((nome, gravar))
+
+    def gravar_bytes(self, nome: str, dados: bytes) -> None:
+        """Enfileira bytes brutos."""
+        self._enfileirar(nome, lambda destino: destino.write_bytes(dados))
+
+    def gravar_json(self, nome: str, objeto: Any) -> None:
+        """Enfileira um objeto JSON (serializado já na chamada)."""
+        texto = json.dumps(objeto, ensure_ascii=False, indent=2)
+        self._enfileirar(nome, lambda destino: destino.write_text(texto, encoding="utf-8"))
+
+    def gravar_embedding(self, nome: str, vetor) -> None:
+        """Enfileira um embedding como array float32 em `.npy`."""
+        array = np.array(list(vetor) if isinstance(vetor, (set, frozenset)) else vetor)
+        array = array.astype(np.float32, copy=False)
+        self._enfileirar(nome, lambda destino: np.save(destino, array))
+
+    def gravar_segmentos(self, nome: str, segmentos) -> None:
+        """Enfileira uma `TabelaSegmentos` em JSONL (a tabela é copiada agora)."""
+        copia = segmentos.copia()
+        self._enfileirar(nome, copia.salvar_jsonl)
+
+    def vincular_audio(self, nome: str, origem: Union[str, Path]) -> None:
+        """
+        Enfileira um arquivo grande: hard link quando possível, cópia caso contrário.
+
+        A origem precisa existir até `aguardar`/`encerrar` (a pipeline só apaga
+        o diretório temporário depois de encerrar o escritor).
+        """
+        origem = Path(origem)
+
+        def gravar(destino: Path) -> None:
+            if destino.exists():
+                destino.unlink()
+            try:
+                os.link(origem, destino)
+            except OSError:
+                shutil.copyfile(origem, destino)
+
+        self._enfileirar(nome, gravar)
+
+    def aguardar(self) -> List[Tuple[str, Exception]]:
+        """Bloqueia até todos os artefatos enfileirados serem gravados."""
+        self._fila.join()
+        return list(self._falhas)
+
+    def encerrar(self) -> List[Tuple[str, Exception]]:
+        """Grava o que falta, encerra a thread e devolve as falhas ocorridas."""
+        if self._thread.is_alive():
+            self._fila.put(_FIM)
+            self._thread.join()
+        return list(self._falhas)
+
+    def __enter__(self) -> "EscritorArtefatos":
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        self.encerrar()
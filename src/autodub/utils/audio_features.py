@@ -0,0 +1,346 @@
+"""
+Front-end espectral compartilhado: STFT, mel, MFCC, energia e cruzamentos por zero.
+
+Vocoder, alinhador e VAD partem do mesmo áudio; em vez de cada um calcular
+suas próprias características, este módulo as calcula uma vez, em lote, e as
+memoriza por áudio (`AudioCaracteristicas`), até um limite de bytes: o
+espectrograma de um episódio inteiro pode passar de centenas de MB e, acima do
+limite, é recalculado em blocos a cada pedido em vez de ficar na memória.
+
+- Janelas, bancos de filtros mel e matrizes DCT ficam em cache (`lru_cache`) e
+  são somente-leitura.
+- WAVs PCM16 são abertos com `np.memmap` e processados em blocos de quadros:
+  a memória de trabalho depende do tamanho do bloco, não da duração do áudio.
+- Cada quadro `k` cobre as amostras `[k * passo, k * passo + n_fft)`.
+
+Funções principais:
+- janela_hann / banco_mel / matriz_dct: tabelas em cache.
+- espectro_potencia / mel_espectrograma / mfcc: funções puras sobre arrays.
+- localizar_dados_wav / ler_wav_mmap: amostras de um WAV PCM16 mapeadas em memória.
+- AudioCaracteristicas: características memorizadas de um áudio.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Hashable, Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+N_FFT_PADRAO = 400  # 25 ms a 16 kHz
+PASSO_PADRAO = 160  # 10 ms a 16 kHz
+LIMITE_CACHE_PADRAO = 64 * 2**20  # bytes memorizados por AudioCaracteristicas
+
+
+def _somente_leitura(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=None)
+def janela_hann(n: int) -> np.ndarray:
+    """Janela de Hann periódica (float32, somente-leitura)."""
+    return _somente_leitura(np.hanning(n + 1)[:n].astype(np.float32))
+
+
+def _hz_para_mel(hz):
+    return 2595.0 * np.log10(1.0 + np.asarray(hz, dtype=np.float64) / 700.0)
+
+
+def _mel_para_hz(mel):
+    return 700.0 * (10.0 ** (np.asarray(mel, dtype=np.float64) / 2595.0) - 1.0)
+
+
+@lru_cache(maxsize=None)
+def banco_mel(
+    taxa: int, n_fft: int, n_mels: int = 80, fmin: float = 0.0, fmax: float = None
+) -> np.ndarray:
+    """
+    Banco de filtros triangulares na escala mel (HTK), normalizado por área.
+
+    Returns:
+        np.ndarray: (n_mels, n_fft // 2 + 1) float32, somente-leitura.
+    """
+    fmax = taxa / 2 if fmax is None else fmax
+    frequencias = np.fft.rfftfreq(n_fft, 1.0 / taxa)
+    pontos = _mel_para_hz(np.linspace(_hz_para_mel(fmin), _hz_para_mel(fmax), n_mels + 2))
+
+    inferior, centro, superior = pontos[:-2, None], pontos[1:-1, None], pontos[2:, None]
+    subida = (frequencias - inferior) / np.maximum(centro - inferior, 1e-10)
+    descida = (superior - frequencias) / np.maximum(superior - centro, 1e-10)
+    filtros = np.maximum(0.0, np.minimum(subida, descida))
+    filtros *= 2.0 / np.maximum(superior - inferior, 1e-10)
+    return _somente_leitura(filtros.astype(np.float32))
+
+
+@lru_cache(maxsize=None)
+def matriz_dct(n_entradas: int, n_saidas: int) -> np.ndarray:
+    """Matriz DCT-II ortonormal (n_saidas, n_entradas), somente-leitura."""
+    k = np.arange(n_saidas)[:, None]
+    n = np.arange(n_entradas)[None, :]
+    dct = np.cos(np.pi / n_entradas * (n + 0.5) * k) * np.sqrt(2.0 / n_entradas)
+    dct[0] /= np.sqrt(2.0)
+    return _somente_leitura(dct.astype(np.float32))
+
+
+def numero_quadros(amostras: int, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO) -> int:
+    """Quantidade de quadros de um áudio (áudio menor que `n_fft` vira um quadro)."""
+    return 1 + max(0, amostras - n_fft) // passo
+
+
+def quadros(
+    audio: np.ndarray, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO
+) -> np.ndarray:
+    """Visão (sem cópia) dos quadros do áudio: (Q, n_fft)."""
+    audio = np.asarray(audio)
+    if len(audio) < n_fft:
+        audio = np.pad(audio, (0, n_fft - len(audio)))
+    return sliding_window_view(audio, n_fft)[::passo]
+
+
+def espectro_potencia(
+    audio: np.ndarray, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO
+) -> np.ndarray:
+    """Espectro de potência da STFT com janela de Hann: (Q, n_fft // 2 + 1) float32."""
+    janelados = quadros(np.asarray(audio, dtype=np.float32), n_fft, passo) * janela_hann(n_fft)
+    espectro = np.fft.rfft(janelados, axis=1)
+    return (espectro.real**2 + espectro.imag**2).astype(np.float32)
+
+
+def mel_espectrograma(
+    audio: np.ndarray,
+    taxa: int,
+    n_fft: int = N_FFT_PADRAO,
+    passo: int = PASSO_PADRAO,
+    n_mels: int = 80,
+    log: bool = True,
+) -> np.ndarray:
+    """Espectrograma mel (Q, n_mels); com `log`, em log natural com piso de 1e-10."""
+    mel = espectro_potencia(audio, n_fft, passo) @ banco_mel(taxa, n_fft, n_mels).T
+    return np.log(np.maximum(mel, 1e-10)) if log else mel
+
+
+def mfcc(
+    audio: np.ndarray,
+    taxa: int,
+    n_mfcc: int = 13,
+    n_fft: int = N_FFT_PADRAO,
+    passo: int = PASSO_PADRAO,
+    n_mels: int = 40,
+) -> np.ndarray:
+    """Coeficientes cepstrais (Q, n_mfcc) a partir do log-mel."""
+    log_mel = mel_espectrograma(audio, taxa, n_fft, passo, n_mels)
+    return log_mel @ matriz_dct(n_mels, n_mfcc).T
+
+
+def energia_log(
+    audio: np.ndarray, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO
+) -> np.ndarray:
+    """Energia média por quadro em log10 (Q,)."""
+    janelas = quadros(np.asarray(audio, dtype=np.float32), n_fft, passo)
+    return np.log10(np.einsum("ij,ij->i", janelas, janelas) / n_fft + 1e-10).astype(np.float32)
+
+
+def taxa_cruzamentos_zero(
+    audio: np.ndarray, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO
+) -> np.ndarray:
+    """Fração de trocas de sinal por quadro (Q,)."""
+    trocas = np.diff(np.signbit(np.asarray(audio)).astype(np.int8))
+    # Soma por quadro com soma acumulada: O(amostras), sem materializar os quadros
+    acumulado = np.concatenate(([0], np.cumsum(np.abs(trocas), dtype=np.int64)))
+    inicios = np.arange(numero_quadros(len(audio), n_fft, passo)) * passo
+    fins = np.minimum(inicios + n_fft - 1, len(trocas))
+    return ((acumulado[fins] - acumulado[np.minimum(inicios, fins)]) / (n_fft - 1)).astype(
+        np.float32
+    )
+
+
+def localizar_dados_wav(caminho: Union[str, Path]) -> Tuple[int, int, int]:
+    """
+    Localiza as amostras de um WAV PCM16 mono sem lê-las.
+
+    Returns:
+        Tuple[int, int, int]: (deslocamento do bloco de dados, tamanho declarado
+        em bytes, taxa de amostragem).
+
+    Raises:
+        ValueError: Se o arquivo não for WAV PCM16 mono.
+    """
+    with open(caminho, "rb") as f:
+        cabecalho = f.read(12)
+        if len(cabecalho) < 12 or cabecalho[:4] != b"RIFF" or cabecalho[8:12] != b"WAVE":
+            raise ValueError(f"{caminho} não é um arquivo WAV.")
+        formato = None
+        while True:
+            bloco = f.read(8)
+            if len(bloco) < 8:
+                raise ValueError(f"{caminho} não tem bloco de dados.")
+            identificador, tamanho = bloco[:4], struct.unpack("<I", bloco[4:])[0]
+            if identificador == b"fmt ":
+                formato = struct.unpack("<HHIIHH", f.read(16))
+                f.seek(tamanho - 16 + (tamanho % 2), 1)
+            elif identificador == b"data":
+                deslocamento = f.tell()
+                break
+            else:
+                f.seek(tamanho + (tamanho % 2), 1)
+
+    if formato is None or formato[0] != 1 or formato[1] != 1 or formato[5] != 16:
+        raise ValueError(f"{caminho} não é PCM16 mono.")
+    return deslocamento, tamanho, formato[2]
+
+
+def ler_wav_mmap(caminho: Union[str, Path]) -> Tuple[np.ndarray, int]:
+    """
+    Mapeia em memória as amostras de um WAV PCM16 mono.
+
+    Returns:
+        Tuple[np.ndarray, int]: (memmap int16 somente-leitura, taxa de amostragem).
+
+    Raises:
+        ValueError: Se o arquivo não for WAV PCM16 mono.
+    """
+    deslocamento, tamanho, taxa = localizar_dados_wav(caminho)
+    amostras = np.memmap(
+        caminho, dtype="<i2", mode="r", offset=deslocamento, shape=(tamanho // 2,)
+    )
+    return amostras, taxa
+
+
+def em_blocos(
+    amostras: np.ndarray,
+    funcao: Callable[[np.ndarray], np.ndarray],
+    n_fft: int = N_FFT_PADRAO,
+    passo: int = PASSO_PADRAO,
+    quadros_por_bloco: int = 4096,
+) -> np.ndarray:
+    """
+    Aplica uma função de características quadro a quadro, bloco por bloco.
+
+    Cada bloco é convertido para float32 em [-1, 1) só quando é processado, então
+    um memmap int16 nunca é carregado inteiro. O resultado é idêntico ao de
+    `funcao` sobre o áudio completo.
+    """
+    total = numero_quadros(len(amostras), n_fft, passo)
+    escala = 1.0 / 32768.0 if np.issubdtype(amostras.dtype, np.integer) else 1.0
+    partes = []
+    for primeiro in range(0, total, quadros_por_bloco):
+        ultimo = min(primeiro + quadros_por_bloco, total)
+        inicio = primeiro * passo
+        fim = (ultimo - 1) * passo + n_fft
+        bloco = np.asarray(amostras[inicio:fim], dtype=np.float32) * escala
+        partes.append(funcao(bloco))
+    return np.concatenate(partes, axis=0)
+
+
+class AudioCaracteristicas:
+    """
+    Características de um áudio calculadas uma vez e reaproveitadas.
+
+    Args:
+        fonte (str | Path | np.ndarray): Caminho de um WAV PCM16 mono (mapeado em
+            memória) ou amostras mono já carregadas.
+        taxa (int, opcional): Taxa de amostragem (obrigatória para arrays).
+        quadros_por_bloco (int): Quadros processados por vez.
+        limite_cache_bytes (int, opcional): Bytes memorizados; ao passar do
+            limite, sai o resultado usado há mais tempo, e um resultado maior
+            que o limite não é memorizado. 0 desliga a memorização; None não
+            limita.
+    """
+
+    def __init__(
+        self,
+        fonte: Union[str, Path, np.ndarray],
+        taxa: int = None,
+        quadros_por_bloco: int = 4096,
+        limite_cache_bytes: Optional[int] = LIMITE_CACHE_PADRAO,
+    ) -> None:
+        if isinstance(fonte, (str, Path)):
+            self.amostras, self.taxa = ler_wav_mmap(fonte)
+        else:
+            if taxa is None:
+                raise ValueError("taxa é obrigatória quando a fonte é um array.")
+            self.amostras, self.taxa = np.asarray(fonte), taxa
+        self.quadros_por_bloco = quadros_por_bloco
+        self.limite_cache_bytes = limite_cache_bytes
+        self._cache: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+
+    @property
+    def duracao(self) -> float:
+        return len(self.amostras) / self.taxa
+
+    @property
+    def bytes_em_cache(self) -> int:
+        return sum(valor.nbytes for valor in self._cache.values())
+
+    def _memorizado(self, chave: Hashable, calcular: Callable[[], np.ndarray]) -> np.ndarray:
+        if chave in self._cache:
+            self._cache.move_to_end(chave)
+            return self._cache[chave]
+        valor = _somente_leitura(calcular())
+        limite = self.limite_cache_bytes
+        if limite is None or valor.nbytes <= limite:
+            self._cache[chave] = valor
+            while limite is not None and self.bytes_em_cache > limite:
+                self._cache.popitem(last=False)
+        return valor
+
+    def _em_blocos(self, funcao, n_fft: int, passo: int) -> np.ndarray:
+        return em_blocos(self.amostras, funcao, n_fft, passo, self.quadros_por_bloco)
+
+    def espectro_potencia(self, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO):
+        return self._memorizado(
+            ("potencia", n_fft, passo),
+            lambda: self._em_blocos(lambda a: espectro_potencia(a, n_fft, passo), n_fft, passo),
+        )
+
+    def mel(self, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO, n_mels: int = 80):
+        """
+        Log-mel (Q, n_mels): derivado do espectro de potência se ele estiver
+        memorizado; senão, calculado em blocos, sem o espectro inteiro na memória.
+        """
+        banco = banco_mel(self.taxa, n_fft, n_mels)
+
+        def calcular() -> np.ndarray:
+            potencia = self._cache.get(("potencia", n_fft, passo))
+            if potencia is not None:
+                return np.log(np.maximum(potencia @ banco.T, 1e-10))
+            return self._em_blocos(
+                lambda a: np.log(
+                    np.maximum(espectro_potencia(a, n_fft, passo) @ banco.T, 1e-10)
+                ),
+                n_fft,
+                passo,
+            )
+
+        return self._memorizado(("mel", n_fft, passo, n_mels), calcular)
+
+    def mfcc(
+        self,
+        n_mfcc: int = 13,
+        n_fft: int = N_FFT_PADRAO,
+        passo: int = PASSO_PADRAO,
+        n_mels: int = 40,
+    ):
+        return self._memorizado(
+            ("mfcc", n_mfcc, n_fft, passo, n_mels),
+            lambda: self.mel(n_fft, passo, n_mels) @ matriz_dct(n_mels, n_mfcc).T,
+        )
+
+    def energia_log(self, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO):
+        return self._memorizado(
+            ("energia", n_fft, passo),
+            lambda: self._em_blocos(lambda a: energia_log(a, n_fft, passo), n_fft, passo),
+        )
+
+    def cruzamentos_zero(self, n_fft: int = N_FFT_PADRAO, passo: int = PASSO_PADRAO):
+        return self._memorizado(
+            ("cruzamentos", n_fft, passo),
+            lambda: self._em_blocos(
+                lambda a: taxa_cruzamentos_zero(a, n_fft, passo), n_fft, passo
+            ),
+        )
@@ -0,0 +1,60 @@
+"""
+Conversões entre arrays NumPy e bytes WAV PCM16 (nos dois sentidos).
+
+Usa apenas o módulo `wave` da biblioteca padrão, sem dependências opcionais.
+"""
+
+from __future__ import annotations
+
+import io
+import wave
+from typing import Tuple
+
+import numpy as np
+
+
+def pcm16_para_wav_bytes(
+    amostras: np.ndarray, sample_rate: int = 16000, canais: int = 1
+) -> bytes:
+    """
+    Empacota amostras em um WAV PCM16.
+
+    Args:
+        amostras (np.ndarray): Amostras int16 ou float (float é limitado a [-1, 1]).
+        sample_rate (int): Taxa de amostragem.
+        canais (int): Número de canais (amostras intercaladas).
+
+    Returns:
+        bytes: Arquivo WAV completo.
+    """
+    amostras = np.asarray(amostras)
+    if amostras.dtype != np.int16:
+        amostras = (np.clip(amostras, -1.0, 1.0) * 32767).astype(np.int16)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(canais)
+        wf.setsampwidth(2)  # 16 bits
+        wf.setframerate(sample_rate)
+        wf.writeframes(amostras.astype("<i2", copy=False).tobytes())
+    return buffer.getvalue()
+
+
+def wav_bytes_para_pcm16(dados: bytes) -> Tuple[np.ndarray, int]:
+    """
+    Lê um WAV PCM16 mono em memória.
+
+    Returns:
+        Tuple[np.ndarray, int]: (amostras int16, taxa de amostragem).
+
+    Raises:
+        ValueError: Se os bytes não forem um WAV PCM16 mono.
+    """
+    try:
+        with wave.open(io.BytesIO(dados)) as wf:
+            if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+                raise ValueError("Apenas WAV PCM16 mono é suportado.")
+            amostras = np.frombuffer(wf.readframes(wf.getnframes()), dtype="<i2")
+            return amostras.astype(np.int16), wf.getframerate()
+    except (wave.Error, EOFError) as exc:
+        raise ValueError(f"Dados não são um WAV válido: {exc}") from exc
@@ -0,0 +1,122 @@
+"""
+Amostragem de trechos de fala para limitar o custo da extração de embedding.
+
+Em vez de processar o áudio inteiro, mede a energia (RMS) de janelas fixas em
+uma única leitura em blocos — memória constante, independente da duração — e
+seleciona as janelas de maior energia distribuídas ao longo do arquivo.
+
+Funções principais:
+- energia_janelas: energia RMS por janela, lida em streaming.
+- selecionar_janelas: escolhe as janelas de fala mais fortes, espalhadas no tempo.
+- amostrar_fala: devolve só os trechos escolhidos, limitados a `max_segundos`.
+
+A leitura usa o `soundfile` (extra opcional "tts"), importado só quando preciso.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+
+
+def energia_janelas(
+    caminho_audio: Union[str, Path],
+    janela_segundos: float = 1.0,
+    janelas_por_bloco: int = 64,
+) -> Tuple[np.ndarray, int]:
+    """
+    Calcula a energia RMS de cada janela do áudio sem carregá-lo inteiro.
+
+    Args:
+        caminho_audio (str | Path): Arquivo de áudio legível pelo `soundfile`.
+        janela_segundos (float): Duração de cada janela.
+        janelas_por_bloco (int): Quantas janelas são lidas por vez do disco.
+
+    Returns:
+        Tuple[np.ndarray, int]: (energias por janela, taxa de amostragem).
+    """
+    import soundfile as sf
+
+    info = sf.info(str(caminho_audio))
+    amostras_janela = max(1, int(round(janela_segundos * info.samplerate)))
+    energias = []
+
+    for bloco in sf.blocks(
+        str(caminho_audio),
+        blocksize=amostras_janela * janelas_por_bloco,
+        dtype="float32",
+        always_2d=True,
+    ):
+        mono = bloco.mean(axis=1)
+        completas = len(mono) // amostras_janela
+        if completas:
+            quadros = mono[: completas * amostras_janela].reshape(completas, amostras_janela)
+            energias.append(np.sqrt(np.mean(quadros**2, axis=1)))
+
+    if not energias:
+        return np.zeros(0, dtype=np.float32), info.samplerate
+    return np.concatenate(energias), info.samplerate
+
+
+def selecionar_janelas(
+    energias: np.ndarray, quantidade: int, limiar_relativo: float = 0.1
+) -> np.ndarray:
+    """
+    Escolhe até `quantidade` janelas de fala, espalhadas pelo arquivo.
+
+    Janelas com energia abaixo de `limiar_relativo` × percentil 95 são tratadas
+    como silêncio. As janelas restantes são divididas, na ordem temporal, em
+    `quantidade` grupos contíguos e a mais forte de cada grupo é escolhida.
+
+    Returns:
+        np.ndarray: Índices das janelas escolhidas, em ordem crescente.
+    """
+    energias = np.asarray(energias, dtype=np.float32)
+    if quantidade <= 0 or energias.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    referencia = np.percentile(energias, 95)
+    candidatas = np.flatnonzero(energias >= limiar_relativo * referencia)
+    if candidatas.size <= quantidade:
+        return candidatas
+
+    grupos = np.arange(candidatas.size) * quantidade // candidatas.size
+    ordem = np.lexsort((-energias[candidatas], grupos))
+    primeiros = np.searchsorted(grupos[ordem], np.arange(quantidade))
+    return np.sort(candidatas[ordem[primeiros]])
+
+
+def amostrar_fala(
+    caminho_audio: Union[str, Path],
+    max_segundos: float,
+    janela_segundos: float = 1.0,
+    limiar_relativo: float = 0.1,
+) -> Tuple[np.ndarray, int]:
+    """
+    Lê apenas os trechos de fala mais fortes, somando no máximo `max_segundos`.
+
+    O tempo e a memória da extração passam a depender de `max_segundos`, e não
+    da duração total do arquivo.
+
+    Returns:
+        Tuple[np.ndarray, int]: (áudio mono float32 concatenado, taxa de amostragem).
+    """
+    energias, taxa = energia_janelas(caminho_audio, janela_segundos)
+    quantidade = max(1, int(max_segundos // janela_segundos))
+    indices = selecionar_janelas(energias, quantidade, limiar_relativo)
+    amostras_janela = max(1, int(round(janela_segundos * taxa)))
+
+    import soundfile as sf
+
+    trechos = []
+    with sf.SoundFile(str(caminho_audio)) as arquivo:
+        for indice in indices:
+            arquivo.seek(int(indice) * amostras_janela)
+            trecho = arquivo.read(amostras_janela, dtype="float32", always_2d=True)
+            trechos.append(trecho.mean(axis=1))
+
+    if not trechos:
+        return np.zeros(0, dtype=np.float32), taxa
+    return np.concatenate(trechos), taxa
@@ -0,0 +1,130 @@
+"""
+Armazenamento dos intermediários de áudio em WAV (PCM) ou FLAC.
+
+Áudio extraído, falas e trilha montada são PCM16 mono. Em disco de rede, o
+gargalo costuma ser a banda de I/O, não a CPU: FLAC (sem perdas) grava
+tipicamente metade dos bytes ou menos. O formato é decidido pela extensão do
+arquivo, então cada etapa lê o que a anterior gravou sem saber o formato.
+
+O FLAC usa o `soundfile` (extra opcional "tts"), importado só quando preciso.
+
+Funções principais:
+- validar_formato / com_formato: extensão do formato e troca de extensão.
+- gravar_pcm16 / gravar_wav_bytes: grava amostras ou um WAV no formato do caminho.
+- ler_pcm16: lê amostras int16 mono de WAV ou FLAC.
+- taxa_arquivo: taxa de amostragem só pelo cabeçalho.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+
+from autodub.utils.audio_features import localizar_dados_wav
+from autodub.utils.audio_io import pcm16_para_wav_bytes, wav_bytes_para_pcm16
+
+# Formato → extensão dos intermediários
+FORMATOS_INTERMEDIARIOS = {"wav": ".wav", "flac": ".flac"}
+
+
+def validar_formato(formato: str) -> str:
+    """Devolve a extensão do formato; ValueError se ele não for suportado."""
+    if formato not in FORMATOS_INTERMEDIARIOS:
+        raise ValueError(
+            f"Formato deve ser um de {sorted(FORMATOS_INTERMEDIARIOS)}, não {formato!r}."
+        )
+    return FORMATOS_INTERMEDIARIOS[formato]
+
+
+def com_formato(nome: Union[str, Path], formato: str) -> str:
+    """'segment_1.wav', "flac" → 'segment_1.flac'."""
+    return str(Path(nome).with_suffix(validar_formato(formato)))
+
+
+def _e_wav(caminho: Path) -> bool:
+    return caminho.suffix.lower() != ".flac"
+
+
+def gravar_pcm16(caminho: Union[str, Path], amostras: np.ndarray, taxa: int) -> None:
+    """
+    Grava amostras mono (int16, ou float em [-1, 1]) como WAV ou FLAC 16 bits,
+    conforme a extensão de `caminho`.
+    """
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    amostras = np.asarray(amostras)
+    if amostras.dtype != np.int16:
+        amostras = (np.clip(amostras, -1.0, 1.0) * 32767).astype(np.int16)
+
+    if _e_wav(caminho):
+        caminho.write_bytes(pcm16_para_wav_bytes(amostras, sample_rate=taxa))
+        return
+
+    import soundfile as sf
+
+    sf.write(str(caminho), amostras, taxa, subtype="PCM_16", format="FLAC")
+
+
+def gravar_wav_bytes(caminho: Union[str, Path], dados: bytes) -> None:
+    """
+    Grava um WAV (ex.: a saída do TTS) no formato de `caminho`.
+
+    Raises:
+        ValueError: Se `caminho` for FLAC e `dados` não forem WAV PCM16 mono.
+    """
+    caminho = Path(caminho)
+    if _e_wav(caminho):
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.write_bytes(dados)
+        return
+    amostras, taxa = wav_bytes_para_pcm16(dados)
+    gravar_pcm16(caminho, amostras, taxa)
+
+
+def ler_pcm16(caminho: Union[str, Path]) -> Tuple[np.ndarray, int]:
+    """
+    Lê um intermediário WAV ou FLAC.
+
+    Returns:
+        Tuple[np.ndarray, int]: Amostras int16 mono e taxa de amostragem.
+
+    Raises:
+        ValueError: Se o arquivo não for PCM16 mono (WAV) ou mono (FLAC).
+    """
+    caminho = Path(caminho)
+    if _e_wav(caminho):
+        return wav_bytes_para_pcm16(caminho.read_bytes())
+
+    import soundfile as sf
+
+    try:
+        amostras, taxa = sf.read(str(caminho), dtype="int16", always_2d=True)
+    except RuntimeError as exc:  # soundfile sinaliza arquivo inválido assim
+        raise ValueError(f"{caminho} não é um FLAC legível: {exc}") from exc
+    if amostras.shape[1] != 1:
+        raise ValueError(f"{caminho} tem {amostras.shape[1]} canais; esperado mono.")
+    return amostras[:, 0], taxa
+
+
+def taxa_arquivo(caminho: Union[str, Path]) -> int:
+    """
+    Taxa de amostragem de um intermediário, lendo só o cabeçalho.
+
+    Raises:
+        ValueError: Como `ler_pcm16`.
+    """
+    caminho = Path(caminho)
+    if _e_wav(caminho):
+        return localizar_dados_wav(caminho)[2]
+
+    import soundfile as sf
+
+    try:
+        info = sf.info(str(caminho))
+    except RuntimeError as exc:  # soundfile sinaliza arquivo inválido assim
+        raise ValueError(f"{caminho} não é um FLAC legível: {exc}") from exc
+    if info.channels != 1:
+        raise ValueError(f"{caminho} tem {info.channels} canais; esperado mono.")
+    return info.samplerate
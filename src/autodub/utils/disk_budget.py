@@ -0,0 +1,77 @@
+"""
+Orçamento e uso de disco do diretório de trabalho da pipeline.
+
+Os intermediários são PCM16 mono sem compressão: o áudio extraído, uma fala
+por segmento e a trilha montada, cada um com aproximadamente a duração da
+fonte. Dá para estimar o espaço necessário só pela duração, antes da extração,
+e falhar cedo em vez de encher o disco no meio da síntese.
+
+Funções principais:
+- estimar_uso_disco: bytes de intermediários esperados para uma duração.
+- uso_diretorio: bytes ocupados hoje por um diretório (recursivo).
+- MonitorDisco: acompanha o pico de uso do diretório de trabalho.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def estimar_uso_disco(
+    duracao_segundos: float, sample_rate: int = 16000, idiomas: int = 1
+) -> int:
+    """
+    Estima o pico de bytes de intermediários de uma execução.
+
+    Conta o áudio extraído uma vez e, por idioma, as falas e a trilha montada
+    (que coexistem até a montagem terminar).
+    """
+    por_segundo = sample_rate * 2  # PCM16 mono
+    return int(math.ceil(duracao_segundos * por_segundo * (1 + 2 * idiomas)))
+
+
+def uso_diretorio(caminho: Union[str, Path]) -> int:
+    """Soma o tamanho dos arquivos sob `caminho` (0 se não existir)."""
+    total = 0
+    try:
+        entradas = list(os.scandir(caminho))
+    except FileNotFoundError:
+        return 0
+    for entrada in entradas:
+        try:
+            if entrada.is_dir(follow_symlinks=False):
+                total += uso_diretorio(entrada.path)
+            else:
+                total += entrada.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            continue  # apagado durante a varredura
+    return total
+
+
+class MonitorDisco:
+    """
+    Mede o diretório de trabalho em pontos de controle e guarda o pico.
+
+    Args:
+        diretorio (str | Path): Diretório de trabalho monitorado.
+        resumo (Dict, opcional): Dicionário atualizado a cada medição com
+            `pico_bytes` (ex.: a seção "disco" do relatório da execução).
+    """
+
+    def __init__(
+        self, diretorio: Union[str, Path], resumo: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.diretorio = Path(diretorio)
+        self.resumo = resumo if resumo is not None else {}
+        self.pico = 0
+        self.resumo["pico_bytes"] = 0
+
+    def medir(self) -> int:
+        """Mede o uso atual, atualiza o pico e o devolve."""
+        atual = uso_diretorio(self.diretorio)
+        self.pico = max(self.pico, atual)
+        self.resumo["pico_bytes"] = self.pico
+        return atual
@@ -0,0 +1,164 @@
+"""
+Previsão da duração da fala sintetizada, antes de qualquer chamada ao TTS.
+
+A tradução costuma ser mais longa que o trecho original (`fim - inicio`), e a
+única saída era sintetizar, medir, encurtar e sintetizar de novo. O preditor
+estima a duração pelo número de sílabas e pela taxa de fala (sílabas/s) do
+idioma de destino, calibrada com as durações reais dos WAVs já gerados pelo
+TTS. A calibração é persistida em JSON entre execuções.
+
+Funções principais:
+- contar_silabas: estimativa barata de sílabas (grupos de vogais).
+- PreditorDuracao.prever / razao_excesso: duração prevista e razão sobre o trecho.
+- PreditorDuracao.registrar_wav: calibra com um WAV sintetizado.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import re
+import threading
+import wave
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+# Sílabas por segundo de fala natural (valores iniciais, antes da calibração)
+TAXAS_PADRAO = {
+    "pt": 6.0,
+    "es": 7.0,
+    "en": 5.5,
+    "fr": 6.5,
+    "it": 6.5,
+    "de": 5.5,
+    "ja": 7.5,
+    "zh": 5.0,
+}
+TAXA_DESCONHECIDA = 6.0
+
+_GRUPO_VOGAIS = re.compile(r"[aeiouyáàâãéêíóôõúüäëïöœæ]+", re.IGNORECASE)
+_NAO_ESPACO = re.compile(r"\S")
+
+
+def contar_silabas(texto: str) -> int:
+    """
+    Estima o número de sílabas de um texto.
+
+    Conta grupos de vogais; em escritas sem vogais latinas (ex.: japonês,
+    chinês) cada caractere visível conta como uma sílaba.
+    """
+    silabas = len(_GRUPO_VOGAIS.findall(texto))
+    return silabas if silabas else len(_NAO_ESPACO.findall(texto))
+
+
+def _idioma_base(idioma: str) -> str:
+    """'pt-BR' → 'pt'."""
+    return idioma.lower().replace("_", "-").split("-")[0]
+
+
+def duracao_wav(dados: bytes) -> Optional[float]:
+    """Duração em segundos de um WAV em memória (None se não for um WAV válido)."""
+    try:
+        with wave.open(io.BytesIO(dados)) as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return None
+
+
+class PreditorDuracao:
+    """
+    Preditor de duração por taxa de sílabas, calibrado por idioma.
+
+    Args:
+        caminho_calibracao (str | Path, opcional): JSON onde a calibração é lida e
+            gravada. Sem caminho, a calibração vale só para este objeto.
+        min_amostras (int): Segmentos medidos necessários para trocar a taxa
+            padrão do idioma pela taxa calibrada.
+        tolerancia (float): Razão prevista/disponível a partir da qual um trecho é
+            sinalizado como excedente.
+    """
+
+    def __init__(
+        self,
+        caminho_calibracao: Optional[Union[str, Path]] = None,
+        min_amostras: int = 5,
+        tolerancia: float = 1.0,
+    ) -> None:
+        self.caminho_calibracao = Path(caminho_calibracao) if caminho_calibracao else None
+        self.min_amostras = min_amostras
+        self.tolerancia = tolerancia
+        self.calibracao: Dict[str, Dict[str, float]] = {}
+        # Vários idiomas podem ser dublados em paralelo com o mesmo preditor
+        self._trava = threading.Lock()
+        if self.caminho_calibracao and self.caminho_calibracao.exists():
+            with open(self.caminho_calibracao, "r", encoding="utf-8") as f:
+                self.calibracao = json.load(f)
+
+    def taxa(self, idioma: str) -> float:
+        """Sílabas por segundo usadas para o idioma (calibrada, se houver amostras)."""
+        base = _idioma_base(idioma)
+        dados = self.calibracao.get(base)
+        if dados and dados["amostras"] >= self.min_amostras and dados["segundos"] > 0:
+            return dados["silabas"] / dados["segundos"]
+        return TAXAS_PADRAO.get(base, TAXA_DESCONHECIDA)
+
+    def prever(self, textos: Sequence[Optional[str]], idioma: str) -> np.ndarray:
+        """Duração prevista (segundos) de cada texto."""
+        silabas = np.fromiter(
+            (contar_silabas(texto or "") for texto in textos),
+            dtype=np.float64,
+            count=len(textos),
+        )
+        return silabas / self.taxa(idioma)
+
+    def razao_excesso(
+        self, textos: Sequence[Optional[str]], duracoes: np.ndarray, idioma: str
+    ) -> np.ndarray:
+        """
+        Razão entre a duração prevista e a duração disponível de cada trecho.
+
+        Valores acima de 1 indicam fala que provavelmente não cabe no trecho.
+        """
+        duracoes = np.asarray(duracoes, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            razao = self.prever(textos, idioma) / duracoes
+        return np.where(duracoes > 0, razao, np.inf)
+
+    def sinalizar_excesso(
+        self, textos: Sequence[Optional[str]], duracoes: np.ndarray, idioma: str
+    ) -> np.ndarray:
+        """Máscara dos trechos cuja fala prevista passa de `tolerancia` × duração."""
+        return self.razao_excesso(textos, duracoes, idioma) > self.tolerancia
+
+    def registrar(self, texto: str, idioma: str, duracao_segundos: float) -> None:
+        """Acumula uma medição real (texto sintetizado e sua duração)."""
+        silabas = contar_silabas(texto)
+        if silabas == 0 or duracao_segundos <= 0:
+            return
+        with self._trava:
+            dados = self.calibracao.setdefault(
+                _idioma_base(idioma), {"silabas": 0.0, "segundos": 0.0, "amostras": 0}
+            )
+            dados["silabas"] += silabas
+            dados["segundos"] += float(duracao_segundos)
+            dados["amostras"] += 1
+
+    def registrar_wav(self, texto: str, idioma: str, wav: bytes) -> None:
+        """Calibra com a saída do TTS; áudios que não são WAV são ignorados."""
+        duracao = duracao_wav(wav)
+        if duracao is not None:
+            self.registrar(texto, idioma, duracao)
+
+    def salvar(self) -> None:
+        """Grava a calibração de forma atômica (sem caminho, não faz nada)."""
+        if self.caminho_calibracao is None:
+            return
+        self.caminho_calibracao.parent.mkdir(parents=True, exist_ok=True)
+        temporario = self.caminho_calibracao.with_suffix(".tmp")
+        with self._trava:
+            with open(temporario, "w", encoding="utf-8") as f:
+                json.dump(self.calibracao, f, ensure_ascii=False, indent=2)
+            os.replace(temporario, self.caminho_calibracao)
@@ -0,0 +1,79 @@
+"""
+Histograma de latências com baldes fixos em escala logarítmica.
+
+Cada registro custa uma busca binária e um incremento, então dá para medir
+cada janela de cada etapa do modo ao vivo sem acumular listas de amostras.
+Percentis são estimados pelo limite superior do balde (resolução de ~26%
+com 10 baldes por década).
+
+Funções principais:
+- HistogramaLatencia.registrar: conta uma medida (segundos).
+- HistogramaLatencia.percentil / resumo: estatísticas para relatório e log.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict
+
+import numpy as np
+
+
+class HistogramaLatencia:
+    """
+    Histograma de latências (segundos).
+
+    Args:
+        minimo (float): Limite superior do primeiro balde.
+        maximo (float): Limite a partir do qual tudo cai no balde de estouro.
+        baldes_por_decada (int): Resolução da escala logarítmica.
+    """
+
+    def __init__(
+        self, minimo: float = 0.001, maximo: float = 60.0, baldes_por_decada: int = 10
+    ) -> None:
+        if not 0 < minimo < maximo:
+            raise ValueError("É preciso 0 < minimo < maximo.")
+        decadas = math.log10(maximo / minimo)
+        self.limites = np.geomspace(minimo, maximo, math.ceil(decadas * baldes_por_decada) + 1)
+        self.contagens = np.zeros(len(self.limites) + 1, dtype=np.int64)  # + estouro
+        self.total = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, segundos: float) -> None:
+        """Conta uma medida."""
+        self.contagens[np.searchsorted(self.limites, segundos)] += 1
+        self.total += 1
+        self.soma += segundos
+        self.maximo = max(self.maximo, segundos)
+
+    def percentil(self, p: float) -> float:
+        """
+        Percentil `p` (0–100): limite superior do balde que o contém, sem passar
+        do máximo observado; 0.0 se vazio.
+        """
+        if self.total == 0:
+            return 0.0
+        alvo = max(1, math.ceil(self.total * p / 100.0))
+        balde = int(np.searchsorted(np.cumsum(self.contagens), alvo))
+        if balde >= len(self.limites):
+            return self.maximo
+        return min(float(self.limites[balde]), self.maximo)
+
+    def resumo(self) -> Dict[str, Any]:
+        """Contagem, média, p50/p90/p99, máximo e os baldes não vazios (JSON)."""
+        rotulos = [f"<={limite:.4g}" for limite in self.limites] + ["estouro"]
+        return {
+            "contagem": self.total,
+            "media": self.soma / self.total if self.total else 0.0,
+            "p50": self.percentil(50),
+            "p90": self.percentil(90),
+            "p99": self.percentil(99),
+            "maximo": self.maximo,
+            "baldes": {
+                rotulo: int(contagem)
+                for rotulo, contagem in zip(rotulos, self.contagens)
+                if contagem
+            },
+        }
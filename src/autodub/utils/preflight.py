@@ -0,0 +1,132 @@
+"""
+Planejamento prévio (preflight) de uma execução a partir do ffprobe.
+
+Antes de carregar qualquer modelo, a entrada é inspecionada (fluxos, codec,
+taxa, duração) e vira um plano registrado no relatório:
+
+- Sem fluxo de áudio, a execução é rejeitada na hora, em vez de falhar só
+  depois de carregar Whisper e companhia.
+- Uma entrada que já está no formato dos intermediários (WAV PCM16 ou FLAC,
+  16 kHz, mono, sem outros fluxos) não é recodificada: é ligada por hard link
+  (ou copiada, se estiver em outro disco) no diretório de trabalho.
+- A duração alimenta a estimativa de disco e a divisão de núcleos de um lote.
+
+Funções principais:
+- planejar: plano de uma entrada a partir da sonda (`ffmpeg.probe`).
+- sugerir_paralelismo: trabalhadores e threads para um lote, pelas durações.
+- vincular_ou_copiar: o caminho rápido da extração.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+from autodub.utils.disk_budget import estimar_uso_disco
+from autodub.utils.thread_budget import calcular_alocacao
+
+# Formato dos intermediários → (contêiner, codec) que dispensam a extração
+ENTRADAS_DIRETAS = {"wav": ("wav", "pcm_s16le"), "flac": ("flac", "flac")}
+
+# Duração (s) → threads por vídeo: entradas curtas são dominadas por custo fixo
+# e rendem mais em processos paralelos; longas aproveitam threads intra-op
+THREADS_POR_DURACAO = ((600.0, 1), (3600.0, 2))
+THREADS_VIDEO_LONGO = 4
+
+
+def planejar(
+    sonda: Dict[str, Any], formato_intermediario: str = "wav", sample_rate: int = 16000
+) -> Dict[str, Any]:
+    """
+    Monta o plano de uma entrada.
+
+    Args:
+        sonda (Dict): Saída de `ffmpeg.probe` (`formato`, `duracao`, `fluxos`).
+        formato_intermediario (str): Formato do áudio extraído ("wav" ou "flac").
+        sample_rate (int): Taxa esperada pelo ASR.
+
+    Returns:
+        Dict: `{"duracao", "fluxos": {tipo: quantidade}, "audio": {"codec",
+        "taxa", "canais"}, "extracao": "direta" | "ffmpeg",
+        "estimativa_disco_bytes"}`.
+
+    Raises:
+        ValueError: Se a entrada não tiver fluxo de áudio.
+    """
+    fluxos = sonda.get("fluxos", [])
+    audios = [fluxo for fluxo in fluxos if fluxo.get("tipo") == "audio"]
+    if not audios:
+        raise ValueError("A entrada não tem fluxo de áudio para dublar.")
+    audio = audios[0]
+
+    contagem: Dict[str, int] = {}
+    for fluxo in fluxos:
+        tipo = fluxo.get("tipo") or "desconhecido"
+        contagem[tipo] = contagem.get(tipo, 0) + 1
+
+    conteiner, codec = ENTRADAS_DIRETAS.get(formato_intermediario, (None, None))
+    direta = (
+        len(fluxos) == 1
+        and sonda.get("formato") == conteiner
+        and audio.get("codec") == codec
+        and audio.get("taxa") == sample_rate
+        and audio.get("canais") == 1
+    )
+    duracao = sonda.get("duracao")
+    return {
+        "duracao": duracao,
+        "fluxos": contagem,
+        "audio": {chave: audio.get(chave) for chave in ("codec", "taxa", "canais")},
+        "extracao": "direta" if direta else "ffmpeg",
+        "estimativa_disco_bytes": (
+            estimar_uso_disco(duracao, sample_rate) if duracao is not None else None
+        ),
+    }
+
+
+def threads_para_duracao(duracao: Optional[float]) -> int:
+    """Threads por vídeo sugeridas para uma duração (desconhecida = longa)."""
+    if duracao is not None:
+        for limite, threads in THREADS_POR_DURACAO:
+            if duracao < limite:
+                return threads
+    return THREADS_VIDEO_LONGO
+
+
+def sugerir_paralelismo(
+    duracoes: Sequence[Optional[float]], nucleos: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Divide os núcleos de um lote conforme a duração dos vídeos.
+
+    Vários vídeos curtos → um trabalhador por núcleo; vídeos longos → menos
+    trabalhadores, cada um com mais threads. O vídeo mais longo do lote define
+    as threads desejadas.
+
+    Returns:
+        Dict: Saída de `calcular_alocacao` (`nucleos_totais`, `trabalhadores`,
+        `threads_por_trabalhador`).
+    """
+    total = nucleos if nucleos is not None else (os.cpu_count() or 1)
+    threads = max((threads_para_duracao(duracao) for duracao in duracoes), default=1)
+    trabalhadores = max(1, min(len(duracoes), total // threads))
+    return calcular_alocacao(total, trabalhadores)
+
+
+def vincular_ou_copiar(origem: Union[str, Path], destino: Union[str, Path]) -> str:
+    """
+    Coloca `origem` em `destino` sem recodificar.
+
+    Returns:
+        str: "vinculo" (hard link) ou "copia" (outro disco, ou links indisponíveis).
+    """
+    destino = Path(destino)
+    destino.unlink(missing_ok=True)
+    try:
+        os.link(origem, destino)
+        return "vinculo"
+    except OSError:
+        shutil.copyfile(origem, destino)
+        return "copia"
@@ -0,0 +1,66 @@
+"""
+Relatório de progresso com limite de frequência.
+
+Em vez de uma linha de log por segmento, os eventos são contados e resumidos
+periodicamente ("Sintetizando: 120/4000 segmentos, 35.2/s"), o que mantém o
+log legível e barato mesmo com milhares de segmentos e vários trabalhadores.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Optional
+
+
+class RelatorProgresso:
+    """
+    Agrega eventos por segmento em resumos periódicos no log.
+
+    Args:
+        logger (logging.Logger): Logger onde os resumos são emitidos (nível INFO).
+        etapa (str): Nome da etapa (ex.: "Sintetizando").
+        total (int, opcional): Total esperado de itens, se conhecido.
+        intervalo_segundos (float): Intervalo mínimo entre dois resumos.
+        relogio (Callable[[], float]): Fonte de tempo (injetável em testes).
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        etapa: str,
+        total: Optional[int] = None,
+        intervalo_segundos: float = 5.0,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.logger = logger
+        self.etapa = etapa
+        self.total = total
+        self.intervalo_segundos = intervalo_segundos
+        self.relogio = relogio
+        self.concluidos = 0
+        self.resumos_emitidos = 0
+        self._inicio = relogio()
+        self._ultimo_resumo = self._inicio
+
+    def _resumo(self, agora: float) -> str:
+        decorrido = agora - self._inicio
+        taxa = self.concluidos / decorrido if decorrido > 0 else 0.0
+        feitos = (
+            f"{self.concluidos}/{self.total}" if self.total is not None else self.concluidos
+        )
+        return f"{self.etapa}: {feitos} segmentos ({taxa:.1f}/s)"
+
+    def avancar(self, quantidade: int = 1) -> None:
+        """Conta itens concluídos; emite um resumo se o intervalo já passou."""
+        self.concluidos += quantidade
+        agora = self.relogio()
+        if agora - self._ultimo_resumo >= self.intervalo_segundos:
+            self._ultimo_resumo = agora
+            self.resumos_emitidos += 1
+            self.logger.info(self._resumo(agora))
+
+    def concluir(self) -> None:
+        """Emite o resumo final da etapa."""
+        self.resumos_emitidos += 1
+        self.logger.info(self._resumo(self.relogio()))
@@ -0,0 +1,178 @@
+"""
+Ressegmentação dos segmentos do ASR antes da tradução e da síntese.
+
+O Whisper costuma emitir fragmentos muito curtos (uma ou duas palavras), e cada
+segmento custa uma chamada ao tradutor, uma ao TTS e um arquivo WAV. Esta etapa
+junta fragmentos vizinhos próximos e divide segmentos longos demais nos sinais
+de pontuação, sem inventar limites de tempo: um segmento unido vai do `inicio`
+do primeiro fragmento ao `fim` do último.
+
+Funções principais:
+- Ressegmentador.ressegmentar: devolve a nova `TabelaSegmentos`.
+- Ressegmentador.ultimo_resumo: contagens da última execução (para o relatório).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from autodub.utils.segment_table import SEM_LOCUTOR, TabelaSegmentos
+from autodub.utils.text_processing import inserir_pontuacao, normalizar_texto
+
+# Pontos de corte: depois de pontuação seguida de espaço
+_FIM_DE_FRASE = re.compile(r"(?<=[.!?;:,])\s+")
+
+
+def _contar_palavras(texto: str) -> int:
+    return len(normalizar_texto(texto).split())
+
+
+class Ressegmentador:
+    """
+    Junta fragmentos curtos e divide segmentos longos.
+
+    Dois segmentos vizinhos são unidos quando a pausa entre eles é de no máximo
+    `max_lacuna` segundos, pelo menos um deles tem menos de `min_palavras`
+    palavras, o resultado não passa de `max_palavras` nem de `max_duracao`
+    segundos, e os locutores (quando conhecidos) são os mesmos.
+
+    Segmentos com mais de `max_palavras` palavras são divididos na pontuação;
+    o tempo de cada parte é proporcional ao seu número de caracteres, e as
+    extremidades continuam sendo o `inicio`/`fim` originais.
+
+    Args:
+        max_lacuna (float): Pausa máxima (s) entre fragmentos unidos.
+        min_palavras (int): Abaixo disso, um segmento é considerado fragmento.
+        max_palavras (int): Tamanho máximo de um segmento, em palavras.
+        max_duracao (float): Duração máxima (s) de um segmento unido.
+        pontuar (bool): Se True, aplica `inserir_pontuacao` ao texto final.
+    """
+
+    def __init__(
+        self,
+        max_lacuna: float = 0.5,
+        min_palavras: int = 4,
+        max_palavras: int = 40,
+        max_duracao: float = 15.0,
+        pontuar: bool = True,
+    ) -> None:
+        if min_palavras < 1 or max_palavras < min_palavras:
+            raise ValueError("Use 1 <= min_palavras <= max_palavras.")
+        self.max_lacuna = max_lacuna
+        self.min_palavras = min_palavras
+        self.max_palavras = max_palavras
+        self.max_duracao = max_duracao
+        self.pontuar = pontuar
+        self.ultimo_resumo: Dict[str, int] = {}
+
+    def _agrupar(self, tabela: TabelaSegmentos, palavras: np.ndarray) -> List[Tuple[int, int]]:
+        """Intervalos [i, j) de segmentos consecutivos que serão unidos."""
+        lacunas = tabela.lacunas()
+        locutor = tabela.locutor.tolist()
+        grupos = []
+        inicio_grupo, palavras_grupo = 0, int(palavras[0]) if len(palavras) else 0
+        # Locutor conhecido do grupo: um fragmento sem locutor no meio não pode
+        # servir de ponte entre dois locutores conhecidos diferentes
+        locutor_grupo = locutor[0] if locutor else SEM_LOCUTOR
+
+        for j in range(1, len(tabela)):
+            mesmo_locutor = (
+                locutor[j] == SEM_LOCUTOR
+                or locutor_grupo == SEM_LOCUTOR
+                or locutor[j] == locutor_grupo
+            )
+            unir = (
+                mesmo_locutor
+                and lacunas[j - 1] <= self.max_lacuna
+                and (palavras_grupo < self.min_palavras or palavras[j] < self.min_palavras)
+                and palavras_grupo + palavras[j] <= self.max_palavras
+                and tabela.fim[j] - tabela.inicio[inicio_grupo] <= self.max_duracao
+            )
+            if unir:
+                palavras_grupo += int(palavras[j])
+                if locutor_grupo == SEM_LOCUTOR:
+                    locutor_grupo = locutor[j]
+            else:
+                grupos.append((inicio_grupo, j))
+                inicio_grupo, palavras_grupo = j, int(palavras[j])
+                locutor_grupo = locutor[j]
+
+        if len(tabela):
+            grupos.append((inicio_grupo, len(tabela)))
+        return grupos
+
+    def _dividir(self, texto: str, inicio: float, fim: float) -> List[Tuple[str, float, float]]:
+        """Divide um texto longo na pontuação, repartindo o tempo por caracteres."""
+        if _contar_palavras(texto) <= self.max_palavras:
+            return [(texto, inicio, fim)]
+
+        partes: List[str] = []
+        for frase in _FIM_DE_FRASE.split(texto.strip()):
+            if partes and _contar_palavras(partes[-1]) + _contar_palavras(frase) <= (
+                self.max_palavras
+            ):
+                partes[-1] = f"{partes[-1]} {frase}"
+            else:
+                partes.append(frase)
+
+        if len(partes) == 1:
+            return [(texto, inicio, fim)]
+
+        caracteres = np.cumsum([0] + [len(parte) for parte in partes], dtype=np.float64)
+        cortes = inicio + (fim - inicio) * caracteres / caracteres[-1]
+        cortes[0], cortes[-1] = inicio, fim  # extremidades exatamente as originais
+        return [
+            (parte, float(cortes[k]), float(cortes[k + 1])) for k, parte in enumerate(partes)
+        ]
+
+    def ressegmentar(self, segmentos) -> TabelaSegmentos:
+        """
+        Aplica as regras de união e divisão.
+
+        Args:
+            segmentos (TabelaSegmentos | List[Dict]): Segmentos do ASR.
+
+        Returns:
+            TabelaSegmentos: Novos segmentos (colunas `texto`, `inicio`, `fim` e
+            `locutor`, quando conhecido).
+        """
+        tabela = TabelaSegmentos.de_segmentos(segmentos)
+        textos = [texto or "" for texto in tabela.textos("texto")]
+        palavras = np.fromiter(
+            (_contar_palavras(texto) for texto in textos), dtype=np.int64, count=len(textos)
+        )
+
+        grupos = self._agrupar(tabela, palavras)
+        novos_textos, novos_inicios, novos_fins, novos_locutores = [], [], [], []
+        divisoes = 0
+
+        for i, j in grupos:
+            texto = " ".join(t.strip() for t in textos[i:j] if t.strip())
+            conhecidos = tabela.locutor[i:j][tabela.locutor[i:j] != SEM_LOCUTOR]
+            locutor_do_grupo = int(conhecidos[0]) if len(conhecidos) else SEM_LOCUTOR
+            partes = self._dividir(texto, tabela.inicio[i], tabela.fim[j - 1])
+            divisoes += len(partes) - 1
+            for parte, inicio, fim in partes:
+                novos_textos.append(inserir_pontuacao(parte) if self.pontuar else parte)
+                novos_inicios.append(inicio)
+                novos_fins.append(fim)
+                novos_locutores.append(locutor_do_grupo)
+
+        resultado = TabelaSegmentos(
+            inicio=novos_inicios,
+            fim=novos_fins,
+            textos={"texto": novos_textos},
+            locutor=novos_locutores,
+            rotulos_locutor=tabela.rotulos_locutor,
+        )
+
+        self.ultimo_resumo = {
+            "segmentos_entrada": len(tabela),
+            "segmentos_saida": len(resultado),
+            "fusoes": len(tabela) - len(grupos),
+            "divisoes": divisoes,
+        }
+        return resultado
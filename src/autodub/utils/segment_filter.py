@@ -0,0 +1,146 @@
+"""
+Filtro de segmentos sem fala e de alucinações do ASR.
+
+O Whisper transcreve trechos só de música e produz laços de repetição
+("Thank you. Thank you. Thank you."). Traduzir e sintetizar esses segmentos
+custa tempo de modelo e depois exige remoção manual. Este filtro usa as
+métricas por segmento do Whisper (`no_speech_prob`, `avg_logprob`,
+`compression_ratio`) para descartar ou colapsar esses segmentos antes da
+tradução e da síntese.
+
+Funções principais:
+- FiltroSegmentos.filtrar: devolve a tabela filtrada.
+- FiltroSegmentos.ultimos_ignorados: o que foi descartado/colapsado e por quê.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List
+
+import numpy as np
+
+from autodub.utils.segment_table import SEM_LOCUTOR, TabelaSegmentos
+from autodub.utils.text_processing import normalizar_texto
+
+_FRASES = re.compile(r"(?<=[.!?])\s+")
+
+
+def colapsar_repeticoes(texto: str) -> str:
+    """Remove frases repetidas em sequência ("Obrigado. Obrigado." → "Obrigado.")."""
+    frases = [frase for frase in _FRASES.split(texto.strip()) if frase]
+    mantidas: List[str] = []
+    for frase in frases:
+        if not mantidas or normalizar_texto(frase) != normalizar_texto(mantidas[-1]):
+            mantidas.append(frase)
+    return " ".join(mantidas)
+
+
+class FiltroSegmentos:
+    """
+    Descarta segmentos sem fala e colapsa repetições.
+
+    Regras (métricas ausentes nunca descartam um segmento):
+    - "sem_fala": `no_speech_prob > max_no_speech_prob` e
+      `avg_logprob < min_avg_logprob` (mesmo critério do Whisper).
+    - "repeticao_interna": `compression_ratio > max_compression_ratio`; as frases
+      repetidas são colapsadas. Sem repetição a colapsar, o segmento é
+      descartado como "alucinacao".
+    - "repeticao": segmento com o mesmo texto normalizado do anterior mantido,
+      do mesmo locutor (ou sem locutor) e a no máximo `max_lacuna_repeticao`
+      segundos dele; é absorvido pelo anterior (o `fim` do anterior é
+      estendido). Com sinal de alucinação (`compression_ratio` ou
+      `no_speech_prob` acima dos limites), a cópia é descartada mesmo longe ou
+      de outro locutor, mas sem estender o anterior. Fora desses casos, falas
+      iguais ("Não." / "Não.") são diálogo legítimo e ficam.
+    - "vazio": segmento sem texto.
+
+    Args:
+        max_no_speech_prob (float): Limite de `no_speech_prob`.
+        min_avg_logprob (float): Limite de `avg_logprob`.
+        max_compression_ratio (float): Limite de `compression_ratio`.
+        max_lacuna_repeticao (float): Lacuna máxima (s) para absorver uma repetição.
+    """
+
+    def __init__(
+        self,
+        max_no_speech_prob: float = 0.6,
+        min_avg_logprob: float = -1.0,
+        max_compression_ratio: float = 2.4,
+        max_lacuna_repeticao: float = 0.5,
+    ) -> None:
+        self.max_no_speech_prob = max_no_speech_prob
+        self.min_avg_logprob = min_avg_logprob
+        self.max_compression_ratio = max_compression_ratio
+        self.max_lacuna_repeticao = max_lacuna_repeticao
+        self.ultimos_ignorados: List[Dict] = []
+
+    def filtrar(self, segmentos) -> TabelaSegmentos:
+        """
+        Aplica as regras e devolve a nova tabela.
+
+        Args:
+            segmentos (TabelaSegmentos | List[Dict]): Segmentos do ASR.
+
+        Returns:
+            TabelaSegmentos: Segmentos mantidos (textos colapsados quando aplicável).
+        """
+        tabela = TabelaSegmentos.de_segmentos(segmentos).copia()
+        textos = [texto or "" for texto in tabela.textos("texto")]
+        motivos: List[str] = [""] * len(tabela)
+
+        # Comparações com NaN são falsas: métricas ausentes não descartam nada
+        with np.errstate(invalid="ignore"):
+            sem_fala = (tabela.numerica("no_speech_prob") > self.max_no_speech_prob) & (
+                tabela.numerica("avg_logprob") < self.min_avg_logprob
+            )
+            repetitivo = tabela.numerica("compression_ratio") > self.max_compression_ratio
+            suspeito = repetitivo | (
+                tabela.numerica("no_speech_prob") > self.max_no_speech_prob
+            )
+
+        for i in np.flatnonzero(repetitivo & ~sem_fala):
+            colapsado = colapsar_repeticoes(textos[i])
+            if colapsado == textos[i].strip():
+                motivos[i] = "alucinacao"
+            else:
+                textos[i] = colapsado
+                tabela[int(i)]["texto"] = colapsado
+                motivos[i] = "repeticao_interna"
+
+        for i in np.flatnonzero(sem_fala):
+            motivos[i] = "sem_fala"
+
+        mantidos: List[int] = []
+        for i, texto in enumerate(textos):
+            if motivos[i] in ("sem_fala", "alucinacao"):
+                continue
+            if not texto.strip():
+                motivos[i] = "vazio"
+            elif mantidos and normalizar_texto(texto) == normalizar_texto(textos[mantidos[-1]]):
+                anterior = mantidos[-1]
+                vizinho = tabela.inicio[i] - tabela.fim[anterior] <= self.max_lacuna_repeticao
+                locutores = (tabela.locutor[i], tabela.locutor[anterior])
+                mesmo_locutor = locutores[0] == locutores[1] or SEM_LOCUTOR in locutores
+                if vizinho and mesmo_locutor:
+                    tabela.fim[anterior] = max(tabela.fim[anterior], tabela.fim[i])
+                    motivos[i] = "repeticao"
+                elif suspeito[i]:
+                    motivos[i] = "repeticao"
+                else:
+                    mantidos.append(i)
+            else:
+                mantidos.append(i)
+
+        self.ultimos_ignorados = [
+            {
+                "indice": i,
+                "inicio": float(tabela.inicio[i]),
+                "fim": float(tabela.fim[i]),
+                "texto": textos[i],
+                "motivo": motivo,
+            }
+            for i, motivo in enumerate(motivos)
+            if motivo
+        ]
+        return tabela.selecionar(np.asarray(mantidos, dtype=np.int64))
@@ -0,0 +1,505 @@
+"""
+Tabela colunar de segmentos (substitui a lista de dicts por segmento).
+
+Cada coluna numérica (`inicio`, `fim`, `locutor`, métricas do ASR...) é um array
+NumPy, e as colunas de texto (`texto`, `texto_traduzido`...) guardam códigos
+para um vocabulário compartilhado de strings internadas — textos repetidos
+ocupam memória uma única vez.
+
+O que não cabe nessas colunas (listas como as `words` do Whisper, dicts, ou
+colunas que misturam texto e número) fica numa coluna de objetos, uma lista
+Python com os valores originais. Locutores com rótulo em texto ("SPEAKER_00")
+viram índices numa tabela de rótulos (`rotulos_locutor`), e a coluna `locutor`
+continua um array de inteiros.
+
+Compatibilidade: iterar a tabela ou indexá-la com um inteiro devolve uma
+`LinhaSegmento`, que se comporta como o dict antigo (`seg["texto"]`,
+`seg.get("texto_traduzido")`, `seg["x"] = ...`, `dict(seg)`).
+
+Funções principais:
+- TabelaSegmentos.de_segmentos / para_dicts: conversão de/para lista de dicts.
+- lacunas / sobreposicoes / sobrepoe_intervalo: consultas de tempo vetorizadas.
+- salvar_jsonl / carregar_jsonl e salvar_npz / carregar_npz: serialização.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+SEM_LOCUTOR = -1
+SEM_TEXTO = -1
+
+
+def _tipo_coluna(valor) -> type:
+    """str → texto; números e booleanos → float; o resto → object."""
+    if isinstance(valor, str):
+        return str
+    if isinstance(valor, (int, float, np.number)):
+        return float
+    return object
+
+
+def _tipo_numerico(valor) -> type:
+    """Tipo Python devolvido ao ler um valor numérico: bool, int ou float."""
+    if isinstance(valor, (bool, np.bool_)):
+        return bool
+    if isinstance(valor, (int, np.integer)):
+        return int
+    return float
+
+
+class LinhaSegmento(MutableMapping):
+    """Visão de uma linha da tabela com a interface de um dict."""
+
+    __slots__ = ("_tabela", "_indice")
+
+    def __init__(self, tabela: "TabelaSegmentos", indice: int) -> None:
+        self._tabela = tabela
+        self._indice = indice
+
+    def __getitem__(self, chave: str):
+        return self._tabela._valor(chave, self._indice)
+
+    def __setitem__(self, chave: str, valor) -> None:
+        self._tabela._definir_valor(chave, self._indice, valor)
+
+    def __delitem__(self, chave: str) -> None:
+        self._tabela._definir_valor(chave, self._indice, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tabela._chaves_presentes(self._indice))
+
+    def __len__(self) -> int:
+        return len(self._tabela._chaves_presentes(self._indice))
+
+    def __repr__(self) -> str:
+        return f"LinhaSegmento({dict(self)!r})"
+
+
+class TabelaSegmentos:
+    """
+    Segmentos de fala em formato colunar.
+
+    Args:
+        inicio (Sequence[float]): Início de cada segmento, em segundos.
+        fim (Sequence[float]): Fim de cada segmento, em segundos.
+        textos (Dict[str, Sequence[Optional[str]]], opcional): Colunas de texto.
+        numericas (Dict[str, Sequence[float]], opcional): Colunas numéricas extras
+            (NaN = ausente).
+        locutor (Sequence[int], opcional): Índice do locutor (-1 = desconhecido).
+        rotulos_locutor (Sequence, opcional): Rótulo de cada índice de locutor
+            (ex.: ["SPEAKER_00", "SPEAKER_01"]); sem ele, o locutor é o índice.
+    """
+
+    def __init__(
+        self,
+        inicio: Sequence[float] = (),
+        fim: Sequence[float] = (),
+        textos: Optional[Dict[str, Sequence[Optional[str]]]] = None,
+        numericas: Optional[Dict[str, Sequence[float]]] = None,
+        locutor: Optional[Sequence[int]] = None,
+        rotulos_locutor: Optional[Sequence[Any]] = None,
+    ) -> None:
+        self.inicio = np.asarray(inicio, dtype=np.float64).copy()
+        self.fim = np.asarray(fim, dtype=np.float64).copy()
+        if self.inicio.shape != self.fim.shape or self.inicio.ndim != 1:
+            raise ValueError("inicio e fim devem ser vetores do mesmo tamanho.")
+
+        tamanho = len(self.inicio)
+        self.locutor = (
+            np.full(tamanho, SEM_LOCUTOR, dtype=np.int32)
+            if locutor is None
+            else np.asarray(locutor, dtype=np.int32).copy()
+        )
+        self._vocabulario: List[str] = []
+        self._codigos: Dict[str, int] = {}
+        self._textos: Dict[str, np.ndarray] = {}
+        self._numericas: Dict[str, np.ndarray] = {}
+        # Colunas numéricas só de inteiros ou só de booleanos (ausente = float)
+        self._tipos_numericos: Dict[str, type] = {}
+        self._objetos: Dict[str, List[Any]] = {}
+        self.rotulos_locutor: Optional[List[Any]] = (
+            None if rotulos_locutor is None else list(rotulos_locutor)
+        )
+        self._ordem: List[str] = []
+
+        for nome, valores in (textos or {}).items():
+            self.definir_coluna_texto(nome, valores)
+        self._ordem += ["inicio", "fim"]
+        if (self.locutor != SEM_LOCUTOR).any():
+            self._ordem.append("locutor")
+        for nome, valores in (numericas or {}).items():
+            self.definir_coluna_numerica(nome, valores)
+
+    # ------------------------------------------------------------------
+    # Construção e conversão
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def de_dicts(cls, segmentos: Iterable[Mapping]) -> "TabelaSegmentos":
+        """
+        Cria a tabela a partir de dicts no formato antigo.
+
+        Strings viram colunas de texto; números e booleanos viram colunas
+        numéricas (colunas só de inteiros ou só de booleanos voltam como int ou
+        bool na leitura); chaves ausentes ou None ficam vazias naquela linha. Outros
+        valores (listas, dicts) e colunas que misturam texto e número viram
+        colunas de objetos. Locutores em texto passam pela tabela de rótulos.
+        """
+        segmentos = list(segmentos)
+        tabela = cls(
+            inicio=[float(segmento.get("inicio", 0.0)) for segmento in segmentos],
+            fim=[float(segmento.get("fim", 0.0)) for segmento in segmentos],
+        )
+        tipos: Dict[str, set] = {}
+        for segmento in segmentos:
+            for chave, valor in segmento.items():
+                if chave in ("inicio", "fim") or valor is None:
+                    continue
+                tipos.setdefault(chave, set()).add(_tipo_coluna(valor))
+
+        for chave, tipos_chave in tipos.items():
+            valores = [segmento.get(chave) for segmento in segmentos]
+            if chave == "locutor":
+                for indice, valor in enumerate(valores):
+                    tabela._definir_locutor(indice, valor)
+            elif tipos_chave == {str}:
+                tabela.definir_coluna_texto(chave, valores)
+            elif tipos_chave == {float}:
+                tipos_python = {_tipo_numerico(v) for v in valores if v is not None}
+                tabela.definir_coluna_numerica(
+                    chave,
+                    [np.nan if v is None else float(v) for v in valores],
+                    tipo=tipos_python.pop() if len(tipos_python) == 1 else float,
+                )
+            else:
+                tabela.definir_coluna_objetos(chave, valores)
+
+        # Mantém a ordem original das chaves (ex.: texto, inicio, fim, ...)
+        if segmentos:
+            primeiras = [chave for chave in segmentos[0] if chave in tabela._ordem]
+            tabela._ordem = primeiras + [c for c in tabela._ordem if c not in primeiras]
+        return tabela
+
+    @classmethod
+    def de_segmentos(
+        cls, segmentos: Union["TabelaSegmentos", Iterable[Mapping]]
+    ) -> "TabelaSegmentos":
+        """Aceita uma tabela (devolvida como está) ou uma lista de dicts."""
+        if isinstance(segmentos, TabelaSegmentos):
+            return segmentos
+        return cls.de_dicts(segmentos)
+
+    def para_dicts(self) -> List[Dict]:
+        """Converte a tabela para a lista de dicts do formato antigo."""
+        return [dict(linha) for linha in self]
+
+    def copia(self) -> "TabelaSegmentos":
+        """Cópia independente (arrays copiados, vocabulário compartilhado por valor)."""
+        return self.selecionar(np.arange(len(self)))
+
+    def selecionar(self, indices: Union[Sequence[int], np.ndarray]) -> "TabelaSegmentos":
+        """
+        Nova tabela com as linhas indicadas (índices ou máscara booleana).
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+
+        nova = TabelaSegmentos(
+            self.inicio[indices], self.fim[indices], rotulos_locutor=self.rotulos_locutor
+        )
+        nova.locutor = self.locutor[indices].copy()
+        nova._vocabulario = list(self._vocabulario)
+        nova._codigos = dict(self._codigos)
+        nova._textos = {nome: codigos[indices] for nome, codigos in self._textos.items()}
+        nova._numericas = {nome: valores[indices] for nome, valores in self._numericas.items()}
+        nova._tipos_numericos = dict(self._tipos_numericos)
+        nova._objetos = {
+            nome: [valores[i] for i in indices.tolist()]
+            for nome, valores in self._objetos.items()
+        }
+        nova._ordem = list(self._ordem)
+        return nova
+
+    # ------------------------------------------------------------------
+    # Colunas
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.inicio)
+
+    def __iter__(self) -> Iterator[LinhaSegmento]:
+        return (LinhaSegmento(self, indice) for indice in range(len(self)))
+
+    def __getitem__(self, indice: int) -> LinhaSegmento:
+        if not -len(self) <= indice < len(self):
+            raise IndexError("índice de segmento fora da tabela")
+        return LinhaSegmento(self, indice % len(self))
+
+    def __repr__(self) -> str:
+        return f"TabelaSegmentos({len(self)} segmentos, colunas={self.colunas})"
+
+    @property
+    def colunas(self) -> List[str]:
+        """Nomes das colunas, na ordem usada pelos dicts."""
+        return list(self._ordem)
+
+    @property
+    def duracao(self) -> np.ndarray:
+        """Duração de cada segmento (`fim - inicio`)."""
+        return self.fim - self.inicio
+
+    def _internar(self, texto: Optional[str]) -> int:
+        if texto is None:
+            return SEM_TEXTO
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            codigo = len(self._vocabulario)
+            self._codigos[texto] = codigo
+            self._vocabulario.append(texto)
+        return codigo
+
+    def definir_coluna_texto(self, nome: str, valores: Sequence[Optional[str]]) -> None:
+        """Cria ou substitui uma coluna de texto (None = ausente)."""
+        if len(valores) != len(self):
+            raise ValueError(f"Coluna '{nome}' com {len(valores)} valores para {len(self)}.")
+        self._textos[nome] = np.fromiter(
+            (self._internar(valor) for valor in valores), dtype=np.int32, count=len(self)
+        )
+        if nome not in self._ordem:
+            self._ordem.append(nome)
+
+    def definir_coluna_numerica(
+        self, nome: str, valores: Sequence[float], tipo: type = float
+    ) -> None:
+        """
+        Cria ou substitui uma coluna numérica (NaN = ausente).
+
+        `tipo` (float, int ou bool) é o tipo devolvido ao ler cada valor; o
+        array continua `float64` para poder marcar ausências com NaN.
+        """
+        array = np.asarray(valores, dtype=np.float64).copy()
+        if array.shape != (len(self),):
+            raise ValueError(f"Coluna '{nome}' com formato {array.shape} para {len(self)}.")
+        self._numericas[nome] = array
+        if tipo is float:
+            self._tipos_numericos.pop(nome, None)
+        else:
+            self._tipos_numericos[nome] = tipo
+        if nome not in self._ordem:
+            self._ordem.append(nome)
+
+    def definir_coluna_objetos(self, nome: str, valores: Sequence[Any]) -> None:
+        """Cria ou substitui uma coluna de objetos (None = ausente)."""
+        if len(valores) != len(self):
+            raise ValueError(f"Coluna '{nome}' com {len(valores)} valores para {len(self)}.")
+        self._textos.pop(nome, None)
+        self._numericas.pop(nome, None)
+        self._tipos_numericos.pop(nome, None)
+        self._objetos[nome] = list(valores)
+        if nome not in self._ordem:
+            self._ordem.append(nome)
+
+    def objetos(self, nome: str) -> List[Any]:
+        """Valores de uma coluna de objetos (None onde ausente)."""
+        return list(self._objetos.get(nome, [None] * len(self)))
+
+    def textos(self, nome: str) -> List[Optional[str]]:
+        """Valores de uma coluna de texto (None onde ausente)."""
+        if nome not in self._textos:
+            return [None] * len(self)
+        vocabulario = self._vocabulario
+        return [vocabulario[c] if c != SEM_TEXTO else None for c in self._textos[nome].tolist()]
+
+    def numerica(self, nome: str) -> np.ndarray:
+        """Valores de uma coluna numérica (NaN onde ausente)."""
+        if nome in ("inicio", "fim"):
+            return getattr(self, nome)
+        if nome not in self._numericas:
+            return np.full(len(self), np.nan)
+        return self._numericas[nome]
+
+    def _valor(self, chave: str, indice: int):
+        if chave in ("inicio", "fim"):
+            return float(getattr(self, chave)[indice])
+        if chave == "locutor" and self.locutor[indice] != SEM_LOCUTOR:
+            codigo = int(self.locutor[indice])
+            return codigo if self.rotulos_locutor is None else self.rotulos_locutor[codigo]
+        if chave in self._objetos and self._objetos[chave][indice] is not None:
+            return self._objetos[chave][indice]
+        if chave in self._textos and self._textos[chave][indice] != SEM_TEXTO:
+            return self._vocabulario[self._textos[chave][indice]]
+        if chave in self._numericas and not np.isnan(self._numericas[chave][indice]):
+            tipo = self._tipos_numericos.get(chave, float)
+            return tipo(self._numericas[chave][indice])
+        raise KeyError(chave)
+
+    def _definir_valor(self, chave: str, indice: int, valor) -> None:
+        if chave in ("inicio", "fim"):
+            getattr(self, chave)[indice] = valor
+        elif chave == "locutor":
+            self._definir_locutor(indice, valor)
+        elif chave in self._objetos:
+            self._objetos[chave][indice] = valor
+        elif valor is not None and (
+            _tipo_coluna(valor) is object
+            or (chave in self._textos and not isinstance(valor, str))
+            or (chave in self._numericas and isinstance(valor, str))
+        ):
+            # Tipo novo para a coluna: ela passa a guardar os valores originais
+            self.definir_coluna_objetos(
+                chave, [self._linha(chave, i) for i in range(len(self))]
+            )
+            self._objetos[chave][indice] = valor
+        elif isinstance(valor, str) or (valor is None and chave in self._textos):
+            if chave not in self._textos:
+                self.definir_coluna_texto(chave, [None] * len(self))
+            self._textos[chave][indice] = self._internar(valor)
+        elif valor is None:
+            if chave in self._numericas:
+                self._numericas[chave][indice] = np.nan
+        else:
+            tipo = _tipo_numerico(valor)
+            if chave not in self._numericas:
+                self.definir_coluna_numerica(chave, np.full(len(self), np.nan), tipo=tipo)
+            elif self._tipos_numericos.get(chave, float) is not tipo:
+                # Valores de tipos diferentes: a coluna volta a ser lida como float
+                self._tipos_numericos.pop(chave, None)
+            self._numericas[chave][indice] = float(valor)
+
+    def _linha(self, chave: str, indice: int):
+        try:
+            return self._valor(chave, indice)
+        except KeyError:
+            return None
+
+    def _definir_locutor(self, indice: int, valor) -> None:
+        """Inteiros são o próprio índice; outros rótulos passam pela tabela de rótulos."""
+        if valor is None:
+            self.locutor[indice] = SEM_LOCUTOR
+        elif self.rotulos_locutor is None and _tipo_coluna(valor) is float:
+            self.locutor[indice] = int(valor)
+        else:
+            if self.rotulos_locutor is None:
+                # Índices já gravados continuam valendo como rótulos de si mesmos
+                self.rotulos_locutor = list(range(int(self.locutor.max(initial=-1)) + 1))
+            if valor not in self.rotulos_locutor:
+                self.rotulos_locutor.append(valor)
+            self.locutor[indice] = self.rotulos_locutor.index(valor)
+        if "locutor" not in self._ordem:
+            self._ordem.append("locutor")
+
+    def _chaves_presentes(self, indice: int) -> List[str]:
+        presentes = []
+        for chave in self._ordem:
+            if chave in ("inicio", "fim"):
+                presentes.append(chave)
+            elif chave == "locutor":
+                if self.locutor[indice] != SEM_LOCUTOR:
+                    presentes.append(chave)
+            elif chave in self._textos:
+                if self._textos[chave][indice] != SEM_TEXTO:
+                    presentes.append(chave)
+            elif chave in self._objetos:
+                if self._objetos[chave][indice] is not None:
+                    presentes.append(chave)
+            elif not np.isnan(self._numericas[chave][indice]):
+                presentes.append(chave)
+        return presentes
+
+    # ------------------------------------------------------------------
+    # Consultas de tempo (vetorizadas)
+    # ------------------------------------------------------------------
+
+    def lacunas(self) -> np.ndarray:
+        """Intervalo entre o fim de cada segmento e o início do seguinte (n - 1 valores)."""
+        return self.inicio[1:] - self.fim[:-1]
+
+    def sobreposicoes(self) -> np.ndarray:
+        """Índices `i` em que o segmento `i + 1` começa antes de `i` terminar."""
+        return np.flatnonzero(self.lacunas() < 0)
+
+    def sobrepoe_intervalo(self, inicio: float, fim: float) -> np.ndarray:
+        """Máscara dos segmentos que têm alguma interseção com `[inicio, fim)`."""
+        return (self.inicio < fim) & (self.fim > inicio)
+
+    # ------------------------------------------------------------------
+    # Serialização
+    # ------------------------------------------------------------------
+
+    def salvar_jsonl(self, caminho: Union[str, Path]) -> None:
+        """Grava um segmento por linha (mesmo formato de `transcricao.jsonl`)."""
+        with open(caminho, "w", encoding="utf-8") as f:
+            for linha in self:
+                f.write(json.dumps(dict(linha), ensure_ascii=False) + "\n")
+
+    @classmethod
+    def carregar_jsonl(cls, caminho: Union[str, Path]) -> "TabelaSegmentos":
+        """Lê um arquivo JSONL de segmentos."""
+        with open(caminho, "r", encoding="utf-8") as f:
+            return cls.de_dicts(json.loads(linha) for linha in f if linha.strip())
+
+    def salvar_npz(self, caminho: Union[str, Path]) -> None:
+        """Grava a tabela em formato binário `.npz` (sem pickle)."""
+        arrays = {
+            "inicio": self.inicio,
+            "fim": self.fim,
+            "locutor": self.locutor,
+            "vocabulario": np.array(self._vocabulario, dtype=str),
+            "ordem": np.array(self._ordem, dtype=str),
+        }
+        arrays.update({f"texto__{nome}": codigos for nome, codigos in self._textos.items()})
+        arrays.update({f"numerica__{nome}": v for nome, v in self._numericas.items()})
+        # Objetos e rótulos como JSON (o .npz não usa pickle); "" = ausente
+        arrays.update(
+            {
+                f"objeto__{nome}": np.array(
+                    ["" if v is None else json.dumps(v, ensure_ascii=False) for v in valores],
+                    dtype=str,
+                )
+                for nome, valores in self._objetos.items()
+            }
+        )
+        if self._tipos_numericos:
+            arrays["tipos_numericos"] = np.array(
+                json.dumps({nome: t.__name__ for nome, t in self._tipos_numericos.items()})
+            )
+        if self.rotulos_locutor is not None:
+            arrays["rotulos_locutor"] = np.array(
+                [json.dumps(r, ensure_ascii=False) for r in self.rotulos_locutor], dtype=str
+            )
+        np.savez(caminho, **arrays)
+
+    @classmethod
+    def carregar_npz(cls, caminho: Union[str, Path]) -> "TabelaSegmentos":
+        """Lê uma tabela gravada por `salvar_npz`."""
+        with np.load(caminho, allow_pickle=False) as dados:
+            tabela = cls(dados["inicio"], dados["fim"], locutor=dados["locutor"])
+            tabela._vocabulario = dados["vocabulario"].tolist()
+            tabela._codigos = {
+                texto: codigo for codigo, texto in enumerate(tabela._vocabulario)
+            }
+            for chave in dados.files:
+                if chave.startswith("texto__"):
+                    tabela._textos[chave[len("texto__") :]] = dados[chave]
+                elif chave.startswith("numerica__"):
+                    tabela._numericas[chave[len("numerica__") :]] = dados[chave]
+                elif chave.startswith("objeto__"):
+                    tabela._objetos[chave[len("objeto__") :]] = [
+                        json.loads(v) if v else None for v in dados[chave].tolist()
+                    ]
+                elif chave == "tipos_numericos":
+                    tabela._tipos_numericos = {
+                        nome: {"int": int, "bool": bool}[t]
+                        for nome, t in json.loads(dados[chave].item()).items()
+                    }
+                elif chave == "rotulos_locutor":
+                    tabela.rotulos_locutor = [json.loads(r) for r in dados[chave].tolist()]
+            tabela._ordem = dados["ordem"].tolist()
+        return tabela
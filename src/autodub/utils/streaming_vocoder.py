@@ -0,0 +1,157 @@
+"""
+Vocoder em streaming: mel em blocos de tamanho fixo, áudio entregue aos poucos.
+
+Chamar um vocoder (HiFi-GAN e afins) com o mel de uma frase longa inteira
+aloca ativações proporcionais à frase e só devolve a primeira amostra no fim.
+`VocoderEmBlocos` divide o mel em blocos de `quadros_por_bloco` quadros, com
+`sobreposicao` quadros repetidos entre blocos vizinhos. O trecho sobreposto é
+misturado com rampas lineares complementares (overlap-add com crossfade), o que
+esconde descontinuidades nas bordas dos blocos.
+
+- Memória de pico: O(quadros_por_bloco × amostras_por_quadro), independente da
+  duração da frase.
+- Latência até o primeiro áudio: a conversão de um bloco, medida em
+  `latencia_primeiro_audio`.
+
+As medidas de cada chamada a `fluxo` ficam num dicionário próprio da chamada
+(`estatisticas`): chamadas concorrentes na mesma instância não se misturam.
+
+Funções principais:
+- VocoderEmBlocos.fluxo: gerador de trechos de áudio float32.
+- VocoderEmBlocos.sintetizar_from_mel: áudio completo em WAV (compatível com
+  `IVocoder`).
+"""
+
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import numpy as np
+
+from autodub.interfaces.vocoder_interface import IVocoderStreaming
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+
+
+@lru_cache(maxsize=16)
+def _rampa_entrada(amostras: int) -> np.ndarray:
+    rampa = ((np.arange(amostras) + 0.5) / amostras).astype(np.float32)
+    rampa.setflags(write=False)
+    return rampa
+
+
+class VocoderEmBlocos:
+    """
+    Executa um vocoder de streaming bloco a bloco, com overlap-add.
+
+    Args:
+        vocoder (IVocoderStreaming): Vocoder que converte blocos de quadros mel.
+        quadros_por_bloco (int): Quadros mel por chamada ao vocoder.
+        sobreposicao (int): Quadros repetidos entre blocos vizinhos (crossfade).
+        relogio (Callable[[], float]): Fonte de tempo (injetável nos testes).
+
+    Atributos (da última chamada a `fluxo` iniciada; ver `ultimas_estatisticas`):
+        latencia_primeiro_audio (float | None): Segundos até o primeiro trecho.
+        pico_amostras (int): Maior bloco de áudio mantido em memória.
+        blocos (int): Chamadas feitas ao vocoder.
+    """
+
+    def __init__(
+        self,
+        vocoder: IVocoderStreaming,
+        quadros_por_bloco: int = 64,
+        sobreposicao: int = 8,
+        relogio: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if not 0 <= sobreposicao < quadros_por_bloco:
+            raise ValueError("sobreposicao deve estar em [0, quadros_por_bloco).")
+        self.vocoder = vocoder
+        self.quadros_por_bloco = quadros_por_bloco
+        self.sobreposicao = sobreposicao
+        self.relogio = relogio
+        self.ultimas_estatisticas = self._novas_estatisticas()
+
+    @staticmethod
+    def _novas_estatisticas() -> Dict[str, Any]:
+        return {"latencia_primeiro_audio": None, "pico_amostras": 0, "blocos": 0}
+
+    @property
+    def latencia_primeiro_audio(self) -> Optional[float]:
+        return self.ultimas_estatisticas["latencia_primeiro_audio"]
+
+    @property
+    def pico_amostras(self) -> int:
+        return self.ultimas_estatisticas["pico_amostras"]
+
+    @property
+    def blocos(self) -> int:
+        return self.ultimas_estatisticas["blocos"]
+
+    def _sintetizar(self, bloco: np.ndarray, estatisticas: Dict[str, Any]) -> np.ndarray:
+        audio = np.array(self.vocoder.sintetizar_bloco(bloco), dtype=np.float32)
+        esperado = len(bloco) * self.vocoder.amostras_por_quadro
+        if audio.shape != (esperado,):
+            raise ValueError(
+                f"Vocoder devolveu {audio.shape} amostras; esperado ({esperado},)."
+            )
+        estatisticas["blocos"] += 1
+        estatisticas["pico_amostras"] = max(estatisticas["pico_amostras"], len(audio))
+        return audio
+
+    def fluxo(
+        self, mel: np.ndarray, estatisticas: Optional[Dict[str, Any]] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Converte o mel em trechos de áudio, na ordem, assim que ficam prontos.
+
+        A concatenação dos trechos tem `len(mel) * amostras_por_quadro` amostras.
+
+        Args:
+            estatisticas (Dict, opcional): Recebe as medidas desta chamada
+                (`latencia_primeiro_audio`, `pico_amostras`, `blocos`).
+        """
+        mel = np.asarray(mel, dtype=np.float32)
+        inicio_relogio = self.relogio()
+        if estatisticas is None:
+            estatisticas = {}
+        estatisticas.update(self._novas_estatisticas())
+        self.ultimas_estatisticas = estatisticas
+        if len(mel) == 0:
+            return
+
+        salto = self.quadros_por_bloco - self.sobreposicao
+        amostras_sobrepostas = self.sobreposicao * self.vocoder.amostras_por_quadro
+        cauda: Optional[np.ndarray] = None
+        inicio = 0
+        while True:
+            audio = self._sintetizar(
+                mel[inicio : inicio + self.quadros_por_bloco], estatisticas
+            )
+            ultimo = inicio + self.quadros_por_bloco >= len(mel)
+
+            if cauda is not None:
+                # Bloco não final anterior garante > sobreposicao quadros neste bloco
+                rampa = _rampa_entrada(amostras_sobrepostas)
+                audio[:amostras_sobrepostas] = (
+                    cauda * (1.0 - rampa) + audio[:amostras_sobrepostas] * rampa
+                )
+            if ultimo or amostras_sobrepostas == 0:
+                trecho, cauda = audio, None
+            else:
+                trecho = audio[:-amostras_sobrepostas]
+                cauda = audio[-amostras_sobrepostas:].copy()
+
+            if estatisticas["latencia_primeiro_audio"] is None:
+                estatisticas["latencia_primeiro_audio"] = self.relogio() - inicio_relogio
+            yield trecho
+
+            if ultimo:
+                return
+            inicio += salto
+
+    def sintetizar_from_mel(self, mel) -> bytes:
+        """Áudio completo em WAV PCM16 mono (mesma assinatura de `IVocoder`)."""
+        trechos = list(self.fluxo(mel))
+        audio = np.concatenate(trechos) if trechos else np.zeros(0, dtype=np.float32)
+        return pcm16_para_wav_bytes(audio, self.vocoder.taxa_amostragem)
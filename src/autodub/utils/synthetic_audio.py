@@ -0,0 +1,64 @@
+"""
+Gerador vetorizado e determinístico de áudio sintético (tons e ruído).
+
+Usado pelos TTS simulados (`MockTTS`, placeholder do `YourTTSAdapter`) e pelo
+áudio vazio de fallback da pipeline. As amostras são calculadas de uma vez com
+NumPy e os WAVs prontos ficam em cache, então sintetizar milhares de segmentos
+em testes de carga custa quase nada.
+
+Funções principais:
+- frequencia_do_texto: mapeamento determinístico texto → frequência (SHA-1).
+- gerar_tom / gerar_ruido: amostras PCM16.
+- tom_wav_bytes: WAV PCM16 de um tom, com cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+
+
+def frequencia_do_texto(texto: str, base: int = 200, faixa: int = 200) -> int:
+    """
+    Converte um texto em uma frequência entre `base` e `base + faixa` Hz.
+
+    Usa SHA-1 (e não `hash()`), então o resultado é o mesmo em qualquer processo.
+    """
+    h = int(hashlib.sha1(texto.encode()).hexdigest(), 16)
+    return (h % faixa) + base
+
+
+def gerar_tom(
+    frequencia: float, nframes: int, sample_rate: int = 16000, amplitude: float = 0.1
+) -> np.ndarray:
+    """
+    Gera uma senoide PCM16 com `nframes` amostras.
+
+    A expressão (e o truncamento para inteiro) é a mesma do laço amostra a
+    amostra usado antes, então o áudio gerado é idêntico.
+    """
+    indices = np.arange(nframes)
+    return (
+        32767 * amplitude * np.sin(2 * math.pi * frequencia * indices / sample_rate)
+    ).astype(np.int16)
+
+
+def gerar_ruido(nframes: int, semente: int = 0, amplitude: float = 0.1) -> np.ndarray:
+    """Gera ruído branco PCM16 determinístico para a `semente` informada."""
+    gerador = np.random.default_rng(semente)
+    return (32767 * amplitude * gerador.uniform(-1.0, 1.0, nframes)).astype(np.int16)
+
+
+@lru_cache(maxsize=1024)
+def tom_wav_bytes(
+    frequencia: float, nframes: int, sample_rate: int = 16000, amplitude: float = 0.1
+) -> bytes:
+    """Retorna (com cache) o WAV PCM16 mono de um tom."""
+    return pcm16_para_wav_bytes(
+        gerar_tom(frequencia, nframes, sample_rate, amplitude), sample_rate
+    )
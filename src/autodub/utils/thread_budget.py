@@ -0,0 +1,94 @@
+"""
+Orçamento de threads de CPU compartilhado por torch, OpenMP e BLAS.
+
+Whisper e Resemblyzer (torch) e o NumPy (BLAS) usam, por padrão, todos os
+núcleos da máquina. Quando vários trabalhadores ou etapas rodam ao mesmo tempo,
+isso gera excesso de threads disputando os mesmos núcleos. Este módulo divide
+um total de núcleos entre os trabalhadores e aplica o limite em cada processo.
+
+Funções principais:
+- calcular_alocacao: divide o total de núcleos entre os trabalhadores.
+- aplicar_threads: aplica o limite no processo atual (variáveis de ambiente,
+  torch e, se instalado, threadpoolctl).
+- inicializar_trabalhador: `initializer` para pools de processos.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Dict, Optional
+
+VARIAVEIS_THREADS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def calcular_alocacao(nucleos_totais: Optional[int] = None, trabalhadores: int = 1) -> Dict:
+    """
+    Divide o total de núcleos entre os trabalhadores.
+
+    Args:
+        nucleos_totais (int, opcional): Núcleos disponíveis para o trabalho.
+            Se None, usa `os.cpu_count()`.
+        trabalhadores (int): Processos ou etapas que rodam em paralelo.
+
+    Returns:
+        Dict: {"nucleos_totais", "trabalhadores", "threads_por_trabalhador"}.
+
+    Raises:
+        ValueError: Se `nucleos_totais` ou `trabalhadores` forem menores que 1.
+    """
+    total = nucleos_totais if nucleos_totais is not None else (os.cpu_count() or 1)
+    if total < 1 or trabalhadores < 1:
+        raise ValueError("nucleos_totais e trabalhadores devem ser maiores que zero.")
+
+    trabalhadores = min(trabalhadores, total)
+    return {
+        "nucleos_totais": total,
+        "trabalhadores": trabalhadores,
+        "threads_por_trabalhador": max(1, total // trabalhadores),
+    }
+
+
+def aplicar_threads(threads: int) -> Dict:
+    """
+    Limita as threads de computação do processo atual.
+
+    As variáveis de ambiente valem para bibliotecas ainda não inicializadas
+    (inclusive processos filhos). Se o torch já estiver importado, o limite é
+    aplicado diretamente; se o `threadpoolctl` estiver instalado, o BLAS já
+    carregado pelo NumPy também é limitado.
+
+    Returns:
+        Dict: Resumo do que foi aplicado, para o relatório de execução.
+    """
+    for variavel in VARIAVEIS_THREADS:
+        os.environ[variavel] = str(threads)
+
+    aplicado = {"threads": threads, "variaveis_ambiente": list(VARIAVEIS_THREADS)}
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+        aplicado["torch"] = threads
+
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        pass
+    else:
+        threadpool_limits(limits=threads)
+        aplicado["threadpoolctl"] = threads
+
+    return aplicado
+
+
+def inicializar_trabalhador(threads: int) -> None:
+    """Aplica o orçamento de threads em um processo trabalhador recém-criado."""
+    aplicar_threads(threads)
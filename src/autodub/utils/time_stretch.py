@@ -0,0 +1,108 @@
+"""
+Ajuste de duração da fala sintetizada (time-stretch) em NumPy, sem ffmpeg.
+
+Quando a fala sintetizada passa do trecho original (`fim - inicio`), ela é
+comprimida com WSOLA (Waveform Similarity Overlap-Add): o áudio é recortado em
+quadros com janela de Hann e recolado com um salto diferente, escolhendo para
+cada quadro o deslocamento (dentro de uma tolerância) mais parecido com a
+continuação natural do quadro anterior. A altura da voz é preservada.
+
+A busca do melhor deslocamento é vetorizada (`sliding_window_view` + produto
+matriz-vetor), então cada quadro custa uma única operação NumPy — sem um
+subprocesso `atempo` por segmento.
+
+Funções principais:
+- esticar_tempo: muda a duração por um fator (< 1 comprime, > 1 alonga).
+- ajustar_ao_trecho: comprime um áudio para caber em `max_amostras`, limitado
+  por `razao_maxima`.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def esticar_tempo(
+    audio: np.ndarray,
+    fator: float,
+    tamanho_quadro: int = 512,
+    tolerancia: int = 128,
+) -> np.ndarray:
+    """
+    Muda a duração do áudio mantendo a altura (WSOLA).
+
+    Args:
+        audio (np.ndarray): Amostras mono (int ou float).
+        fator (float): Duração de saída / duração de entrada (0.8 = 20% mais curto).
+        tamanho_quadro (int): Amostras por quadro (512 ≈ 32 ms a 16 kHz).
+        tolerancia (int): Deslocamento máximo, em amostras, na busca por similaridade.
+
+    Returns:
+        np.ndarray: Áudio float32 com `round(len(audio) * fator)` amostras.
+
+    Raises:
+        ValueError: Se `fator` não for positivo.
+    """
+    if fator <= 0:
+        raise ValueError("fator deve ser positivo.")
+
+    x = np.asarray(audio, dtype=np.float32)
+    comprimento_saida = int(round(len(x) * fator))
+    if fator == 1.0 or comprimento_saida == 0:
+        return x[:comprimento_saida].copy()
+    if len(x) < 2 * tamanho_quadro:
+        # Curto demais para WSOLA: interpolação linear simples
+        posicoes = np.linspace(0, len(x) - 1, comprimento_saida)
+        return np.interp(posicoes, np.arange(len(x)), x).astype(np.float32)
+
+    n = tamanho_quadro
+    salto_sintese = n // 2
+    salto_analise = salto_sintese / fator
+    janela = np.hanning(n + 1)[:n].astype(np.float32)  # Hann periódica
+    quadros = math.ceil(comprimento_saida / salto_sintese) + 1
+
+    # Margens para a busca nunca sair do sinal
+    margem_fim = n + 2 * tolerancia + salto_sintese + math.ceil(salto_analise)
+    xp = np.pad(x, (tolerancia, margem_fim))
+    janelas = sliding_window_view(xp, n)  # janelas[p + tolerancia] = x[p : p + n]
+
+    saida = np.zeros(quadros * salto_sintese + n, dtype=np.float32)
+    pesos = np.zeros_like(saida)
+    anterior = 0
+
+    for k in range(quadros):
+        alvo = min(int(round(k * salto_analise)), len(x))
+        if k == 0:
+            escolhido = alvo
+        else:
+            continuacao = janelas[anterior + salto_sintese + tolerancia]
+            candidatos = janelas[alvo : alvo + 2 * tolerancia + 1]
+            escolhido = alvo - tolerancia + int(np.argmax(candidatos @ continuacao))
+
+        inicio = k * salto_sintese
+        saida[inicio : inicio + n] += janelas[escolhido + tolerancia] * janela
+        pesos[inicio : inicio + n] += janela
+        anterior = escolhido
+
+    saida /= np.maximum(pesos, 1e-3)
+    return saida[:comprimento_saida]
+
+
+def ajustar_ao_trecho(
+    audio: np.ndarray, max_amostras: int, razao_maxima: float = 1.25
+) -> np.ndarray:
+    """
+    Comprime o áudio para caber em `max_amostras`, sem acelerar mais que `razao_maxima`.
+
+    Áudios que já cabem são devolvidos sem alteração (em float32). Se nem a
+    compressão máxima for suficiente, o resultado ainda excede o trecho e o
+    excedente fica a cargo de quem monta a trilha.
+    """
+    x = np.asarray(audio, dtype=np.float32)
+    if max_amostras <= 0 or len(x) <= max_amostras:
+        return x
+    fator = max(max_amostras / len(x), 1.0 / razao_maxima)
+    return esticar_tempo(x, fator)
@@ -0,0 +1,218 @@
+"""
+Biblioteca local de vozes para reutilizar embeddings de locutores entre trabalhos.
+
+A biblioteca é um único arquivo (`vozes.npy`): um array estruturado com o nome
+e o embedding `float32` de cada voz, aberto com memory-map, de modo que abrir uma
+biblioteca com dezenas de milhares de vozes não carrega a matriz inteira na
+memória. Nomes e embeddings são gravados juntos num temporário único e trocados
+com um só `os.replace`: uma gravação interrompida ou duas gravações simultâneas
+nunca deixam nomes e matriz dessincronizados (vence a última).
+
+Todas as linhas são normalizadas (norma L2 = 1) na inserção, então a busca por
+similaridade de cosseno se reduz a um único produto matricial em lote.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+ARQUIVO_VOZES = "vozes.npy"
+
+
+def _normalizar_linhas(matriz: np.ndarray) -> np.ndarray:
+    """Normaliza cada linha para norma L2 unitária (linhas nulas ficam nulas)."""
+    normas = np.linalg.norm(matriz, axis=1, keepdims=True)
+    normas[normas == 0] = 1.0
+    return (matriz / normas).astype(np.float32, copy=False)
+
+
+class BibliotecaVozes:
+    """
+    Armazena embeddings nomeados e encontra a voz conhecida mais parecida.
+
+    Args:
+        diretorio (str | Path): Pasta onde a biblioteca é persistida.
+        limiar_similaridade (float): Similaridade de cosseno mínima para considerar
+            que um embedding corresponde a uma voz conhecida.
+    """
+
+    def __init__(self, diretorio: Union[str, Path], limiar_similaridade: float = 0.75) -> None:
+        self.diretorio = Path(diretorio)
+        self.limiar_similaridade = limiar_similaridade
+        self._nomes: List[str] = []
+        self._indices: Dict[str, int] = {}
+        self._matriz: Optional[np.ndarray] = None
+        self._pendentes: List[np.ndarray] = []
+        self._carregar()
+
+    def _carregar(self) -> None:
+        """Abre a matriz persistida (memory-map, somente leitura) e a lista de nomes."""
+        caminho = self.diretorio / ARQUIVO_VOZES
+        if not caminho.exists():
+            return
+
+        vozes = np.load(caminho, mmap_mode="r")
+        self._nomes = vozes["nome"].tolist()
+        self._indices = {nome: indice for indice, nome in enumerate(self._nomes)}
+        self._matriz = vozes["embedding"]
+
+    @property
+    def dimensao(self) -> Optional[int]:
+        """Dimensão dos embeddings armazenados (None se a biblioteca estiver vazia)."""
+        if self._matriz is not None:
+            return int(self._matriz.shape[1])
+        if self._pendentes:
+            return int(self._pendentes[0].shape[1])
+        return None
+
+    def __len__(self) -> int:
+        return len(self._nomes)
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self._indices
+
+    def _consolidar(self) -> Optional[np.ndarray]:
+        """Junta as inserções pendentes à matriz principal e a devolve."""
+        if self._pendentes:
+            partes = [self._matriz] if self._matriz is not None else []
+            self._matriz = np.concatenate(partes + self._pendentes, axis=0)
+            self._pendentes = []
+        return self._matriz
+
+    def adicionar(self, nome: str, embedding: Union[Sequence[float], np.ndarray]) -> None:
+        """
+        Adiciona uma voz nomeada à biblioteca (em memória até `salvar`).
+
+        Raises:
+            ValueError: Se o nome já existir ou a dimensão não for compatível.
+        """
+        self.adicionar_lote([nome], [embedding])
+
+    def adicionar_lote(
+        self,
+        nomes: Sequence[str],
+        embeddings: Union[Sequence[Sequence[float]], np.ndarray],
+    ) -> None:
+        """
+        Adiciona várias vozes de uma vez (uma única cópia da matriz ao consolidar).
+
+        Raises:
+            ValueError: Se algum nome já existir ou a dimensão não for compatível.
+        """
+        matriz = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if matriz.shape[0] != len(nomes):
+            raise ValueError("A quantidade de nomes e de embeddings deve ser a mesma.")
+
+        vistos = set(self._indices)
+        duplicados = [nome for nome in nomes if nome in vistos or vistos.add(nome)]
+        if duplicados:
+            raise ValueError(f"Vozes já cadastradas na biblioteca: {duplicados}")
+
+        if self.dimensao is not None and matriz.shape[1] != self.dimensao:
+            raise ValueError(
+                f"Embedding com dimensão {matriz.shape[1]}, esperado {self.dimensao}."
+            )
+
+        for nome in nomes:
+            self._indices[nome] = len(self._nomes)
+            self._nomes.append(nome)
+        self._pendentes.append(_normalizar_linhas(matriz))
+
+    def cadastrar_arquivos(
+        self, extrator, nomes: Sequence[str], caminhos_audio: Sequence[str]
+    ) -> None:
+        """
+        Extrai e cadastra várias vozes com uma única chamada a `extrator.extrair_lote`.
+
+        Args:
+            extrator: Implementação de `IEmbeddingExtractor`.
+            nomes (Sequence[str]): Nome de cada voz.
+            caminhos_audio (Sequence[str]): Áudio de referência de cada voz.
+        """
+        if len(nomes) != len(caminhos_audio):
+            raise ValueError("A quantidade de nomes e de arquivos deve ser a mesma.")
+        embeddings = extrator.extrair_lote(list(caminhos_audio))
+        self.adicionar_lote(nomes, [list(embedding) for embedding in embeddings])
+
+    def obter(self, nome: str) -> np.ndarray:
+        """
+        Retorna o embedding (normalizado) de uma voz cadastrada.
+
+        Raises:
+            KeyError: Se a voz não existir.
+        """
+        matriz = self._consolidar()
+        return np.array(matriz[self._indices[nome]])
+
+    def buscar(
+        self,
+        embeddings: Union[Sequence[float], Sequence[Sequence[float]], np.ndarray],
+        limiar: Optional[float] = None,
+    ) -> List[Optional[Tuple[str, float]]]:
+        """
+        Busca, em lote, a voz conhecida mais parecida com cada embedding.
+
+        Args:
+            embeddings: Um vetor (d,) ou uma matriz (k, d) de consultas.
+            limiar (float, opcional): Substitui `limiar_similaridade` nesta busca.
+
+        Returns:
+            List[Optional[Tuple[str, float]]]: Para cada consulta, `(nome, similaridade)`
+                da melhor voz ou None se nenhuma atingir o limiar.
+        """
+        consultas = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        limiar = self.limiar_similaridade if limiar is None else limiar
+        matriz = self._consolidar()
+
+        if matriz is None or matriz.shape[0] == 0:
+            return [None] * consultas.shape[0]
+        if consultas.shape[1] != matriz.shape[1]:
+            raise ValueError(
+                f"Embedding com dimensão {consultas.shape[1]}, esperado {matriz.shape[1]}."
+            )
+
+        similaridades = _normalizar_linhas(consultas) @ matriz.T
+        melhores = np.argmax(similaridades, axis=1)
+        valores = similaridades[np.arange(consultas.shape[0]), melhores]
+
+        return [
+            (self._nomes[indice], float(valor)) if valor >= limiar else None
+            for indice, valor in zip(melhores, valores)
+        ]
+
+    def salvar(self) -> None:
+        """
+        Persiste a biblioteca de forma atômica e reabre a matriz com memory-map.
+
+        Nomes e embeddings vão num só arquivo, escrito num temporário de nome
+        único no mesmo diretório e trocado com um único `os.replace`.
+        """
+        matriz = self._consolidar()
+        if matriz is None:
+            return
+
+        largura_nome = max(1, max((len(nome) for nome in self._nomes), default=1))
+        vozes = np.empty(
+            len(self._nomes),
+            dtype=[("nome", f"U{largura_nome}"), ("embedding", np.float32, matriz.shape[1])],
+        )
+        vozes["nome"] = self._nomes
+        vozes["embedding"] = matriz
+
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(
+            dir=self.diretorio, prefix=".vozes.", suffix=".npy"
+        )
+        try:
+            with os.fdopen(descritor, "wb") as f:
+                np.save(f, vozes)
+            os.replace(temporario, self.diretorio / ARQUIVO_VOZES)
+        except BaseException:
+            Path(temporario).unlink(missing_ok=True)
+            raise
+        self._carregar()
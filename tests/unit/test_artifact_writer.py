@@ -0,0 +1,74 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from autodub.utils.artifact_writer import EscritorArtefatos
+from autodub.utils.segment_table import TabelaSegmentos
+
+
+def test_grava_artefatos_em_segundo_plano(tmp_path):
+    escritor = EscritorArtefatos(tmp_path / "debug")
+    escritor.gravar_bytes("bruto.bin", b"abc")
+    escritor.gravar_json("relatorio.json", {"idioma": "pt-br"})
+    escritor.gravar_embedding("embedding.npy", [1.0, 2.0])
+    assert escritor.encerrar() == []
+
+    assert (tmp_path / "debug" / "bruto.bin").read_bytes() == b"abc"
+    assert json.loads((tmp_path / "debug" / "relatorio.json").read_text()) == {
+        "idioma": "pt-br"
+    }
+    embedding = np.load(tmp_path / "debug" / "embedding.npy")
+    assert embedding.dtype == np.float32
+    assert embedding.tolist() == [1.0, 2.0]
+
+
+def test_segmentos_sao_capturados_na_chamada(tmp_path):
+    tabela = TabelaSegmentos.de_dicts([{"texto": "a", "inicio": 0.0, "fim": 1.0}])
+    with EscritorArtefatos(tmp_path) as escritor:
+        escritor.gravar_segmentos("segmentos.jsonl", tabela)
+        tabela[0]["texto"] = "alterado"
+
+    linha = json.loads((tmp_path / "segmentos.jsonl").read_text(encoding="utf-8"))
+    assert linha["texto"] == "a"
+
+
+def test_vincular_audio_usa_hard_link(tmp_path):
+    origem = tmp_path / "audio.wav"
+    origem.write_bytes(b"RIFF")
+    (tmp_path / "saida").mkdir()
+    (tmp_path / "saida" / "audio.wav").write_bytes(b"antigo")
+
+    with EscritorArtefatos(tmp_path / "saida") as escritor:
+        escritor.vincular_audio("audio.wav", origem)
+
+    destino = tmp_path / "saida" / "audio.wav"
+    assert destino.read_bytes() == b"RIFF"
+    assert os.stat(destino).st_ino == os.stat(origem).st_ino
+
+
+def test_vincular_audio_copia_quando_link_falha(tmp_path, monkeypatch):
+    origem = tmp_path / "audio.wav"
+    origem.write_bytes(b"RIFF")
+
+    def link_falha(*args):
+        raise OSError("outro disco")
+
+    monkeypatch.setattr(os, "link", link_falha)
+    with EscritorArtefatos(tmp_path / "saida") as escritor:
+        escritor.vincular_audio("audio.wav", origem)
+
+    assert (tmp_path / "saida" / "audio.wav").read_bytes() == b"RIFF"
+
+
+def test_falhas_sao_devolvidas_sem_interromper(tmp_path):
+    escritor = EscritorArtefatos(tmp_path)
+    escritor.vincular_audio("faltando.wav", tmp_path / "nao_existe.wav")
+    escritor.gravar_bytes("ok.bin", b"1")
+    falhas = escritor.encerrar()
+
+    assert [nome for nome, _ in falhas] == ["faltando.wav"]
+    assert (tmp_path / "ok.bin").exists()
+    with pytest.raises(RuntimeError):
+        escritor.gravar_bytes("tarde.bin", b"2")
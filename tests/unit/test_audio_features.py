@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from autodub.utils.audio_features import (
+    AudioCaracteristicas,
+    banco_mel,
+    em_blocos,
+    espectro_potencia,
+    janela_hann,
+    ler_wav_mmap,
+    matriz_dct,
+    mel_espectrograma,
+    mfcc,
+    numero_quadros,
+    taxa_cruzamentos_zero,
+)
+
+TAXA = 16000
+
+
+def _tom(frequencia, segundos=0.5):
+    t = np.arange(int(segundos * TAXA)) / TAXA
+    return (0.5 * np.sin(2 * np.pi * frequencia * t)).astype(np.float32)
+
+
+def test_tabelas_ficam_em_cache_e_somente_leitura():
+    assert janela_hann(400) is janela_hann(400)
+    assert banco_mel(TAXA, 400, 80) is banco_mel(TAXA, 400, 80)
+    assert banco_mel(TAXA, 400, 80).shape == (80, 201)
+    with pytest.raises(ValueError):
+        janela_hann(400)[0] = 1.0
+
+    dct = matriz_dct(40, 13)
+    assert np.allclose(dct @ dct.T, np.eye(13), atol=1e-5)
+
+
+def test_espectro_tem_pico_na_frequencia_do_tom():
+    espectro = espectro_potencia(_tom(1000))
+    assert espectro.shape == (numero_quadros(TAXA // 2), 201)
+    # 1000 Hz com n_fft = 400 a 16 kHz cai no bin 25
+    assert np.all(np.argmax(espectro, axis=1) == 25)
+
+
+def test_mel_e_mfcc_distinguem_tons():
+    grave, agudo = mel_espectrograma(_tom(200), TAXA), mel_espectrograma(_tom(3000), TAXA)
+    assert grave.shape[1] == 80
+    assert np.argmax(grave.mean(axis=0)) < np.argmax(agudo.mean(axis=0))
+    assert mfcc(_tom(200), TAXA).shape == (grave.shape[0], 13)
+
+
+def test_cruzamentos_por_zero_batem_com_calculo_direto():
+    audio = np.random.default_rng(0).standard_normal(5000).astype(np.float32)
+    esperado = np.mean(
+        np.abs(
+            np.diff(np.signbit(np.lib.stride_tricks.sliding_window_view(audio, 400)[::160]))
+        ),
+        axis=1,
+    )
+    assert np.allclose(taxa_cruzamentos_zero(audio), esperado)
+
+
+def test_em_blocos_equivale_ao_calculo_inteiro():
+    audio = (np.random.default_rng(1).standard_normal(TAXA) * 8000).astype(np.int16)
+    inteiro = espectro_potencia(audio.astype(np.float32) / 32768.0)
+    em_partes = em_blocos(audio, espectro_potencia, quadros_por_bloco=7)
+    assert np.allclose(em_partes, inteiro, rtol=1e-4, atol=1e-6)
+
+
+def test_ler_wav_mmap(tmp_path):
+    caminho = tmp_path / "a.wav"
+    sf.write(caminho, _tom(440), TAXA, subtype="PCM_16")
+    amostras, taxa = ler_wav_mmap(caminho)
+    assert taxa == TAXA
+    assert isinstance(amostras, np.memmap)
+    assert np.allclose(amostras / 32768.0, _tom(440), atol=1e-4)
+
+    sf.write(tmp_path / "b.wav", np.zeros((100, 2)), TAXA)
+    with pytest.raises(ValueError):
+        ler_wav_mmap(tmp_path / "b.wav")
+
+
+def test_audio_caracteristicas_memoriza(tmp_path):
+    caminho = tmp_path / "a.wav"
+    sf.write(caminho, _tom(440), TAXA, subtype="PCM_16")
+    audio = AudioCaracteristicas(caminho, quadros_por_bloco=10)
+
+    assert audio.duracao == pytest.approx(0.5)
+    assert audio.mel() is audio.mel()
+    assert audio.mfcc().shape == (audio.mel(n_mels=40).shape[0], 13)
+    esperado = mel_espectrograma(audio.amostras / 32768.0, TAXA)
+    assert np.allclose(audio.mel(), esperado, atol=1e-3)
+    assert audio.energia_log() is audio.energia_log()
+
+    with pytest.raises(ValueError):
+        AudioCaracteristicas(np.zeros(10))
+
+
+def test_audio_caracteristicas_limita_o_cache():
+    amostras = _tom(440)
+    completo = AudioCaracteristicas(amostras, TAXA, limite_cache_bytes=None)
+    energia = completo.energia_log()
+    audio = AudioCaracteristicas(
+        amostras, TAXA, quadros_por_bloco=10, limite_cache_bytes=energia.nbytes
+    )
+
+    # O espectro inteiro passa do limite: não é memorizado, e o mel sai em blocos
+    assert audio.espectro_potencia() is not audio.espectro_potencia()
+    assert np.allclose(audio.mel(), completo.mel())
+    assert audio.bytes_em_cache == 0
+
+    # Cabe um resultado por vez: o usado há mais tempo sai primeiro
+    memorizada = audio.energia_log()
+    assert audio.energia_log() is memorizada
+    audio.cruzamentos_zero()
+    assert audio.bytes_em_cache <= energia.nbytes
+    assert audio.energia_log() is not memorizada
+
+    sem_cache = AudioCaracteristicas(amostras, TAXA, limite_cache_bytes=0)
+    assert sem_cache.energia_log() is not sem_cache.energia_log()
+    assert np.array_equal(sem_cache.energia_log(), energia)
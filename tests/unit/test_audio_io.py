@@ -0,0 +1,38 @@
+import io
+import wave
+
+import numpy as np
+
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+
+
+def test_pcm16_para_wav_bytes_int16():
+    amostras = np.array([0, 1000, -1000], dtype=np.int16)
+    dados = pcm16_para_wav_bytes(amostras, sample_rate=8000)
+    with wave.open(io.BytesIO(dados)) as wf:
+        assert wf.getframerate() == 8000
+        assert wf.getsampwidth() == 2
+        assert np.array_equal(np.frombuffer(wf.readframes(3), dtype="<i2"), amostras)
+
+
+def test_pcm16_para_wav_bytes_float_limitado():
+    dados = pcm16_para_wav_bytes(np.array([2.0, -2.0, 0.5]))
+    with wave.open(io.BytesIO(dados)) as wf:
+        lidas = np.frombuffer(wf.readframes(3), dtype="<i2")
+    assert lidas.tolist() == [32767, -32767, 16383]
+
+
+def test_wav_bytes_para_pcm16_ida_e_volta():
+    import pytest
+
+    from autodub.utils.audio_io import wav_bytes_para_pcm16
+
+    amostras = np.array([0, 1000, -1000, 32767], dtype=np.int16)
+    lidas, taxa = wav_bytes_para_pcm16(pcm16_para_wav_bytes(amostras, sample_rate=22050))
+    assert taxa == 22050
+    assert np.array_equal(lidas, amostras)
+
+    with pytest.raises(ValueError):
+        wav_bytes_para_pcm16(b"nao e wav")
+    with pytest.raises(ValueError):
+        wav_bytes_para_pcm16(pcm16_para_wav_bytes(amostras, canais=2))
@@ -0,0 +1,58 @@
+import numpy as np
+import soundfile as sf
+
+from autodub.utils.audio_sampling import amostrar_fala, energia_janelas, selecionar_janelas
+
+
+def _gravar_audio(caminho, amplitudes, taxa=1000):
+    """Grava um áudio com uma janela de 1 s por amplitude (senoide de 50 Hz)."""
+    t = np.arange(taxa) / taxa
+    audio = np.concatenate([a * np.sin(2 * np.pi * 50 * t) for a in amplitudes])
+    sf.write(str(caminho), audio.astype(np.float32), taxa, subtype="PCM_16")
+    return caminho
+
+
+def test_energia_janelas_mede_rms_por_janela(tmp_path):
+    caminho = _gravar_audio(tmp_path / "a.wav", [0.0, 0.5, 0.1])
+    energias, taxa = energia_janelas(caminho, janela_segundos=1.0, janelas_por_bloco=2)
+    assert taxa == 1000
+    assert energias.shape == (3,)
+    assert np.allclose(energias, [0.0, 0.5 / np.sqrt(2), 0.1 / np.sqrt(2)], atol=1e-3)
+
+
+def test_energia_janelas_audio_mais_curto_que_janela(tmp_path):
+    caminho = tmp_path / "curto.wav"
+    sf.write(str(caminho), np.zeros(10, dtype=np.float32), 1000)
+    energias, _ = energia_janelas(caminho, janela_segundos=1.0)
+    assert energias.size == 0
+
+
+def test_selecionar_janelas_espalha_e_ignora_silencio():
+    energias = np.array([0.0, 0.9, 0.8, 0.0, 0.3, 0.7, 0.0, 0.2])
+    indices = selecionar_janelas(energias, quantidade=2)
+    # candidatas (>= 10% do p95): 1, 2, 4, 5, 7 -> grupos {1,2,4} e {5,7}
+    assert indices.tolist() == [1, 5]
+
+
+def test_selecionar_janelas_casos_limite():
+    assert selecionar_janelas(np.array([]), 3).size == 0
+    assert selecionar_janelas(np.array([1.0, 2.0]), 0).size == 0
+    assert selecionar_janelas(np.array([0.0, 1.0, 1.0]), 5).tolist() == [1, 2]
+
+
+def test_amostrar_fala_limita_duracao(tmp_path):
+    caminho = _gravar_audio(tmp_path / "longo.wav", [0.0, 0.5, 0.4, 0.0, 0.6, 0.3])
+    amostra, taxa = amostrar_fala(caminho, max_segundos=2.0)
+    assert taxa == 1000
+    assert amostra.shape == (2000,)
+    # escolhe a janela mais forte de cada metade da fala: 1 (0.5) e 4 (0.6)
+    assert np.isclose(np.abs(amostra[:1000]).max(), 0.5, atol=1e-2)
+    assert np.isclose(np.abs(amostra[1000:]).max(), 0.6, atol=1e-2)
+
+
+def test_amostrar_fala_sem_janelas_completas(tmp_path):
+    caminho = tmp_path / "curto.wav"
+    sf.write(str(caminho), np.zeros(10, dtype=np.float32), 1000)
+    amostra, taxa = amostrar_fala(caminho, max_segundos=5.0)
+    assert amostra.size == 0
+    assert taxa == 1000
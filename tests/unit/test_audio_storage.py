@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+from autodub.utils.audio_storage import (
+    com_formato,
+    gravar_pcm16,
+    gravar_wav_bytes,
+    ler_pcm16,
+    taxa_arquivo,
+)
+
+
+def _fala(n=16000):
+    tempo = np.arange(n) / 16000
+    return (0.3 * np.sin(2 * np.pi * 220 * tempo) * 32767).astype(np.int16)
+
+
+@pytest.mark.parametrize("extensao", [".wav", ".flac"])
+def test_gravar_e_ler_sem_perdas(tmp_path, extensao):
+    amostras = _fala()
+    caminho = tmp_path / f"fala{extensao}"
+
+    gravar_pcm16(caminho, amostras, 22050)
+    lidas, taxa = ler_pcm16(caminho)
+
+    assert taxa == 22050 == taxa_arquivo(caminho)
+    assert lidas.dtype == np.int16
+    assert np.array_equal(lidas, amostras)
+
+
+def test_flac_ocupa_menos_que_wav(tmp_path):
+    dados = pcm16_para_wav_bytes(_fala(), 16000)
+    gravar_wav_bytes(tmp_path / "a.wav", dados)
+    gravar_wav_bytes(tmp_path / "a.flac", dados)
+
+    assert (tmp_path / "a.wav").read_bytes() == dados
+    assert (tmp_path / "a.flac").stat().st_size < len(dados) / 2
+    assert np.array_equal(ler_pcm16(tmp_path / "a.flac")[0], _fala())
+
+
+def test_formato_invalido_e_arquivo_invalido(tmp_path):
+    assert com_formato("segmentos/segment_00001.wav", "flac") == "segmentos/segment_00001.flac"
+    with pytest.raises(ValueError):
+        com_formato("a.wav", "mp3")
+    with pytest.raises(ValueError):
+        gravar_wav_bytes(tmp_path / "a.flac", b"NAO_E_WAV")
+    (tmp_path / "b.flac").write_bytes(b"NAO_E_FLAC")
+    with pytest.raises(ValueError):
+        ler_pcm16(tmp_path / "b.flac")
+    with pytest.raises(ValueError):
+        taxa_arquivo(tmp_path / "b.flac")
@@ -0,0 +1,30 @@
+from autodub.utils.disk_budget import MonitorDisco, estimar_uso_disco, uso_diretorio
+
+
+def test_estimar_uso_disco_conta_extracao_e_idiomas():
+    # 10 s a 16 kHz PCM16 = 320 kB por cópia
+    assert estimar_uso_disco(10) == 3 * 320000
+    assert estimar_uso_disco(10, idiomas=3) == 7 * 320000
+    assert estimar_uso_disco(10, sample_rate=8000) == 3 * 160000
+
+
+def test_uso_diretorio_recursivo(tmp_path):
+    (tmp_path / "a.wav").write_bytes(b"x" * 100)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.wav").write_bytes(b"x" * 50)
+
+    assert uso_diretorio(tmp_path) == 150
+    assert uso_diretorio(tmp_path / "inexistente") == 0
+
+
+def test_monitor_guarda_pico(tmp_path):
+    resumo = {}
+    monitor = MonitorDisco(tmp_path, resumo)
+    arquivo = tmp_path / "a.wav"
+    arquivo.write_bytes(b"x" * 1000)
+    assert monitor.medir() == 1000
+    arquivo.unlink()
+    assert monitor.medir() == 0
+
+    assert monitor.pico == 1000
+    assert resumo == {"pico_bytes": 1000}
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from autodub.adapters.dtw_alignment_adapter import (
+    AlinhadorDtw,
+    dtw_em_banda_lote,
+    unidades_do_texto,
+)
+
+TAXA = 16000
+
+
+def _fricativa(segundos, gerador):
+    return (gerador.standard_normal(int(segundos * TAXA)) * 0.1).astype(np.float32)
+
+
+def _vogal(segundos):
+    t = np.arange(int(segundos * TAXA)) / TAXA
+    return (0.6 * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+@pytest.fixture
+def audio_sintetico():
+    gerador = np.random.default_rng(0)
+    return np.concatenate(
+        [_fricativa(0.3, gerador), _vogal(0.6), _fricativa(0.5, gerador), _vogal(0.2)]
+    )
+
+
+def test_unidades_do_texto():
+    palavras, caracteristicas, primeiras = unidades_do_texto("Olá, mundo !")
+    assert palavras == ["Olá,", "mundo", "!"]
+    assert caracteristicas.shape == (3 + 5 + 1, 2)
+    assert primeiras.tolist() == [0, 3, 8]
+
+
+def test_dtw_em_banda_segue_as_mudancas_do_sinal():
+    unidades = np.array([[0.0], [1.0], [0.0]], dtype=np.float32)
+    quadros = np.array([[0.0]] * 4 + [[1.0]] * 3 + [[0.0]] * 5, dtype=np.float32)
+    (primeiros,) = dtw_em_banda_lote([unidades], [quadros], meia_banda=1)
+    assert primeiros.tolist() == [0, 4, 7]
+
+    with pytest.raises(ValueError):
+        dtw_em_banda_lote([np.zeros((5, 1))], [np.zeros((3, 1))], meia_banda=1)
+
+
+def test_alinhar_encontra_limites_das_palavras(tmp_path, audio_sintetico):
+    caminho = tmp_path / "audio.wav"
+    sf.write(caminho, audio_sintetico, TAXA)
+
+    resultado = AlinhadorDtw().alinhar("sss aaa sss aaa", str(caminho))
+
+    assert [item["palavra"] for item in resultado] == ["sss", "aaa", "sss", "aaa"]
+    limites = [item["start"] for item in resultado] + [resultado[-1]["end"]]
+    assert np.allclose(limites, [0.0, 0.3, 0.9, 1.4, 1.6], atol=0.03)
+
+
+def test_alinhar_lote_com_varios_segmentos(audio_sintetico):
+    episodio = np.concatenate([audio_sintetico, audio_sintetico])
+    resultados = AlinhadorDtw().alinhar_lote(
+        ["sss aaa sss aaa", "", "sss aaa sss aaa", "palavras demais para um trecho"],
+        None,
+        [0.0, 1.6, 1.6, 3.19],
+        [1.6, 1.6, 3.2, 3.2],
+        audio=(episodio, TAXA),
+    )
+
+    assert resultados[1] == []
+    assert resultados[2][0]["start"] == 1.6
+    assert abs(resultados[2][1]["start"] - 1.9) < 0.03
+    assert resultados[2][-1]["end"] == 3.2
+    # Mais caracteres que quadros: distribuição uniforme
+    assert len(resultados[3]) == 5
+    assert resultados[3][-1]["end"] == pytest.approx(3.2, abs=1e-3)
+
+
+def test_alinhar_lote_agrupa_segmentos_por_tamanho(monkeypatch, audio_sintetico):
+    import autodub.adapters.dtw_alignment_adapter as modulo
+
+    chamadas = []
+    original = modulo.dtw_em_banda_lote
+
+    def registrar(unidades, quadros, meia_banda):
+        chamadas.append((len(unidades), max(len(q) for q in quadros), meia_banda))
+        return original(unidades, quadros, meia_banda)
+
+    monkeypatch.setattr(modulo, "dtw_em_banda_lote", registrar)
+    longo = "sss aaa sss aaa " * 8
+    episodio = np.tile(audio_sintetico, 8)
+    resultados = AlinhadorDtw().alinhar_lote(
+        [longo, "sa", "as"], None, [0.0, 0.0, 0.3], [12.8, 0.3, 0.6], audio=(episodio, TAXA)
+    )
+
+    # O segmento longo não impõe seus quadros nem sua banda aos curtos
+    assert sorted(chamadas) == [(1, 1278, 15), (2, 28, 8)]
+    assert len(resultados[0]) == 32
+    assert [len(r) for r in resultados[1:]] == [1, 1]
@@ -0,0 +1,43 @@
+import json
+
+import numpy as np
+
+from autodub.utils.audio_io import pcm16_para_wav_bytes
+from autodub.utils.duration_predictor import PreditorDuracao, contar_silabas, duracao_wav
+
+
+def test_contar_silabas():
+    assert contar_silabas("casa bonita") == 5
+    assert contar_silabas("こんにちは") == 5
+    assert contar_silabas("") == 0
+
+
+def test_prever_e_sinalizar_excesso_pela_taxa_padrao():
+    preditor = PreditorDuracao()
+    textos = ["casa", "uma frase bem mais comprida que o trecho disponível"]
+    previstas = preditor.prever(textos, "pt-br")
+    assert np.allclose(previstas[0], 2 / 6.0)
+
+    excesso = preditor.sinalizar_excesso(textos, np.array([1.0, 1.0]), "pt-BR")
+    assert excesso.tolist() == [False, True]
+    assert preditor.sinalizar_excesso(["a"], np.array([0.0]), "pt").tolist() == [True]
+
+
+def test_calibracao_com_wav_persiste_entre_execucoes(tmp_path):
+    caminho = tmp_path / "calibracao.json"
+    preditor = PreditorDuracao(caminho, min_amostras=2)
+    wav_um_segundo = pcm16_para_wav_bytes(np.zeros(16000, dtype=np.int16))
+
+    preditor.registrar_wav("casa bonita", "en", wav_um_segundo)  # 5 sílabas em 1 s
+    preditor.registrar_wav("casa bonita", "en", wav_um_segundo)
+    preditor.registrar_wav("ignorado", "en", b"nao e wav")
+    preditor.salvar()
+
+    assert json.loads(caminho.read_text())["en"]["amostras"] == 2
+    assert PreditorDuracao(caminho, min_amostras=2).taxa("en-US") == 5.0
+    assert PreditorDuracao(caminho, min_amostras=3).taxa("en") == 5.5
+
+
+def test_duracao_wav():
+    assert duracao_wav(pcm16_para_wav_bytes(np.zeros(8000), sample_rate=16000)) == 0.5
+    assert duracao_wav(b"") is None
@@ -78,3 +78,123 @@ def test_extracao_falha(monkeypatch):
         match="Falha ao extrair embedding de dummy.wav: Arquivo de áudio corrompido",
     ):
         extrator.extrair("dummy.wav")
+
+
+def test_extrator_modo_amostrado_usa_apenas_trechos(monkeypatch):
+    """Com max_segundos_amostra, só os trechos amostrados chegam ao preprocess_wav."""
+    modulo = "autodub.adapters.embedding_extractor_adapter"
+    chamadas = []
+
+    def fake_amostrar(caminho, max_segundos, janela_segundos):
+        chamadas.append((caminho, max_segundos, janela_segundos))
+        return np.ones(16000, dtype=np.float32), 16000
+
+    def fake_preprocess(origem, source_sr=None):
+        assert isinstance(origem, np.ndarray)
+        assert source_sr == 16000
+        return origem
+
+    class FakeEncoder:
+        def __init__(self, device=None):
+            pass
+
+        def embed_utterance(self, wav):
+            return np.array([float(len(wav))])
+
+    monkeypatch.setattr(f"{modulo}.amostrar_fala", fake_amostrar)
+    monkeypatch.setattr(f"{modulo}.preprocess_wav", fake_preprocess)
+    monkeypatch.setattr(f"{modulo}.VoiceEncoder", FakeEncoder)
+
+    extrator = ResemblyzerEmbedding(max_segundos_amostra=60.0, janela_segundos=2.0)
+    embedding = extrator.extrair("filme.wav")
+    assert chamadas == [("filme.wav", 60.0, 2.0)]
+    assert embedding.tolist() == [16000.0]
+
+
+def test_extrator_modo_amostrado_sem_fala_usa_arquivo_inteiro(monkeypatch):
+    """Se a amostragem não encontrar janelas, o arquivo inteiro é processado."""
+    modulo = "autodub.adapters.embedding_extractor_adapter"
+    monkeypatch.setattr(
+        f"{modulo}.amostrar_fala", lambda *a: (np.zeros(0, dtype=np.float32), 16000)
+    )
+    monkeypatch.setattr(f"{modulo}.preprocess_wav", lambda origem: [0.1, 0.2])
+
+    class FakeEncoder:
+        def __init__(self, device=None):
+            pass
+
+        def embed_utterance(self, wav):
+            return np.array(wav)
+
+    monkeypatch.setattr(f"{modulo}.VoiceEncoder", FakeEncoder)
+
+    extrator = ResemblyzerEmbedding(max_segundos_amostra=30.0)
+    assert np.allclose(extrator.extrair("curto.wav"), [0.1, 0.2])
+
+
+def test_extrair_lote_agrupa_fatias_em_passadas_do_encoder(monkeypatch):
+    """As fatias de todos os arquivos são agrupadas em lotes de `tamanho_lote`."""
+    modulo = "autodub.adapters.embedding_extractor_adapter"
+    monkeypatch.setattr(f"{modulo}.preprocess_wav", lambda caminho: np.full(3, len(caminho)))
+
+    class FakeEncoder:
+        def __init__(self, device=None):
+            pass
+
+    monkeypatch.setattr(f"{modulo}.VoiceEncoder", FakeEncoder)
+
+    passadas = []
+
+    def fake_fatias(self, wav):
+        # arquivo "a.wav" (5 letras) gera 1 fatia; "bb.wav" (6 letras) gera 2 fatias
+        return np.full((int(wav[0]) - 4, 2), float(wav[0]))
+
+    def fake_codificar(self, mels):
+        passadas.append(len(mels))
+        return np.stack([mels[:, 0], np.ones(len(mels))], axis=1)
+
+    monkeypatch.setattr(ResemblyzerEmbedding, "_fatias_mel", fake_fatias)
+    monkeypatch.setattr(ResemblyzerEmbedding, "_codificar_parciais", fake_codificar)
+
+    extrator = ResemblyzerEmbedding(tamanho_lote=2)
+    embeddings = extrator.extrair_lote(["a.wav", "bb.wav"])
+
+    assert passadas == [2, 1]
+    assert len(embeddings) == 2
+    assert np.allclose(embeddings[0], np.array([5.0, 1.0]) / np.linalg.norm([5.0, 1.0]))
+    assert np.allclose(embeddings[1], np.array([6.0, 1.0]) / np.linalg.norm([6.0, 1.0]))
+    assert extrator.extrair_lote([]) == []
+
+
+def test_extrair_lote_falha_identifica_arquivo(monkeypatch):
+    modulo = "autodub.adapters.embedding_extractor_adapter"
+
+    def preprocess_que_falha(caminho):
+        raise ValueError("corrompido")
+
+    class FakeEncoder:
+        def __init__(self, device=None):
+            pass
+
+    monkeypatch.setattr(f"{modulo}.preprocess_wav", preprocess_que_falha)
+    monkeypatch.setattr(f"{modulo}.VoiceEncoder", FakeEncoder)
+
+    with pytest.raises(RuntimeError, match="Falha ao extrair embedding de ruim.wav"):
+        ResemblyzerEmbedding().extrair_lote(["ruim.wav"])
+
+
+def test_definir_threads_limita_torch_e_preprocessamento(monkeypatch):
+    modulo = "autodub.adapters.embedding_extractor_adapter"
+    chamadas = []
+
+    class FakeEncoder:
+        def __init__(self, device=None):
+            pass
+
+    monkeypatch.setattr(f"{modulo}.VoiceEncoder", FakeEncoder)
+    monkeypatch.setattr(f"{modulo}.torch.set_num_threads", chamadas.append, raising=False)
+
+    extrator = ResemblyzerEmbedding()
+    extrator.definir_threads(2)
+    assert chamadas == [2]
+    assert extrator.trabalhadores_preprocessamento == 2
@@ -1,4 +1,12 @@
+import threading
+import time
+import wave
+
+import numpy as np
+import pytest
+
 from autodub.adapters.mocks.ffmpeg_wrapper import FakeFFmpegWrapper
+from autodub.adapters.real_ffmpeg_wrapper_adapter import RealFFmpegWrapper, codigo_idioma
 
 
 def test_extract_audio_cria_arquivo(tmp_path):
@@ -21,3 +29,249 @@ def test_mux_audio_cria_arquivo(tmp_path):
     with open(out_path, "rb") as f:
         conteudo = f.read()
     assert conteudo == b"FAKE_VIDEO_WITH_AUDIO"
+
+
+def _escrever_wav(caminho, amostras, taxa=16000):
+    with wave.open(str(caminho), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(taxa)
+        wf.writeframes(amostras.astype("<i2").tobytes())
+
+
+def test_stream_audio_le_wav_em_blocos(tmp_path):
+    amostras = np.arange(2500, dtype=np.int16)
+    _escrever_wav(tmp_path / "a.wav", amostras)
+
+    blocos = list(FakeFFmpegWrapper().stream_audio(str(tmp_path / "a.wav"), chunk_samples=1000))
+
+    assert [len(b) for b in blocos] == [1000, 1000, 500]
+    assert np.array_equal(np.concatenate(blocos), amostras)
+    with pytest.raises(ValueError):
+        list(FakeFFmpegWrapper().stream_audio(str(tmp_path / "a.wav"), sample_rate=8000))
+
+
+def test_stream_audio_segue_arquivo_crescente(tmp_path):
+    caminho = tmp_path / "crescente.wav"
+    _escrever_wav(caminho, np.ones(300, dtype=np.int16))
+
+    def crescer():
+        for _ in range(3):
+            time.sleep(0.05)
+            with open(caminho, "ab") as f:
+                f.write(np.full(300, 2, dtype="<i2").tobytes())
+
+    escritor = threading.Thread(target=crescer)
+    escritor.start()
+    blocos = list(
+        FakeFFmpegWrapper().stream_audio(
+            str(caminho), chunk_samples=400, follow=True, poll_interval=0.01, idle_timeout=0.3
+        )
+    )
+    escritor.join()
+
+    audio = np.concatenate(blocos)
+    assert len(audio) == 1200
+    assert (audio == 2).sum() == 900
+
+
+def _capturar_comandos(monkeypatch):
+    comandos = []
+    monkeypatch.setattr(
+        "autodub.adapters.real_ffmpeg_wrapper_adapter.subprocess.run",
+        lambda cmd, **kwargs: comandos.append(cmd),
+    )
+    return comandos
+
+
+def test_mux_faixas_em_uma_invocacao(monkeypatch):
+    comandos = _capturar_comandos(monkeypatch)
+    wrapper = RealFFmpegWrapper(audio_codec="opus", audio_bitrate="96k")
+
+    wrapper.mux_faixas(
+        "video.mp4", [("pt-br", "pt.wav"), ("es", "es.wav")], "out.mp4", keep_original=True
+    )
+
+    assert len(comandos) == 1
+    cmd = comandos[0]
+    assert cmd.count("-i") == 3
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert cmd[cmd.index("-c:a") + 1] == "libopus"
+    assert cmd[cmd.index("-b:a") + 1] == "96k"
+    mapas = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+    assert mapas == ["0:v:0?", "1:a:0", "2:a:0", "0:a:0?"]
+    assert cmd[cmd.index("-c:a:2") + 1] == "copy"
+    assert "language=por" in cmd and "language=spa" in cmd
+    assert cmd[cmd.index("-disposition:a:0") + 1] == "default"
+    assert cmd[-1] == "out.mp4"
+
+
+def test_mux_audio_codifica_direto_no_codec(monkeypatch):
+    comandos = _capturar_comandos(monkeypatch)
+
+    RealFFmpegWrapper().mux_audio("video.mp4", "audio.wav", "out.mp4")
+
+    cmd = comandos[0]
+    assert cmd[cmd.index("-c:a") + 1] == "aac"
+    assert cmd[cmd.index("-b:a") + 1] == "128k"
+    assert not any(arg.startswith("language=") for arg in cmd)
+
+
+def test_mux_faixas_valida_parametros():
+    with pytest.raises(ValueError):
+        RealFFmpegWrapper(audio_codec="mp3")
+    with pytest.raises(ValueError):
+        RealFFmpegWrapper().mux_faixas("video.mp4", [], "out.mp4")
+    assert codigo_idioma("pt-BR") == "por"
+    assert codigo_idioma("ko") == "ko"
+
+
+def test_mux_pcm_envia_blocos_pela_entrada_padrao(monkeypatch):
+    import subprocess
+
+    class ProcessoFalso:
+        def __init__(self, cmd, stdin, stdout, stderr):
+            self.cmd = cmd
+            self.stdin = self
+            self.recebido = b""
+            processos.append(self)
+
+        def write(self, dados):
+            self.recebido += dados
+
+        def close(self):
+            pass
+
+        def wait(self):
+            return 0
+
+        def poll(self):
+            return 0
+
+    processos = []
+    monkeypatch.setattr(subprocess, "Popen", ProcessoFalso)
+    blocos = [np.arange(3, dtype=np.int16), np.zeros(2, dtype=np.int16)]
+
+    RealFFmpegWrapper().mux_pcm("video.mp4", iter(blocos), 22050, "out.mp4", language="es")
+
+    processo = processos[0]
+    cmd = processo.cmd
+    entrada = cmd.index("pipe:0")
+    assert cmd[entrada - 7 : entrada - 1] == ["-f", "s16le", "-ar", "22050", "-ac", "1"]
+    assert "language=spa" in cmd
+    assert processo.recebido == np.concatenate(blocos).astype("<i2").tobytes()
+
+
+def test_mux_pcm_erro_do_ffmpeg(monkeypatch):
+    import subprocess
+
+    class ProcessoQueFalha:
+        def __init__(self, cmd, stdin, stdout, stderr):
+            stderr.write(b"codec desconhecido")
+            self.stdin = self
+
+        def write(self, dados):
+            raise BrokenPipeError
+
+        def close(self):
+            pass
+
+        def wait(self):
+            return 1
+
+        def poll(self):
+            return 1
+
+    monkeypatch.setattr(subprocess, "Popen", ProcessoQueFalha)
+    with pytest.raises(RuntimeError, match="codec desconhecido"):
+        RealFFmpegWrapper().mux_pcm("video.mp4", [np.zeros(4, np.int16)], 16000, "out.mp4")
+
+
+def test_mux_pcm_erro_no_gerador_mata_antes_de_fechar(monkeypatch, tmp_path):
+    import subprocess
+
+    eventos = []
+    saida = tmp_path / "out.mp4"
+
+    class ProcessoFalso:
+        def __init__(self, cmd, stdin, stdout, stderr):
+            self.stdin = self
+            self.vivo = True
+            saida.write_bytes(b"parcial")
+
+        def write(self, dados):
+            eventos.append("write")
+
+        def close(self):
+            # EOF com o processo vivo deixaria o ffmpeg finalizar a saída
+            eventos.append("close" if not self.vivo else "eof")
+
+        def kill(self):
+            eventos.append("kill")
+            self.vivo = False
+
+        def wait(self):
+            return -9 if not self.vivo else 0
+
+        def poll(self):
+            return None if self.vivo else -9
+
+    def blocos():
+        yield np.zeros(4, np.int16)
+        raise ValueError("fala corrompida")
+
+    monkeypatch.setattr(subprocess, "Popen", ProcessoFalso)
+    with pytest.raises(ValueError, match="fala corrompida"):
+        RealFFmpegWrapper().mux_pcm("video.mp4", blocos(), 16000, saida)
+
+    assert eventos == ["write", "kill", "close"]
+    assert not saida.exists()
+
+
+def test_duration_usa_ffprobe(monkeypatch):
+    import subprocess
+
+    class Resultado:
+        stdout = b'{"format": {"format_name": "mov,mp4", "duration": "12.5"}}'
+
+    comandos = []
+
+    def executar(cmd, **kwargs):
+        comandos.append(cmd)
+        if cmd[-1] == "quebrado.mp4":
+            raise subprocess.CalledProcessError(1, cmd)
+        return Resultado()
+
+    monkeypatch.setattr(subprocess, "run", executar)
+
+    assert RealFFmpegWrapper().duration("video.mp4") == 12.5
+    assert comandos[0][0] == "ffprobe"
+    assert RealFFmpegWrapper().duration("quebrado.mp4") is None
+
+
+def test_probe_descreve_fluxos(monkeypatch):
+    import json
+    import subprocess
+
+    saida = {
+        "format": {"format_name": "wav", "duration": "3.000000"},
+        "streams": [
+            {
+                "codec_type": "audio",
+                "codec_name": "pcm_s16le",
+                "sample_rate": "16000",
+                "channels": 1,
+            }
+        ],
+    }
+
+    class Resultado:
+        stdout = json.dumps(saida).encode()
+
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kwargs: Resultado())
+
+    assert RealFFmpegWrapper().probe("a.wav") == {
+        "formato": "wav",
+        "duracao": 3.0,
+        "fluxos": [{"tipo": "audio", "codec": "pcm_s16le", "taxa": 16000, "canais": 1}],
+    }
@@ -10,6 +10,7 @@ from typing import List, Tuple
 from autodub.interfaces.alignment_interface import IAlignment
 from autodub.interfaces.asr_interface import IAsr
 from autodub.interfaces.embedding_interface import IEmbeddingExtractor
+from autodub.interfaces.translator_interface import ITranslator
 from autodub.interfaces.tts_interface import ITts
 
 
@@ -57,7 +58,28 @@ def test_embedding_interface():
     assert len(vetor) == 3
 
 
+def test_embedding_interface_lote_fallback_sequencial():
+    class EmbeddingExplicito(IEmbeddingExtractor):
+        def extrair(self, caminho_audio: str) -> List[float]:
+            return [float(len(caminho_audio))]
+
+    emb = EmbeddingExplicito()
+    assert emb.extrair_lote(["a.wav", "bb.wav"]) == [[5.0], [6.0]]
+
+
 def test_alignment_interface():
     align: IAlignment = MockAlignment()
     resultado = align.alinhar("teste", "fake.wav")
     assert resultado[0][0] == "teste"
+
+
+def test_translator_interface_condensar_padrao_e_mock():
+    from autodub.adapters.mocks.mock_translator import MockTranslator
+
+    class TradutorSimples(ITranslator):
+        def traduzir(self, texto: str, target_lang: str) -> str:
+            return texto
+
+    assert TradutorSimples().condensar("longo demais", "pt", 0.5) == "longo demais"
+    assert MockTranslator().condensar("um dois três quatro", "pt", 1.0) == "um dois três"
+    assert MockTranslator().condensar("um dois", "pt", 0.0) == "um"
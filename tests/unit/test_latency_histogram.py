@@ -0,0 +1,27 @@
+import pytest
+
+from autodub.utils.latency_histogram import HistogramaLatencia
+
+
+def test_percentis_e_resumo():
+    histograma = HistogramaLatencia()
+    for ms in range(1, 101):
+        histograma.registrar(ms / 1000)
+
+    assert histograma.percentil(50) == pytest.approx(0.05, rel=0.3)
+    assert histograma.percentil(99) <= histograma.maximo == 0.1
+    resumo = histograma.resumo()
+    assert resumo["contagem"] == 100
+    assert resumo["media"] == pytest.approx(0.0505)
+    assert sum(resumo["baldes"].values()) == 100
+
+
+def test_vazio_e_estouro():
+    histograma = HistogramaLatencia(minimo=0.01, maximo=1.0)
+    assert histograma.percentil(90) == 0.0
+    histograma.registrar(5.0)
+    assert histograma.resumo()["baldes"] == {"estouro": 1}
+    assert histograma.percentil(50) == 5.0
+
+    with pytest.raises(ValueError):
+        HistogramaLatencia(minimo=1.0, maximo=0.5)
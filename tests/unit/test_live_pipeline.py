@@ -0,0 +1,116 @@
+import io
+import itertools
+import wave
+
+import numpy as np
+import pytest
+
+from autodub.adapters.mocks.ffmpeg_wrapper import FakeFFmpegWrapper
+from autodub.adapters.mocks.mock_tts import MockTTS
+from autodub.live_pipeline import PipelineAoVivo
+
+TAXA = 16000
+
+
+class AsrPorDuracao:
+    """Um segmento por segundo completo da janela (o último vai até o fim)."""
+
+    def __init__(self):
+        self.janelas = []
+
+    def transcrever(self, caminho_audio):
+        with wave.open(caminho_audio) as wf:
+            duracao = wf.getnframes() / wf.getframerate()
+        self.janelas.append(duracao)
+        inicios = np.arange(0.0, duracao, 1.0)
+        return [
+            {"texto": f"fala {k}", "inicio": float(a), "fim": float(min(a + 1.0, duracao))}
+            for k, a in enumerate(inicios)
+        ]
+
+
+class TradutorMaiusculo:
+    def traduzir(self, texto, idioma):
+        return texto.upper()
+
+
+def _blocos(segundos, tamanho=4000):
+    audio = np.zeros(int(segundos * TAXA), dtype=np.int16)
+    return [audio[i : i + tamanho] for i in range(0, len(audio), tamanho)]
+
+
+def test_janelas_moveis_adiam_segmento_no_fim_da_janela(tmp_path):
+    asr = AsrPorDuracao()
+    pipeline = PipelineAoVivo(
+        asr,
+        MockTTS(duration_seconds=0.2),
+        translator=TradutorMaiusculo(),
+        janela_segundos=2.5,
+        diretorio_saida=tmp_path,
+    )
+
+    trechos = list(pipeline.executar(_blocos(6.0)))
+
+    # Janela de 2.5s: [0,1) e [1,2) saem; [2,2.5) termina no fim da janela e é adiado
+    assert asr.janelas[0] == 2.5
+    assert [t["inicio"] for t in trechos] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert trechos[0]["texto_traduzido"] == "FALA 0"
+    assert trechos[-1]["fim"] == 6.0
+    assert (tmp_path / "trecho_000005.wav").read_bytes() == trechos[5]["wav"]
+    with wave.open(io.BytesIO(trechos[0]["wav"])) as wf:
+        assert wf.getframerate() == TAXA
+
+    relatorio = pipeline.relatorio
+    assert relatorio["trechos"] == 6
+    assert relatorio["latencias"]["asr"]["contagem"] == relatorio["janelas"]
+    assert relatorio["latencias"]["tts"]["contagem"] == 6
+    assert relatorio["latencias"]["traducao"]["contagem"] == 6
+
+
+def test_latencia_ponta_a_ponta_usa_chegada_do_audio():
+    tempos = itertools.count(0.0, 0.5)  # cada consulta ao relógio avança 0,5 s
+    pipeline = PipelineAoVivo(
+        AsrPorDuracao(),
+        MockTTS(duration_seconds=0.1),
+        latencia_alvo=2.0,
+        relogio=lambda: next(tempos),
+    )
+
+    trechos = list(pipeline.executar(_blocos(2.0, tamanho=8000)))
+
+    assert all(t["latencia"] > 0 for t in trechos)
+    ponta = pipeline.relatorio["latencias"]["ponta_a_ponta"]
+    assert ponta["contagem"] == len(trechos) == 2
+    assert pipeline.relatorio["acima_da_latencia_alvo"] == sum(
+        t["latencia"] > 2.0 for t in trechos
+    )
+
+
+def test_segmento_que_ocupa_a_janela_nao_trava():
+    class AsrUmSegmento:
+        def transcrever(self, caminho_audio):
+            with wave.open(caminho_audio) as wf:
+                return [
+                    {"texto": "tudo", "inicio": 0.0, "fim": wf.getnframes() / wf.getframerate()}
+                ]
+
+    pipeline = PipelineAoVivo(AsrUmSegmento(), MockTTS(), janela_segundos=1.0)
+    trechos = list(pipeline.executar(_blocos(3.0)))
+    assert [t["inicio"] for t in trechos] == [0.0, 1.0, 2.0]
+
+
+def test_entrada_por_arquivo_via_ffmpeg(tmp_path):
+    from autodub.utils.audio_io import pcm16_para_wav_bytes
+
+    caminho = tmp_path / "entrada.wav"
+    caminho.write_bytes(pcm16_para_wav_bytes(np.zeros(3 * TAXA, dtype=np.int16)))
+
+    pipeline = PipelineAoVivo(
+        AsrPorDuracao(), MockTTS(), ffmpeg=FakeFFmpegWrapper(), janela_segundos=2.0
+    )
+    assert len(list(pipeline.executar(str(caminho)))) == 3
+
+    with pytest.raises(ValueError):
+        list(PipelineAoVivo(AsrPorDuracao(), MockTTS()).executar(str(caminho)))
+    with pytest.raises(ValueError):
+        PipelineAoVivo(AsrPorDuracao(), MockTTS(), janela_segundos=1.0, margem_segundos=1.0)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from autodub.adapters.mocks.mock_alignment import alinhar_palavras
 
 
@@ -51,3 +53,47 @@ def test_consistencia_temporal():
         atual = resultado[indice]
         assert anterior["end"] == atual["start"]
         assert atual["end"] > atual["start"]
+
+
+def test_lote_equivale_a_chamadas_individuais():
+    """O lote deve produzir exatamente o mesmo que alinhar_palavras por segmento."""
+    from autodub.adapters.mocks.mock_alignment import alinhar_palavras_lote
+
+    textos = ["Olá mundo", "", "um dois três", "único"]
+    inicios = [0.0, 1.0, 2.0, 7.5]
+    duracoes = [1.0, 2.0, 3.0, None]
+
+    lote = alinhar_palavras_lote(textos, inicios, duracoes)
+
+    esperado = [alinhar_palavras(t, i, d) for t, i, d in zip(textos, inicios, duracoes)]
+    assert lote.para_dicts() == esperado
+    assert len(lote) == 4
+    assert lote.deslocamentos.tolist() == [0, 2, 2, 5, 6]
+    assert lote.segmento.tolist() == [0, 0, 2, 2, 2, 3]
+
+
+def test_lote_equivale_com_inicios_grandes_aleatorios():
+    from autodub.adapters.mocks.mock_alignment import alinhar_palavras_lote
+
+    gerador = np.random.default_rng(0)
+    textos = [" ".join(["w"] * int(n)) for n in gerador.integers(0, 12, 2000)]
+    inicios = np.round(gerador.uniform(0, 7200, len(textos)), 3).tolist()
+    duracoes = [
+        None if k % 7 == 0 else d
+        for k, d in enumerate(np.round(gerador.uniform(0.1, 8.0, len(textos)), 3).tolist())
+    ]
+    textos[0], inicios[0], duracoes[0] = "w w w w w w w w", 4256.305, 1.292
+
+    lote = alinhar_palavras_lote(textos, inicios, duracoes)
+
+    esperado = [alinhar_palavras(t, i, d) for t, i, d in zip(textos, inicios, duracoes)]
+    assert lote.para_dicts() == esperado
+    assert lote[0][0]["end"] == 4256.467
+
+
+def test_lote_sem_duracoes_usa_meio_segundo():
+    from autodub.adapters.mocks.mock_alignment import alinhar_palavras_lote
+
+    lote = alinhar_palavras_lote(["a b"], [1.0])
+    assert lote.start.tolist() == [1.0, 1.5]
+    assert lote.end.tolist() == [1.5, 2.0]
@@ -12,3 +12,14 @@ def test_extrair_embedding_valores_fixos():
     emb = MockEmbedding()
     saida = emb.extrair_embedding("qualquer.wav")
     assert saida == [0.1, 0.2, 0.3]
+
+
+def test_extrair_conforme_interface():
+    emb = MockEmbedding()
+    assert emb.extrair("qualquer.wav") == [0.1, 0.2, 0.3]
+
+
+def test_extrair_lote_um_vetor_por_arquivo():
+    emb = MockEmbedding()
+    saida = emb.extrair_lote(["a.wav", "b.wav"])
+    assert saida == [[0.1, 0.2, 0.3], [0.1, 0.2, 0.3]]
@@ -1,3 +1,5 @@
+import pytest
+
 from autodub.adapters.mocks.mock_vocoder import MockVocoder
 
 
@@ -6,3 +8,15 @@ def test_sintetizar_from_mel_retorna_bytes():
     saida = vocoder.sintetizar_from_mel([[0.1, 0.2], [0.3, 0.4]])
     assert isinstance(saida, bytes)
     assert saida == b"FAKE_VOCODER_AUDIO"
+
+
+def test_mock_vocoder_streaming_gera_um_periodo_por_quadro():
+    import numpy as np
+
+    from autodub.adapters.mocks.mock_vocoder import MockVocoderStreaming
+
+    vocoder = MockVocoderStreaming(amostras_por_quadro=100)
+    audio = vocoder.sintetizar_bloco(np.zeros((3, 80)))
+    assert audio.shape == (300,)
+    assert np.allclose(audio[:100], audio[100:200])
+    assert np.max(np.abs(audio)) == pytest.approx(0.25, abs=1e-3)
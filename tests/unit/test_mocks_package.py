@@ -22,6 +22,7 @@ def test_classes_existentes():
         "MockTTS",
         "MockEmbedding",
         "MockVocoder",
+        "MockVocoderStreaming",
         "FakeFFmpegWrapper",
     ]:
         assert hasattr(mod, expected)
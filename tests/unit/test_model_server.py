@@ -0,0 +1,143 @@
+import os
+import socket
+import socketserver
+import stat
+
+import numpy as np
+import pytest
+
+from autodub.adapters.mocks.mock_asr import MockASR
+from autodub.adapters.mocks.mock_embedding import MockEmbedding
+from autodub.adapters.mocks.mock_tts import MockTTS
+from autodub.adapters.model_server_client_adapter import (
+    AsrServidorModelos,
+    ClienteServidorModelos,
+    EmbeddingServidorModelos,
+    TtsServidorModelos,
+)
+from autodub.model_server import ServidorModelos, enviar_mensagem, receber_mensagem
+
+
+class TTSComEmbedding:
+    def sintetizar(self, texto, embedding=None):
+        sufixo = "" if embedding is None else f"|{len(embedding)}"
+        return f"{texto}{sufixo}".encode("utf-8")
+
+
+class EmbeddingSemLote:
+    def extrair(self, caminho_audio):
+        return [1.0, 2.0]
+
+
+@pytest.fixture
+def servidor(tmp_path):
+    with ServidorModelos(
+        tmp_path / "modelos.sock", asr=MockASR(), embedding=MockEmbedding(), tts=MockTTS()
+    ) as servidor_modelos:
+        yield servidor_modelos
+
+
+def test_status_e_permissao_do_socket(servidor):
+    cliente = ClienteServidorModelos(servidor.caminho_socket)
+    status = cliente.status()
+    assert status["modelos"] == ["asr", "embedding", "tts"]
+    assert stat.S_IMODE(servidor.caminho_socket.stat().st_mode) == 0o600
+
+
+def test_clientes_implementam_interfaces_via_servidor(servidor):
+    cliente = ClienteServidorModelos(servidor.caminho_socket, timeout=5)
+
+    segmentos = AsrServidorModelos(cliente).transcrever("audio_teste.wav")
+    assert [segmento["texto"] for segmento in segmentos] == [
+        "Olá, este é um teste.",
+        "MockASR funcionando.",
+    ]
+
+    embedding = EmbeddingServidorModelos(cliente)
+    assert np.allclose(embedding.extrair("a.wav"), [0.1, 0.2, 0.3])
+    lote = embedding.extrair_lote(["a.wav", "b.wav"])
+    assert len(lote) == 2
+    assert lote[1].dtype == np.float32
+
+    audio = TtsServidorModelos(cliente).sintetizar("Olá")
+    assert audio == MockTTS().sintetizar("Olá")
+
+
+def test_sintetizar_envia_embedding_binario(tmp_path):
+    with ServidorModelos(tmp_path / "s.sock", tts=TTSComEmbedding()) as servidor_modelos:
+        tts = TtsServidorModelos(ClienteServidorModelos(servidor_modelos.caminho_socket))
+        assert tts.sintetizar("oi", embedding=[0.1, 0.2, 0.3]) == b"oi|3"
+
+
+def test_extrair_lote_sem_suporte_nativo_usa_extrair(tmp_path):
+    with ServidorModelos(tmp_path / "s.sock", embedding=EmbeddingSemLote()) as servidor_modelos:
+        embedding = EmbeddingServidorModelos(
+            ClienteServidorModelos(servidor_modelos.caminho_socket)
+        )
+        assert [v.tolist() for v in embedding.extrair_lote(["a", "b"])] == [[1.0, 2.0]] * 2
+
+
+def test_erros_do_servidor_viram_runtime_error(tmp_path):
+    with ServidorModelos(tmp_path / "s.sock", tts=MockTTS()) as servidor_modelos:
+        cliente = ClienteServidorModelos(servidor_modelos.caminho_socket)
+        with pytest.raises(RuntimeError, match="Modelo 'asr' não está carregado"):
+            AsrServidorModelos(cliente).transcrever("a.wav")
+        with pytest.raises(RuntimeError, match="Operação desconhecida"):
+            cliente.chamar("inexistente")
+
+
+def test_pedido_truncado_e_ignorado(servidor):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        conexao.connect(str(servidor.caminho_socket))
+        conexao.sendall(b"\x00\x00")
+    # o servidor continua atendendo normalmente
+    assert ClienteServidorModelos(servidor.caminho_socket).status()["modelos"]
+
+
+def test_protocolo_ida_e_volta_com_corpo():
+    lado_a, lado_b = socket.socketpair()
+    with lado_a, lado_b:
+        enviar_mensagem(lado_a, {"operacao": "x"}, b"\x01\x02")
+        cabecalho, corpo = receber_mensagem(lado_b)
+    assert cabecalho == {"operacao": "x", "tamanho_corpo": 2}
+    assert corpo == b"\x01\x02"
+
+
+def test_cliente_sem_servidor(tmp_path):
+    cliente = ClienteServidorModelos(tmp_path / "ausente.sock")
+    with pytest.raises(RuntimeError, match="inacessível"):
+        cliente.status()
+
+
+def test_iniciar_remove_socket_antigo_e_encerrar_limpa(tmp_path, monkeypatch):
+    caminho = tmp_path / "antigo.sock"
+    caminho.write_text("resto de execução anterior")
+    servidor_modelos = ServidorModelos(caminho, asr=MockASR())
+    modos_no_listen = []
+    server_activate = socketserver.UnixStreamServer.server_activate
+
+    def registrar_modo(servidor):
+        modos_no_listen.append(stat.S_IMODE(caminho.stat().st_mode))
+        server_activate(servidor)
+
+    # A umask é do processo inteiro: o servidor não pode mexer nela
+    monkeypatch.setattr(os, "umask", lambda *args: pytest.fail("umask alterada"))
+    monkeypatch.setattr(socketserver.UnixStreamServer, "server_activate", registrar_modo)
+    servidor_modelos.iniciar()
+    monkeypatch.undo()
+
+    assert modos_no_listen == [0o600]
+    assert caminho.is_socket()
+    assert stat.S_IMODE(caminho.stat().st_mode) == 0o600
+    servidor_modelos.encerrar()
+    assert not caminho.exists()
+
+
+def test_iniciar_recusa_socket_de_servidor_ativo(servidor):
+    segundo = ServidorModelos(servidor.caminho_socket, asr=MockASR())
+    with pytest.raises(RuntimeError, match="ativo"):
+        segundo.iniciar()
+    segundo.encerrar()
+
+    # O servidor original continua atendendo no mesmo arquivo
+    assert ClienteServidorModelos(servidor.caminho_socket).status()
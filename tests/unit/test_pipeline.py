@@ -173,6 +173,12 @@ def test_pipeline_debug_true(tmp_path, monkeypatch):
     resultado = pipeline_instancia.executar(video_entrada, saida, debug=True)
     assert resultado.exists()
 
+    # Artefatos gravados em segundo plano já estão em disco quando executar retorna
+    linhas = (tmp_path / "transcricao.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(linhas) == 2
+    assert (tmp_path / "audio_extraido.wav").read_bytes() == b"FAKE_AUDIO"
+    assert (tmp_path / "relatorio_execucao.json").exists()
+
 
 def test_pipeline_init_faltando_componentes():
     """Testa validação obrigatória dos componentes."""
@@ -214,7 +220,7 @@ def test_pipeline_executar_erro_e_limpeza(tmp_path, monkeypatch, caplog):
     """Força erro dentro do try para cobrir o bloco except e garantir cleanup."""
     temp_fixo = tmp_path / "autodub_pipeline_fixed"
     temp_fixo.mkdir()
-    monkeypatch.setattr(tempfile, "mkdtemp", lambda prefix="": str(temp_fixo))
+    monkeypatch.setattr(tempfile, "mkdtemp", lambda prefix="", dir=None: str(temp_fixo))
 
     class ExplodingASR:
         def transcrever(self, caminho_audio: str):
@@ -304,14 +310,12 @@ def test_pipeline_com_embedding_varios_tipos(
 
     pipeline_instancia.executar(video_entrada, saida, debug=True)
 
-    arquivo_embedding = saida.parent / "embedding.json"
+    arquivo_embedding = saida.parent / "embedding.npy"
     assert arquivo_embedding.exists()
-    import json
-
-    with open(arquivo_embedding, "r") as f:
-        dados = json.load(f)
+    dados = np.load(arquivo_embedding)
 
-    assert sorted(dados) == sorted(lista_esperada)
+    assert dados.dtype == np.float32
+    assert sorted(dados.tolist()) == sorted(lista_esperada)
 
 
 def test_pipeline_com_embedding_debug_false(tmp_path, monkeypatch):
@@ -332,5 +336,878 @@ def test_pipeline_com_embedding_debug_false(tmp_path, monkeypatch):
 
     pipeline_instancia.executar(video_entrada, saida, debug=False)
 
-    arquivo_embedding = saida.parent / "embedding.json"
+    arquivo_embedding = saida.parent / "embedding.npy"
     assert not arquivo_embedding.exists()
+
+
+class ExtratorQueNaoPodeSerChamado:
+    def extrair(self, caminho_audio: str):
+        raise AssertionError("a extração deveria ter sido pulada")
+
+
+def test_pipeline_reutiliza_voz_da_biblioteca_sem_extrair(tmp_path):
+    """Locutor já cadastrado na biblioteca dispensa a extração de embedding."""
+    from autodub.utils.voice_library import BibliotecaVozes
+
+    biblioteca = BibliotecaVozes(tmp_path / "vozes")
+    biblioteca.adicionar("narrador", [0.0, 1.0, 0.0])
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(),
+        tts=DummyTTS(),
+        ffmpeg=DummyFFmpeg(),
+        embedding=ExtratorQueNaoPodeSerChamado(),
+        biblioteca_vozes=biblioteca,
+    )
+
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    saida = tmp_path / "out.mp4"
+    pipeline_instancia.executar(video_entrada, saida, debug=True, locutor="narrador")
+
+    dados = np.load(saida.parent / "embedding.npy")
+    assert dados.tolist() == [0.0, 1.0, 0.0]
+
+
+def test_pipeline_usa_voz_correspondente_e_cadastra_nova(tmp_path):
+    """Sem correspondência a voz é cadastrada; na execução seguinte ela é reutilizada."""
+    from autodub.utils.voice_library import BibliotecaVozes
+
+    diretorio_vozes = tmp_path / "vozes"
+    biblioteca = BibliotecaVozes(diretorio_vozes)
+    biblioteca.adicionar("outra", [1.0, 0.0, 0.0])
+
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    saida = tmp_path / "out.mp4"
+
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(),
+        tts=DummyTTS(),
+        ffmpeg=DummyFFmpeg(),
+        embedding=DummyEmbedding(),
+        biblioteca_vozes=biblioteca,
+    )
+    pipeline_instancia.executar(video_entrada, saida, locutor="novo")
+    assert "novo" in BibliotecaVozes(diretorio_vozes)
+
+    # Um episódio novo, sem nome de locutor, encontra a voz pela similaridade
+    pipeline_instancia.executar(video_entrada, saida, debug=True)
+    dados = np.load(saida.parent / "embedding.npy")
+    assert np.allclose(dados, np.array([1.0, 2.0, 3.0]) / np.linalg.norm([1.0, 2.0, 3.0]))
+
+
+def test_pipeline_biblioteca_sem_extrator_nem_locutor(tmp_path):
+    """Sem extrator e sem locutor cadastrado, a etapa de embedding é ignorada."""
+    from autodub.utils.voice_library import BibliotecaVozes
+
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(),
+        tts=DummyTTS(),
+        ffmpeg=DummyFFmpeg(),
+        biblioteca_vozes=BibliotecaVozes(tmp_path / "vozes"),
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    saida = tmp_path / "out.mp4"
+
+    pipeline_instancia.executar(video_entrada, saida, debug=True, locutor="ninguem")
+    assert not (saida.parent / "embedding.npy").exists()
+
+
+def test_pipeline_orcamento_threads_no_relatorio(tmp_path, monkeypatch):
+    """O orçamento é aplicado aos adapters com `definir_threads` e vai para o relatório."""
+    import json
+
+    import autodub.pipeline as modulo_pipeline
+
+    monkeypatch.setattr(modulo_pipeline, "aplicar_threads", lambda n: {"threads": n})
+
+    class ASRComThreads(DummyASR):
+        threads = None
+
+        def definir_threads(self, threads):
+            self.threads = threads
+
+    asr_simulado = ASRComThreads()
+    pipeline_instancia = Pipeline(
+        asr=asr_simulado, tts=DummyTTS(), ffmpeg=DummyFFmpeg(), nucleos=8, trabalhadores=2
+    )
+    assert asr_simulado.threads == 4
+
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    saida = tmp_path / "out.mp4"
+    pipeline_instancia.executar(video_entrada, saida, debug=True)
+
+    relatorio = json.loads((tmp_path / "relatorio_execucao.json").read_text())
+    assert relatorio["threads"]["threads_por_trabalhador"] == 4
+    assert relatorio["threads"]["adaptadores"] == {"asr": 4}
+    assert relatorio["threads"]["processo"] == {"threads": 4}
+    assert pipeline_instancia.relatorio == relatorio
+
+
+def test_pipeline_sem_orcamento_nao_registra_threads(tmp_path):
+    pipeline_instancia = Pipeline(asr=DummyASR(), tts=DummyTTS(), ffmpeg=DummyFFmpeg())
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    assert pipeline_instancia.alocacao_threads is None
+    assert "threads" not in pipeline_instancia.relatorio
+    assert not (tmp_path / "relatorio_execucao.json").exists()
+
+
+def test_emoji_por_regex_ignora_maiusculas():
+    from autodub.pipeline import _emoji_da_mensagem
+
+    assert _emoji_da_mensagem("Transcrevendo áudio x.wav") == "📝"
+    assert _emoji_da_mensagem("EXECUÇÃO CONCLUÍDA") == "✅"
+    assert _emoji_da_mensagem("nada a ver") == ""
+    # Várias chaves: vale a ordem de EMOJIS, não a posição na mensagem
+    assert _emoji_da_mensagem("Relatório do preflight gravado") == "🔎"
+
+
+def test_formatador_json():
+    import json
+
+    from autodub.pipeline import JsonFormatter
+
+    registro = logging.LogRecord(
+        "autodub.pipeline", logging.INFO, __file__, 1, "Obtidos %d segmentos", (3,), None
+    )
+    dados = json.loads(JsonFormatter().format(registro))
+    assert dados["nivel"] == "INFO"
+    assert dados["mensagem"] == "Obtidos 3 segmentos"
+    assert dados["logger"] == "autodub.pipeline"
+
+
+def test_setup_logger_assincrono_usa_fila():
+    from logging.handlers import QueueHandler
+
+    import autodub.pipeline as modulo_pipeline
+
+    try:
+        logger = modulo_pipeline.setup_logger(assincrono=True, formato="json")
+        assert isinstance(logger.handlers[0], QueueHandler)
+        assert modulo_pipeline._ouvinte_logs is not None
+
+        logger = modulo_pipeline.setup_logger(assincrono=False, formato="cor")
+        assert isinstance(logger.handlers[0].formatter, modulo_pipeline.ColorFormatter)
+        assert modulo_pipeline._ouvinte_logs is None
+    finally:
+        modulo_pipeline.setup_logger()
+
+
+def test_json_assincrono_mantem_a_excecao_separada(capsys):
+    import json
+
+    import autodub.pipeline as modulo_pipeline
+
+    try:
+        for assincrono in (True, False):
+            logger = modulo_pipeline.setup_logger(assincrono=assincrono, formato="json")
+            try:
+                raise ValueError("quebrou")
+            except ValueError:
+                logger.exception("falhou %s", "aqui")
+            if assincrono:
+                modulo_pipeline._parar_ouvinte_logs()  # esvazia a fila
+            linha = capsys.readouterr().out.strip().splitlines()[-1]
+            dados = json.loads(linha)
+            assert dados["mensagem"] == "falhou aqui"
+            assert "ValueError: quebrou" in dados["excecao"]
+    finally:
+        modulo_pipeline.setup_logger()
+
+
+def test_sintese_loga_resumo_e_nao_cada_segmento(tmp_path, caplog, monkeypatch):
+    import autodub.pipeline as modulo_pipeline
+
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=50), tts=DummyTTS(), ffmpeg=DummyFFmpeg()
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    modulo_pipeline.logger.propagate = True
+    try:
+        with caplog.at_level(logging.INFO, logger="autodub.pipeline"):
+            pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+    finally:
+        modulo_pipeline.logger.propagate = False
+
+    mensagens = [registro.getMessage() for registro in caplog.records]
+    assert not any(m.startswith("Sintetizando segmento") for m in mensagens)
+    assert "Sintetizando: 50/50 segmentos" in " ".join(mensagens)
+
+
+def test_pipeline_ressegmenta_e_registra_economia(tmp_path, monkeypatch):
+    from autodub.utils.resegmentation import Ressegmentador
+
+    class ASRFragmentado:
+        def transcrever(self, caminho_audio: str):
+            return [
+                {"texto": f"palavra{i}", "inicio": i * 0.5, "fim": i * 0.5 + 0.4}
+                for i in range(6)
+            ]
+
+    class TradutorContador:
+        chamadas = 0
+
+        def traduzir(self, texto, idioma_destino):
+            TradutorContador.chamadas += 1
+            return texto
+
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    pipeline_instancia = Pipeline(
+        asr=ASRFragmentado(),
+        tts=DummyTTS(),
+        ffmpeg=DummyFFmpeg(),
+        translator=TradutorContador(),
+        ressegmentador=Ressegmentador(max_lacuna=0.2, min_palavras=3, max_palavras=3),
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    resumo = pipeline_instancia.relatorio["ressegmentacao"]
+    assert resumo["segmentos_entrada"] == 6
+    assert resumo["segmentos_saida"] == 2
+    assert resumo["chamadas_economizadas"] == 8
+    assert TradutorContador.chamadas == 2
+
+
+def test_pipeline_filtro_ignora_segmentos_sem_fala(tmp_path, monkeypatch):
+    from autodub.utils.segment_filter import FiltroSegmentos
+
+    class ASRComMusica:
+        def transcrever(self, caminho_audio: str):
+            return [
+                {"texto": "Olá", "inicio": 0.0, "fim": 1.0, "no_speech_prob": 0.1},
+                {
+                    "texto": "♪",
+                    "inicio": 1.0,
+                    "fim": 2.0,
+                    "no_speech_prob": 0.95,
+                    "avg_logprob": -2.0,
+                },
+            ]
+
+    sintetizados = []
+
+    class TTSRegistrador(DummyTTS):
+        def sintetizar(self, texto: str, voz_id=None):
+            sintetizados.append(texto)
+            return super().sintetizar(texto)
+
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    pipeline_instancia = Pipeline(
+        asr=ASRComMusica(),
+        tts=TTSRegistrador(),
+        ffmpeg=DummyFFmpeg(),
+        filtro_segmentos=FiltroSegmentos(),
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    assert sintetizados == ["Olá"]
+    ignorados = pipeline_instancia.relatorio["segmentos_ignorados"]
+    assert [(item["texto"], item["motivo"]) for item in ignorados] == [("♪", "sem_fala")]
+
+
+def test_pipeline_preve_excesso_e_condensa_antes_do_tts(tmp_path, monkeypatch):
+    from autodub.utils.duration_predictor import PreditorDuracao
+
+    class TradutorProlixo:
+        condensados = []
+
+        def traduzir(self, texto, target_lang):
+            return "uma tradução muito mais longa do que o trecho original permite"
+
+        def condensar(self, texto, target_lang, max_segundos):
+            TradutorProlixo.condensados.append(max_segundos)
+            return "curta"
+
+    sintetizados = []
+
+    class TTSRegistrador(DummyTTS):
+        def sintetizar(self, texto: str, voz_id=None):
+            sintetizados.append(texto)
+            return super().sintetizar(texto)
+
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=2),
+        tts=TTSRegistrador(),
+        ffmpeg=DummyFFmpeg(),
+        translator=TradutorProlixo(),
+        preditor_duracao=PreditorDuracao(tmp_path / "calibracao.json"),
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4", debug=True)
+
+    assert sintetizados == ["curta", "curta"]
+    assert TradutorProlixo.condensados == [1.0, 1.0]
+    excesso = pipeline_instancia.relatorio["excesso_previsto"]
+    assert [item["indice"] for item in excesso] == [0, 1]
+    assert all(item["condensado"] for item in excesso)
+    assert (tmp_path / "calibracao.json").exists()
+
+
+def test_pipeline_condensa_so_os_excedentes_e_preserva_traducoes_vazias(tmp_path):
+    from autodub.interfaces.translator_interface import ITranslator
+    from autodub.utils.duration_predictor import PreditorDuracao
+    from autodub.utils.segment_table import TabelaSegmentos
+
+    class TradutorParcial(ITranslator):
+        def traduzir(self, texto, target_lang):
+            if texto == "SEG0":
+                return "uma tradução muito mais longa do que o trecho original permite"
+            return ""  # sem tradução: sintetiza o original
+
+        def condensar(self, texto, target_lang, max_segundos):
+            return "curta"
+
+    class TradutorSemCondensar(TradutorParcial):
+        condensar = ITranslator.condensar
+
+    def prever(tradutor):
+        pipeline_instancia = Pipeline(
+            asr=DummyASR(),
+            tts=DummyTTS(),
+            ffmpeg=DummyFFmpeg(),
+            translator=tradutor,
+            preditor_duracao=PreditorDuracao(tmp_path / "calibracao.json"),
+        )
+        segmentos = TabelaSegmentos.de_dicts(DummyASR(num_segmentos=2).transcrever(""))
+        for i, texto in enumerate(segmentos.textos("texto")):
+            segmentos[i]["texto_traduzido"] = tradutor.traduzir(texto, "pt")
+        textos = pipeline_instancia._prever_excesso(
+            segmentos,
+            [tradutor.traduzir(t, "pt") or t for t in segmentos.textos("texto")],
+            "pt",
+        )
+        excesso = pipeline_instancia.relatorio["excesso_previsto"]
+        return (
+            textos,
+            segmentos.textos("texto_traduzido"),
+            [(item["indice"], item["condensado"]) for item in excesso],
+        )
+
+    textos, traduzidos, excesso = prever(TradutorParcial())
+    assert textos == ["curta", "SEG1"]
+    assert traduzidos == ["curta", ""]
+    assert excesso == [(0, True)]
+
+    # Padrão da interface: nada muda, o excesso só é registrado
+    textos, traduzidos, excesso = prever(TradutorSemCondensar())
+    assert textos[0].startswith("uma tradução")
+    assert traduzidos[1] == ""
+    assert excesso == [(0, False)]
+
+
+def test_pipeline_monta_trilha_e_comprime_falas_longas(tmp_path):
+    from autodub.utils.audio_io import pcm16_para_wav_bytes, wav_bytes_para_pcm16
+
+    class TTSLongo:
+        """1.2 s de fala para trechos de 1 s."""
+
+        def sintetizar(self, texto: str, voz_id=None):
+            return pcm16_para_wav_bytes(np.full(19200, 0.25, dtype=np.float32))
+
+    class FFmpegQueGuardaAudio(DummyFFmpeg):
+        def mux_audio(self, caminho_video, caminho_audio, caminho_video_saida):
+            self.audio = Path(caminho_audio).read_bytes()
+            super().mux_audio(caminho_video, caminho_audio, caminho_video_saida)
+
+    ffmpeg_simulado = FFmpegQueGuardaAudio()
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=3),
+        tts=TTSLongo(),
+        ffmpeg=ffmpeg_simulado,
+        razao_maxima_esticamento=1.25,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    trilha, taxa = wav_bytes_para_pcm16(ffmpeg_simulado.audio)
+    assert taxa == 16000
+    # Cada fala de 1.2 s coube no seu trecho de 1 s: trilha de 3 s
+    assert len(trilha) == 48000
+    assert pipeline_instancia.relatorio["esticamento"]["segmentos_esticados"] == 3
+    assert pipeline_instancia.relatorio["esticamento"]["segmentos_deslocados"] == 0
+
+
+def test_pipeline_montagem_cai_para_ffmpeg_sem_wav(tmp_path, monkeypatch):
+    chamadas = []
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: chamadas.append(a))
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=2),
+        tts=DummyTTS(),
+        ffmpeg=DummyFFmpeg(),
+        razao_maxima_esticamento=1.25,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    assert len(chamadas) == 1
+    assert "esticamento" not in pipeline_instancia.relatorio
+
+
+class TTSPorTexto:
+    """Fala de 0.5 s com amplitude derivada do texto; conta as chamadas."""
+
+    def __init__(self):
+        self.chamadas = []
+
+    def sintetizar(self, texto: str, voz_id=None):
+        from autodub.utils.audio_io import pcm16_para_wav_bytes
+
+        self.chamadas.append(texto)
+        amplitude = 0.1 + (sum(map(ord, texto)) % 50) / 100
+        return pcm16_para_wav_bytes(np.full(8000, amplitude, dtype=np.float32))
+
+
+class TradutorPrefixo:
+    def traduzir(self, texto, idioma):
+        return f"[{idioma}] {texto}"
+
+
+def _executar_para_redublar(tmp_path, **kwargs):
+    tts = TTSPorTexto()
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=3),
+        tts=tts,
+        ffmpeg=DummyFFmpeg(),
+        translator=TradutorPrefixo(),
+        embedding=DummyEmbedding(),
+        **kwargs,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4", debug=True)
+    return pipeline_instancia, tts, video_entrada
+
+
+def _editar_traducao(caminho, indice, texto):
+    import json
+
+    linhas = [json.loads(linha) for linha in caminho.read_text(encoding="utf-8").splitlines()]
+    linhas[indice]["texto_traduzido"] = texto
+    caminho.write_text("\n".join(json.dumps(linha) for linha in linhas) + "\n", "utf-8")
+
+
+def test_redublar_ressintetiza_so_o_segmento_editado_e_remenda_trilha(tmp_path):
+    from autodub.pipeline import ARQUIVO_TRILHA
+    from autodub.utils.audio_io import wav_bytes_para_pcm16
+
+    pipeline_instancia, tts, video_entrada = _executar_para_redublar(
+        tmp_path, razao_maxima_esticamento=1.25
+    )
+    trilha_antes, _ = wav_bytes_para_pcm16((tmp_path / ARQUIVO_TRILHA).read_bytes())
+    traducao = tmp_path / "transcricao_traduzida.jsonl"
+    _editar_traducao(traducao, 1, "Texto revisado pelo tradutor")
+    tts.chamadas.clear()
+
+    pipeline_instancia.redublar(video_entrada, tmp_path / "out2.mp4", traducao)
+
+    assert tts.chamadas == ["Texto revisado pelo tradutor"]
+    assert pipeline_instancia.relatorio["redublagem"] == {
+        "segmentos": 3,
+        "ressintetizados": 1,
+        "trilha": "remendada",
+    }
+    trilha_depois, _ = wav_bytes_para_pcm16((tmp_path / ARQUIVO_TRILHA).read_bytes())
+    assert len(trilha_depois) == len(trilha_antes)
+    # Só o trecho do segmento 1 ([1 s, 2 s)) mudou
+    assert np.array_equal(trilha_depois[:16000], trilha_antes[:16000])
+    assert np.array_equal(trilha_depois[32000:], trilha_antes[32000:])
+    assert not np.array_equal(trilha_depois[16000:24000], trilha_antes[16000:24000])
+    assert (tmp_path / "out2.mp4").exists()
+
+    # Sem novas edições, nada é ressintetizado
+    tts.chamadas.clear()
+    pipeline_instancia.redublar(video_entrada, tmp_path / "out3.mp4", traducao)
+    assert tts.chamadas == []
+    assert pipeline_instancia.relatorio["redublagem"]["trilha"] == "inalterada"
+
+
+def test_redublar_remonta_quando_tempos_mudam(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    pipeline_instancia, tts, video_entrada = _executar_para_redublar(tmp_path)
+    traducao = tmp_path / "transcricao_traduzida.jsonl"
+    linhas = [json.loads(linha) for linha in traducao.read_text(encoding="utf-8").splitlines()]
+    linhas.append({"texto": "novo", "texto_traduzido": "novo", "inicio": 3.0, "fim": 4.0})
+    traducao.write_text("\n".join(json.dumps(linha) for linha in linhas) + "\n", "utf-8")
+    tts.chamadas.clear()
+
+    pipeline_instancia.redublar(video_entrada, tmp_path / "out2.mp4", traducao)
+
+    assert tts.chamadas == ["novo"]
+    assert pipeline_instancia.relatorio["redublagem"]["trilha"] == "remontada"
+    manifesto = json.loads((tmp_path / "manifesto_sintese.json").read_text(encoding="utf-8"))
+    assert len(manifesto["segmentos"]) == 4
+
+
+def test_redublar_sem_execucao_anterior(tmp_path):
+    pipeline_instancia = Pipeline(asr=DummyASR(), tts=DummyTTS(), ffmpeg=DummyFFmpeg())
+    with pytest.raises(ValueError):
+        pipeline_instancia.redublar("in.mp4", tmp_path / "out.mp4", tmp_path / "x.jsonl")
+
+
+class ASRContador(DummyASR):
+    def __init__(self, num_segmentos=2):
+        super().__init__(num_segmentos)
+        self.chamadas = 0
+
+    def transcrever(self, caminho_audio: str):
+        self.chamadas += 1
+        return super().transcrever(caminho_audio)
+
+
+class FFmpegMultiFaixas(DummyFFmpeg):
+    def __init__(self):
+        self.faixas = None
+
+    def mux_faixas(self, caminho_video, faixas, caminho_video_saida):
+        self.faixas = [(idioma, Path(trilha).read_bytes()) for idioma, trilha in faixas]
+        Path(caminho_video_saida).write_bytes(b"FAKE_VIDEO_MULTIFAIXAS")
+
+
+def test_multilingue_compartilha_asr_e_embedding(tmp_path):
+    asr = ASRContador()
+    tts = TTSPorTexto()
+    pipeline_instancia = Pipeline(
+        asr=asr,
+        tts=tts,
+        ffmpeg=DummyFFmpeg(),
+        translator=TradutorPrefixo(),
+        embedding=DummyEmbedding(),
+        razao_maxima_esticamento=1.25,
+        nucleos=4,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+
+    saidas = pipeline_instancia.executar_multilingue(
+        video_entrada, ["es", "en", "fr"], tmp_path / "out.mp4", debug=True
+    )
+
+    assert asr.chamadas == 1
+    assert saidas == {idioma: tmp_path / f"out.{idioma}.mp4" for idioma in ("es", "en", "fr")}
+    assert all(saida.exists() for saida in saidas.values())
+    assert sorted(tts.chamadas) == sorted(
+        f"[{idioma}] SEG{i}" for idioma in ("es", "en", "fr") for i in range(2)
+    )
+    relatorio = pipeline_instancia.relatorio
+    assert set(relatorio["idiomas"]) == {"es", "en", "fr"}
+    assert relatorio["paralelismo"] == {"idiomas_simultaneos": 3, "tts": "serializado"}
+    assert relatorio["idiomas"]["es"]["esticamento"]["segmentos_esticados"] == 0
+
+    # Cada idioma tem artefatos próprios, prontos para a redublagem incremental
+    traducao = tmp_path / "es" / "transcricao_traduzida.jsonl"
+    _editar_traducao(traducao, 0, "Revisado")
+    tts.chamadas.clear()
+    pipeline_instancia.redublar(
+        video_entrada, tmp_path / "out.es.mp4", traducao, artefatos=tmp_path / "es"
+    )
+    assert tts.chamadas == ["Revisado"]
+
+
+def test_multilingue_serializa_o_tts_compartilhado(tmp_path):
+    import threading
+    import time
+
+    class TTSComEstado(TTSPorTexto):
+        """Guarda estado entre chamadas, como um modelo real: não é reentrante."""
+
+        def __init__(self):
+            super().__init__()
+            self.ativas = 0
+            self.max_ativas = 0
+            self.ultimo_texto = None
+            self._trava = threading.Lock()
+
+        def sintetizar(self, texto: str, voz_id=None):
+            with self._trava:
+                self.ativas += 1
+                self.max_ativas = max(self.max_ativas, self.ativas)
+            self.ultimo_texto = texto
+            time.sleep(0.01)
+            texto_usado = self.ultimo_texto  # trocado por outra thread se concorrente
+            with self._trava:
+                self.ativas -= 1
+            return super().sintetizar(texto_usado)
+
+    tts = TTSComEstado()
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=3),
+        tts=tts,
+        ffmpeg=FFmpegMultiFaixas(),
+        translator=TradutorPrefixo(),
+        razao_maxima_esticamento=1.25,
+        nucleos=4,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+
+    pipeline_instancia.executar_multilingue(
+        video_entrada, ["es", "en", "fr"], tmp_path / "out.mkv", faixa_unica=True
+    )
+
+    assert pipeline_instancia.relatorio["paralelismo"]["idiomas_simultaneos"] == 3
+    assert tts.max_ativas == 1
+    esperadas = [f"[{idioma}] SEG{i}" for idioma in ("es", "en", "fr") for i in range(3)]
+    assert sorted(tts.chamadas) == sorted(esperadas)
+
+
+def test_multilingue_faixa_unica(tmp_path):
+    ffmpeg_simulado = FFmpegMultiFaixas()
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=1),
+        tts=TTSPorTexto(),
+        ffmpeg=ffmpeg_simulado,
+        translator=TradutorPrefixo(),
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+
+    saidas = pipeline_instancia.executar_multilingue(
+        video_entrada, ["es", "en"], tmp_path / "out.mkv", faixa_unica=True
+    )
+
+    assert set(saidas.values()) == {tmp_path / "out.mkv"}
+    assert [idioma for idioma, _ in ffmpeg_simulado.faixas] == ["es", "en"]
+    assert ffmpeg_simulado.faixas[0][1] != ffmpeg_simulado.faixas[1][1]
+    assert not (tmp_path / "out.es.mkv").exists()
+
+
+def test_multilingue_parametros_invalidos(tmp_path):
+    pipeline_instancia = Pipeline(asr=DummyASR(), tts=DummyTTS(), ffmpeg=DummyFFmpeg())
+    with pytest.raises(ValueError):
+        pipeline_instancia.executar_multilingue("in.mp4", [], tmp_path / "out.mp4")
+    with pytest.raises(ValueError):
+        pipeline_instancia.executar_multilingue("in.mp4", ["es", "es"], tmp_path / "out.mp4")
+    with pytest.raises(ValueError):
+        pipeline_instancia.executar_multilingue(
+            "in.mp4", ["es"], tmp_path / "out.mp4", faixa_unica=True
+        )
+
+
+class FFmpegPorPipe(DummyFFmpeg):
+    def __init__(self):
+        self.pcm = None
+        self.audio = None
+
+    def mux_audio(self, caminho_video, caminho_audio, caminho_video_saida):
+        self.audio = Path(caminho_audio).read_bytes()
+        super().mux_audio(caminho_video, caminho_audio, caminho_video_saida)
+
+    def mux_pcm(self, caminho_video, blocos, taxa, caminho_video_saida, idioma=None):
+        self.pcm = (np.concatenate(list(blocos)), taxa, idioma)
+        Path(caminho_video_saida).write_bytes(b"FAKE_VIDEO_WITH_AUDIO")
+
+
+def test_mux_por_pipe_entrega_a_mesma_trilha_sem_arquivo(tmp_path):
+    from autodub.utils.audio_io import wav_bytes_para_pcm16
+
+    class ASRComPausas(DummyASR):
+        def transcrever(self, caminho_audio: str):
+            return [{"texto": f"SEG{i}", "inicio": 2 * i, "fim": 2 * i + 1} for i in range(3)]
+
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    saidas = {}
+    for por_pipe in (False, True):
+        ffmpeg_simulado = FFmpegPorPipe()
+        pipeline_instancia = Pipeline(
+            asr=ASRComPausas(),
+            tts=TTSPorTexto(),
+            ffmpeg=ffmpeg_simulado,
+            razao_maxima_esticamento=1.25,
+            mux_por_pipe=por_pipe,
+        )
+        pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4", target_lang="es")
+        saidas[por_pipe] = ffmpeg_simulado
+        assert pipeline_instancia.relatorio["mux"] == ("pipe" if por_pipe else "arquivo")
+
+    trilha, taxa = wav_bytes_para_pcm16(saidas[False].audio)
+    pcm, taxa_pipe, idioma = saidas[True].pcm
+    assert saidas[True].audio is None
+    assert (taxa_pipe, idioma) == (taxa, "es")
+    assert np.array_equal(pcm, trilha)
+
+
+def test_mux_por_pipe_cai_para_arquivo_sem_wav(tmp_path, monkeypatch):
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    ffmpeg_simulado = FFmpegPorPipe()
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=1),
+        tts=DummyTTS(),
+        ffmpeg=ffmpeg_simulado,
+        razao_maxima_esticamento=1.25,
+        mux_por_pipe=True,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    assert ffmpeg_simulado.pcm is None
+    assert pipeline_instancia.relatorio["mux"] == "arquivo"
+
+
+class FFmpegComDuracao(DummyFFmpeg):
+    def __init__(self, duracao):
+        self.duracao = duracao
+        self.extracoes = 0
+        self.restantes_no_mux = None
+
+    def duration(self, caminho):
+        return self.duracao
+
+    def extract_audio(self, caminho_video, caminho_audio_saida):
+        self.extracoes += 1
+        super().extract_audio(caminho_video, caminho_audio_saida)
+
+    def mux_audio(self, caminho_video, caminho_audio, caminho_video_saida):
+        self.restantes_no_mux = sorted(p.name for p in Path(caminho_audio).parent.iterdir())
+        super().mux_audio(caminho_video, caminho_audio, caminho_video_saida)
+
+
+def test_diretorio_trabalho_descarte_e_pico_no_relatorio(tmp_path):
+    ffmpeg_simulado = FFmpegComDuracao(duracao=3.0)
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(num_segmentos=3),
+        tts=TTSPorTexto(),
+        ffmpeg=ffmpeg_simulado,
+        razao_maxima_esticamento=1.25,
+        diretorio_trabalho=tmp_path / "trabalho",
+        orcamento_disco=10_000_000,
+    )
+    video_entrada = tmp_path / "input.mp4"
+    video_entrada.write_bytes(b"DUMMY_VIDEO")
+    pipeline_instancia.executar(video_entrada, tmp_path / "out.mp4")
+
+    disco = pipeline_instancia.relatorio["disco"]
+    assert Path(disco["diretorio"]).parent == tmp_path / "trabalho"
+    assert disco["estimativa_bytes"] == 3 * 3 * 32000
+    # Pico: a trilha de 2.5 s (falas já apagadas), maior que as 3 falas de 0.5 s
+    assert disco["pico_bytes"] == 44 + 2 * 40000
+    # Falas e áudio extraído já foram apagados quando o mux começa
+    assert ffmpeg_simulado.restantes_no_mux == ["combined_audio.wav"]
+    assert not Path(disco["diretorio"]).exists()
+
+
+def test_orcamento_disco_falha_antes_da_extracao(tmp_path):
+    ffmpeg_simulado = FFmpegComDuracao(duracao=3600.0)
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(),
+        tts=DummyTTS(),
+        ffmpeg=ffmpeg_simulado,
+        diretorio_trabalho=tmp_path,
+        orcamento_disco=50_000_000,
+    )
+    with pytest.raises(RuntimeError, match="orçamento"):
+        pipeline_instancia.executar(tmp_path / "input.mp4", tmp_path / "out.mp4")
+
+    assert ffmpeg_simulado.extracoes == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_intermediarios_em_flac_e_redublagem(tmp_path):
+    import json
+
+    from autodub.utils.audio_storage import ler_pcm16
+
+    (tmp_path / "wav").mkdir()
+    (tmp_path / "flac").mkdir()
+    pipeline_wav, _, video_entrada = _executar_para_redublar(
+        tmp_path / "wav", razao_maxima_esticamento=1.25
+    )
+    pipeline_flac, tts, _ = _executar_para_redublar(
+        tmp_path / "flac", razao_maxima_esticamento=1.25, formato_intermediario="flac"
+    )
+
+    trilha_wav, _ = ler_pcm16(tmp_path / "wav" / "trilha_dublada.wav")
+    trilha_flac, _ = ler_pcm16(tmp_path / "flac" / "trilha_dublada.flac")
+    assert np.array_equal(trilha_wav, trilha_flac)
+    manifesto = json.loads((tmp_path / "flac" / "manifesto_sintese.json").read_text("utf-8"))
+    assert manifesto["formato"] == "flac"
+    assert manifesto["segmentos"][0]["arquivo"] == "segmentos/segment_00000.flac"
+    assert (tmp_path / "flac" / "audio_extraido.flac").exists()
+
+    # A trilha FLAC não é remendada no lugar: é remontada a partir das falas FLAC
+    traducao = tmp_path / "flac" / "transcricao_traduzida.jsonl"
+    _editar_traducao(traducao, 1, "Texto revisado")
+    tts.chamadas.clear()
+    pipeline_flac.redublar(video_entrada, tmp_path / "flac" / "out2.mp4", traducao)
+
+    assert tts.chamadas == ["Texto revisado"]
+    assert pipeline_flac.relatorio["redublagem"]["trilha"] == "remontada"
+    assert (tmp_path / "flac" / "segmentos" / "segment_00001.flac").exists()
+
+
+def test_formato_intermediario_invalido():
+    with pytest.raises(ValueError):
+        Pipeline(
+            asr=DummyASR(), tts=DummyTTS(), ffmpeg=DummyFFmpeg(), formato_intermediario="mp3"
+        )
+
+
+class FFmpegComSonda(FFmpegComDuracao):
+    def __init__(self, sonda):
+        super().__init__(duracao=sonda["duracao"])
+        self.sonda = sonda
+
+    def probe(self, caminho):
+        return self.sonda
+
+
+class ASRQueLeAudio(DummyASR):
+    def transcrever(self, caminho_audio: str):
+        self.conteudo = Path(caminho_audio).read_bytes()
+        return super().transcrever(caminho_audio)
+
+
+def test_preflight_vincula_wav_compativel_sem_ffmpeg(tmp_path):
+    ffmpeg_simulado = FFmpegComSonda(
+        {
+            "formato": "wav",
+            "duracao": 1.0,
+            "fluxos": [{"tipo": "audio", "codec": "pcm_s16le", "taxa": 16000, "canais": 1}],
+        }
+    )
+    asr = ASRQueLeAudio()
+    pipeline_instancia = Pipeline(asr=asr, tts=TTSPorTexto(), ffmpeg=ffmpeg_simulado)
+    entrada = tmp_path / "entrada.wav"
+    entrada.write_bytes(b"WAV_COMPATIVEL")
+    pipeline_instancia.executar(entrada, tmp_path / "out.mp4")
+
+    plano = pipeline_instancia.relatorio["preflight"]
+    assert plano["extracao"] == "direta"
+    assert plano["extracao_realizada"] == "vinculo"
+    assert ffmpeg_simulado.extracoes == 0
+    assert asr.conteudo == b"WAV_COMPATIVEL"
+    # Descartar o áudio "extraído" apaga só o vínculo, nunca a entrada
+    assert entrada.read_bytes() == b"WAV_COMPATIVEL"
+
+
+def test_preflight_rejeita_entrada_sem_audio_antes_de_extrair(tmp_path):
+    ffmpeg_simulado = FFmpegComSonda(
+        {"formato": "mov,mp4", "duracao": 5.0, "fluxos": [{"tipo": "video", "codec": "h264"}]}
+    )
+    pipeline_instancia = Pipeline(
+        asr=DummyASR(), tts=DummyTTS(), ffmpeg=ffmpeg_simulado, diretorio_trabalho=tmp_path
+    )
+    with pytest.raises(ValueError, match="áudio"):
+        pipeline_instancia.executar(tmp_path / "mudo.mp4", tmp_path / "out.mp4")
+
+    assert ffmpeg_simulado.extracoes == 0
+    assert list(tmp_path.iterdir()) == []
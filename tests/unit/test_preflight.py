@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from autodub.utils.preflight import (
+    planejar,
+    sugerir_paralelismo,
+    threads_para_duracao,
+    vincular_ou_copiar,
+)
+
+
+def _sonda(formato="wav", duracao=90.0, fluxos=None):
+    return {
+        "formato": formato,
+        "duracao": duracao,
+        "fluxos": fluxos
+        if fluxos is not None
+        else [{"tipo": "audio", "codec": "pcm_s16le", "taxa": 16000, "canais": 1}],
+    }
+
+
+def test_planejar_wav_compativel_dispensa_extracao():
+    plano = planejar(_sonda())
+
+    assert plano["extracao"] == "direta"
+    assert plano["fluxos"] == {"audio": 1}
+    assert plano["audio"] == {"codec": "pcm_s16le", "taxa": 16000, "canais": 1}
+    assert plano["estimativa_disco_bytes"] == 3 * 90 * 32000
+    # WAV compatível não serve quando os intermediários são FLAC
+    assert planejar(_sonda(), formato_intermediario="flac")["extracao"] == "ffmpeg"
+
+
+@pytest.mark.parametrize(
+    "sonda",
+    [
+        _sonda(
+            formato="mov,mp4,m4a,3gp,3g2,mj2",
+            fluxos=[
+                {"tipo": "video", "codec": "h264", "taxa": None, "canais": None},
+                {"tipo": "audio", "codec": "aac", "taxa": 48000, "canais": 2},
+            ],
+        ),
+        _sonda(fluxos=[{"tipo": "audio", "codec": "pcm_s16le", "taxa": 44100, "canais": 1}]),
+        _sonda(fluxos=[{"tipo": "audio", "codec": "pcm_s16le", "taxa": 16000, "canais": 2}]),
+    ],
+)
+def test_planejar_entradas_que_precisam_de_ffmpeg(sonda):
+    assert planejar(sonda)["extracao"] == "ffmpeg"
+
+
+def test_planejar_rejeita_entrada_sem_audio():
+    with pytest.raises(ValueError, match="áudio"):
+        planejar(_sonda(fluxos=[{"tipo": "video", "codec": "h264"}]))
+
+
+def test_sugerir_paralelismo_pela_duracao():
+    assert threads_para_duracao(60) == 1
+    assert threads_para_duracao(1800) == 2
+    assert threads_para_duracao(None) == 4
+
+    curtos = sugerir_paralelismo([60.0] * 10, nucleos=8)
+    assert (curtos["trabalhadores"], curtos["threads_por_trabalhador"]) == (8, 1)
+    longos = sugerir_paralelismo([7200.0, 60.0], nucleos=8)
+    assert (longos["trabalhadores"], longos["threads_por_trabalhador"]) == (2, 4)
+    assert sugerir_paralelismo([7200.0], nucleos=2)["trabalhadores"] == 1
+
+
+def test_vincular_ou_copiar(tmp_path, monkeypatch):
+    origem = tmp_path / "a.wav"
+    origem.write_bytes(b"RIFF")
+
+    assert vincular_ou_copiar(origem, tmp_path / "b.wav") == "vinculo"
+    assert os.path.samefile(origem, tmp_path / "b.wav")
+
+    def sem_links(*args):
+        raise OSError("outro disco")
+
+    monkeypatch.setattr(os, "link", sem_links)
+    assert vincular_ou_copiar(origem, tmp_path / "b.wav") == "copia"
+    assert (tmp_path / "b.wav").read_bytes() == b"RIFF"
@@ -0,0 +1,38 @@
+import logging
+
+from autodub.utils.progress import RelatorProgresso
+
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_resumos_respeitam_intervalo(caplog):
+    relogio = RelogioFalso()
+    logger = logging.getLogger("teste.progresso")
+    progresso = RelatorProgresso(
+        logger, "Sintetizando", total=1000, intervalo_segundos=5.0, relogio=relogio
+    )
+
+    with caplog.at_level(logging.INFO, logger="teste.progresso"):
+        for _ in range(999):
+            relogio.agora += 0.01
+            progresso.avancar()
+        progresso.concluir()
+
+    # ~10 s de trabalho com intervalo de 5 s: 1 resumo intermediário + o final
+    assert progresso.resumos_emitidos == 2
+    assert len(caplog.records) == 2
+    assert caplog.records[-1].getMessage().startswith("Sintetizando: 999/1000 segmentos")
+
+
+def test_resumo_sem_total():
+    relogio = RelogioFalso()
+    progresso = RelatorProgresso(logging.getLogger("teste.progresso"), "Etapa", relogio=relogio)
+    progresso.avancar(3)
+    relogio.agora = 2.0
+    assert progresso._resumo(relogio()) == "Etapa: 3 segmentos (1.5/s)"
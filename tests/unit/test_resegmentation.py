@@ -0,0 +1,94 @@
+import pytest
+
+from autodub.utils.resegmentation import Ressegmentador
+from autodub.utils.segment_table import TabelaSegmentos
+
+
+def _tabela(*segmentos):
+    return TabelaSegmentos.de_dicts(
+        {"texto": texto, "inicio": inicio, "fim": fim} for texto, inicio, fim in segmentos
+    )
+
+
+def test_une_fragmentos_proximos_mantendo_limites():
+    tabela = _tabela(("Olá", 0.0, 0.4), ("tudo bem", 0.5, 1.0), ("com você?", 1.1, 1.8))
+    ressegmentador = Ressegmentador(max_lacuna=0.3, min_palavras=4)
+    resultado = ressegmentador.ressegmentar(tabela)
+
+    assert resultado.textos("texto") == ["Olá tudo bem com você?"]
+    assert resultado.inicio.tolist() == [0.0]
+    assert resultado.fim.tolist() == [1.8]
+    assert ressegmentador.ultimo_resumo["fusoes"] == 2
+
+
+def test_nao_une_com_pausa_longa_nem_segmentos_completos():
+    tabela = _tabela(
+        ("Uma frase completa aqui.", 0.0, 2.0),
+        ("Outra frase completa aqui.", 2.1, 4.0),
+        ("Oi", 9.0, 9.5),
+    )
+    resultado = Ressegmentador(max_lacuna=0.5, min_palavras=3).ressegmentar(tabela)
+    assert len(resultado) == 3
+    assert resultado.textos("texto")[2] == "Oi."
+
+
+def test_divide_segmento_longo_na_pontuacao():
+    texto = "primeira parte aqui, segunda parte aqui. terceira parte aqui"
+    ressegmentador = Ressegmentador(min_palavras=1, max_palavras=4, pontuar=False)
+    resultado = ressegmentador.ressegmentar(_tabela((texto, 10.0, 16.0)))
+
+    assert resultado.textos("texto") == [
+        "primeira parte aqui,",
+        "segunda parte aqui.",
+        "terceira parte aqui",
+    ]
+    assert resultado.inicio[0] == 10.0
+    assert resultado.fim[-1] == 16.0
+    assert (resultado.inicio[1:] == resultado.fim[:-1]).all()
+    assert ressegmentador.ultimo_resumo["divisoes"] == 2
+
+
+def test_nao_une_locutores_diferentes():
+    tabela = TabelaSegmentos.de_dicts(
+        [
+            {"texto": "Oi", "inicio": 0.0, "fim": 0.5, "locutor": 0},
+            {"texto": "Olá", "inicio": 0.6, "fim": 1.0, "locutor": 1},
+        ]
+    )
+    resultado = Ressegmentador().ressegmentar(tabela)
+    assert resultado.locutor.tolist() == [0, 1]
+    assert resultado[1]["locutor"] == 1
+
+
+def test_fragmento_sem_locutor_nao_une_locutores_diferentes():
+    tabela = TabelaSegmentos.de_dicts(
+        [
+            {"texto": "Oi", "inicio": 0.0, "fim": 0.4, "locutor": 0},
+            {"texto": "hm", "inicio": 0.5, "fim": 0.7, "locutor": -1},
+            {"texto": "Olá", "inicio": 0.8, "fim": 1.2, "locutor": 1},
+        ]
+    )
+    resultado = Ressegmentador(pontuar=False).ressegmentar(tabela)
+
+    assert resultado.textos("texto") == ["Oi hm", "Olá"]
+    assert resultado.locutor.tolist() == [0, 1]
+
+
+def test_grupo_iniciado_sem_locutor_herda_o_conhecido():
+    tabela = TabelaSegmentos.de_dicts(
+        [
+            {"texto": "hm", "inicio": 0.0, "fim": 0.2, "locutor": -1},
+            {"texto": "Oi", "inicio": 0.3, "fim": 0.6, "locutor": 1},
+            {"texto": "tchau", "inicio": 0.7, "fim": 1.0, "locutor": 0},
+        ]
+    )
+    resultado = Ressegmentador(pontuar=False).ressegmentar(tabela)
+
+    assert resultado.textos("texto") == ["hm Oi", "tchau"]
+    assert resultado.locutor.tolist() == [1, 0]
+
+
+def test_tabela_vazia_e_parametros_invalidos():
+    assert len(Ressegmentador().ressegmentar([])) == 0
+    with pytest.raises(ValueError):
+        Ressegmentador(min_palavras=5, max_palavras=2)
@@ -0,0 +1,82 @@
+import math
+
+from autodub.utils.segment_filter import FiltroSegmentos, colapsar_repeticoes
+from autodub.utils.segment_table import TabelaSegmentos
+
+
+def _segmento(texto, inicio, nsp=math.nan, logprob=math.nan, compressao=math.nan):
+    return {
+        "texto": texto,
+        "inicio": inicio,
+        "fim": inicio + 1.0,
+        "no_speech_prob": nsp,
+        "avg_logprob": logprob,
+        "compression_ratio": compressao,
+    }
+
+
+def test_colapsar_repeticoes():
+    assert colapsar_repeticoes("Thank you. Thank you. thank you.") == "Thank you."
+    assert colapsar_repeticoes("Oi. Tudo bem? Oi.") == "Oi. Tudo bem? Oi."
+
+
+def test_filtro_descarta_sem_fala_e_colapsa_repeticoes():
+    tabela = TabelaSegmentos.de_dicts(
+        [
+            _segmento("Olá a todos.", 0.0, nsp=0.1, logprob=-0.3, compressao=1.2),
+            _segmento("♪", 1.0, nsp=0.9, logprob=-1.8, compressao=0.8),
+            _segmento("Obrigado. Obrigado. Obrigado.", 2.0, compressao=3.0),
+            _segmento("la la la la la la", 3.0, compressao=4.0),
+            _segmento("Obrigado.", 3.2),
+            _segmento("  ", 5.0),
+            _segmento("Até logo.", 6.0),
+        ]
+    )
+    filtro = FiltroSegmentos()
+    resultado = filtro.filtrar(tabela)
+
+    assert resultado.textos("texto") == ["Olá a todos.", "Obrigado.", "Até logo."]
+    # A repetição seguinte foi absorvida pelo segmento anterior
+    assert resultado.fim.tolist() == [1.0, 4.2, 7.0]
+    motivos = {item["indice"]: item["motivo"] for item in filtro.ultimos_ignorados}
+    assert motivos == {
+        1: "sem_fala",
+        2: "repeticao_interna",
+        3: "alucinacao",
+        4: "repeticao",
+        5: "vazio",
+    }
+    # A tabela original não é alterada
+    assert tabela[2]["texto"] == "Obrigado. Obrigado. Obrigado."
+
+
+def test_filtro_mantem_falas_iguais_distantes_ou_de_outro_locutor():
+    segmentos = [
+        {"texto": "Não.", "inicio": 0.0, "fim": 0.5, "locutor": 0},
+        {"texto": "não", "inicio": 0.7, "fim": 1.0, "locutor": 1},
+        {"texto": "Não.", "inicio": 30.0, "fim": 30.5, "locutor": 1},
+        # Cópia distante, mas com sinal de alucinação: descartada sem esticar
+        _segmento("Não.", 60.0, nsp=0.7),
+    ]
+    filtro = FiltroSegmentos()
+    resultado = filtro.filtrar(segmentos)
+
+    assert resultado.inicio.tolist() == [0.0, 0.7, 30.0]
+    assert resultado.fim.tolist() == [0.5, 1.0, 30.5]
+    assert resultado.locutor.tolist() == [0, 1, 1]
+    assert [item["motivo"] for item in filtro.ultimos_ignorados] == ["repeticao"]
+
+
+def test_filtro_sem_metricas_mantem_tudo():
+    segmentos = [
+        {"texto": "a", "inicio": 0.0, "fim": 1.0},
+        {"texto": "b", "inicio": 1, "fim": 2},
+    ]
+    filtro = FiltroSegmentos()
+    assert len(filtro.filtrar(segmentos)) == 2
+    assert filtro.ultimos_ignorados == []
+
+
+def test_filtro_pode_descartar_tudo():
+    resultado = FiltroSegmentos().filtrar([_segmento("", 0.0)])
+    assert len(resultado) == 0
@@ -0,0 +1,178 @@
+import json
+
+import numpy as np
+import pytest
+
+from autodub.utils.segment_table import TabelaSegmentos
+
+SEGMENTOS = [
+    {"texto": "Olá", "inicio": 0.0, "fim": 1.5},
+    {"texto": "mundo", "inicio": 1.2, "fim": 2.0, "locutor": 1},
+    {"texto": "Olá", "inicio": 3.0, "fim": 4.0, "no_speech_prob": 0.2},
+]
+
+
+def test_de_dicts_e_para_dicts_preservam_formato():
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    assert len(tabela) == 3
+    assert tabela.para_dicts() == SEGMENTOS
+    assert list(tabela[0]) == ["texto", "inicio", "fim"]
+
+
+def test_textos_repetidos_sao_internados():
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    assert tabela.textos("texto") == ["Olá", "mundo", "Olá"]
+    assert len(tabela._vocabulario) == 2
+
+
+def test_linha_se_comporta_como_dict():
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    linha = tabela[1]
+    assert linha["texto"] == "mundo"
+    assert linha.get("texto_traduzido") is None
+    assert linha["locutor"] == 1
+    assert tabela[0].get("locutor") is None
+
+    linha["texto_traduzido"] = "world"
+    assert tabela.textos("texto_traduzido") == [None, "world", None]
+    assert dict(tabela[1])["texto_traduzido"] == "world"
+
+    with pytest.raises(KeyError):
+        tabela[0]["texto_traduzido"]
+    # Valores sem coluna própria vão para uma coluna de objetos
+    marcador = object()
+    linha["objeto"] = marcador
+    assert tabela[1]["objeto"] is marcador
+    assert "objeto" not in tabela[0]
+
+
+def test_consultas_de_tempo_vetorizadas():
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    assert np.allclose(tabela.duracao, [1.5, 0.8, 1.0])
+    assert np.allclose(tabela.lacunas(), [-0.3, 1.0])
+    assert tabela.sobreposicoes().tolist() == [0]
+    assert tabela.sobrepoe_intervalo(1.8, 3.5).tolist() == [False, True, True]
+
+
+def test_selecionar_com_mascara_e_copia_independente():
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    filtrada = tabela.selecionar(tabela.duracao >= 1.0)
+    assert filtrada.textos("texto") == ["Olá", "Olá"]
+
+    copia = tabela.copia()
+    copia[0]["texto"] = "Oi"
+    assert tabela[0]["texto"] == "Olá"
+
+
+def test_serializacao_jsonl_e_npz(tmp_path):
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    tabela.definir_coluna_texto("texto_traduzido", ["a", None, "c"])
+
+    tabela.salvar_jsonl(tmp_path / "segmentos.jsonl")
+    linhas = (tmp_path / "segmentos.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(linhas[1]) == {**SEGMENTOS[1]}
+    assert TabelaSegmentos.carregar_jsonl(tmp_path / "segmentos.jsonl").para_dicts() == (
+        tabela.para_dicts()
+    )
+
+    tabela.salvar_npz(tmp_path / "segmentos.npz")
+    carregada = TabelaSegmentos.carregar_npz(tmp_path / "segmentos.npz")
+    assert carregada.para_dicts() == tabela.para_dicts()
+
+
+def test_de_dicts_guarda_listas_em_coluna_de_objetos(tmp_path):
+    palavras = [{"word": " Olá", "start": 0.0, "end": 0.4, "probability": 0.9}]
+    segmentos = [
+        {"texto": "Olá", "inicio": 0.0, "fim": 0.4, "words": palavras},
+        {"texto": "mundo", "inicio": 0.5, "fim": 1.0},
+    ]
+    tabela = TabelaSegmentos.de_dicts(segmentos)
+
+    assert tabela.objetos("words") == [palavras, None]
+    assert tabela.para_dicts() == segmentos
+    assert tabela.selecionar([0])[0]["words"] == palavras
+
+    tabela.salvar_npz(tmp_path / "segmentos.npz")
+    assert TabelaSegmentos.carregar_npz(tmp_path / "segmentos.npz").para_dicts() == segmentos
+
+
+def test_locutores_em_texto_usam_tabela_de_rotulos(tmp_path):
+    segmentos = [
+        {"texto": "a", "inicio": 0.0, "fim": 1.0, "locutor": "SPEAKER_01"},
+        {"texto": "b", "inicio": 1.0, "fim": 2.0},
+        {"texto": "c", "inicio": 2.0, "fim": 3.0, "locutor": "SPEAKER_00"},
+        {"texto": "d", "inicio": 3.0, "fim": 4.0, "locutor": "SPEAKER_01"},
+    ]
+    tabela = TabelaSegmentos.de_dicts(segmentos)
+
+    assert tabela.locutor.tolist() == [0, -1, 1, 0]
+    assert tabela.rotulos_locutor == ["SPEAKER_01", "SPEAKER_00"]
+    assert tabela.para_dicts() == segmentos
+    tabela[1]["locutor"] = "SPEAKER_02"
+    assert tabela[1]["locutor"] == "SPEAKER_02" and tabela.locutor[1] == 2
+
+    tabela.salvar_npz(tmp_path / "segmentos.npz")
+    carregada = TabelaSegmentos.carregar_npz(tmp_path / "segmentos.npz")
+    assert carregada.para_dicts() == tabela.para_dicts()
+
+    # Índices inteiros já gravados continuam valendo ao surgir um rótulo em texto
+    numerica = TabelaSegmentos.de_dicts(SEGMENTOS)
+    numerica[0]["locutor"] = "narrador"
+    assert [linha.get("locutor") for linha in numerica] == ["narrador", 1, None]
+
+
+def test_colunas_mistas_preservam_os_tipos_originais():
+    segmentos = [
+        {"texto": "a", "inicio": 0.0, "fim": 1.0, "id": 7},
+        {"texto": "b", "inicio": 1.0, "fim": 2.0, "id": "7b"},
+    ]
+    tabela = TabelaSegmentos.de_dicts(segmentos)
+
+    assert tabela.objetos("id") == [7, "7b"]
+    assert tabela.para_dicts() == segmentos
+    assert tabela.textos("texto") == ["a", "b"]
+
+    # Um texto numa coluna numérica converte a coluna, sem perder os números
+    tabela = TabelaSegmentos.de_dicts(SEGMENTOS)
+    tabela[0]["no_speech_prob"] = "alto"
+    assert [linha.get("no_speech_prob") for linha in tabela] == ["alto", None, 0.2]
+
+
+def test_inteiros_e_booleanos_voltam_com_o_tipo_original(tmp_path):
+    segmentos = [
+        {"inicio": 0.0, "fim": 1.0, "id": 3, "ok": True, "nota": 2},
+        {"inicio": 1.0, "fim": 2.0, "id": 4, "ok": False, "nota": 0.5},
+    ]
+
+    def tipos(dicts):
+        return [{chave: type(valor) for chave, valor in d.items()} for d in dicts]
+
+    tabela = TabelaSegmentos.de_dicts(segmentos)
+    tabela.salvar_jsonl(tmp_path / "segmentos.jsonl")
+    tabela.salvar_npz(tmp_path / "segmentos.npz")
+    for dicts in (
+        tabela.para_dicts(),
+        tabela.selecionar([0, 1]).para_dicts(),
+        TabelaSegmentos.carregar_jsonl(tmp_path / "segmentos.jsonl").para_dicts(),
+        TabelaSegmentos.carregar_npz(tmp_path / "segmentos.npz").para_dicts(),
+    ):
+        assert dicts == segmentos
+        # Coluna que mistura int e float é lida como float
+        assert (
+            tipos(dicts)
+            == [{"inicio": float, "fim": float, "id": int, "ok": bool, "nota": float}] * 2
+        )
+
+    # Um valor de outro tipo faz a coluna voltar a ser lida como float
+    tabela[1]["id"] = 4.5
+    assert [linha["id"] for linha in tabela] == [3.0, 4.5]
+    assert type(tabela[0]["id"]) is float
+    tabela[0]["novo"] = True
+    assert tabela[0]["novo"] is True
+
+
+def test_tabela_vazia():
+    tabela = TabelaSegmentos.de_dicts([])
+    assert len(tabela) == 0
+    assert tabela.para_dicts() == []
+    assert tabela.lacunas().size == 0
@@ -0,0 +1,85 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from autodub.adapters.mocks.mock_vocoder import MockVocoderStreaming
+from autodub.utils.streaming_vocoder import VocoderEmBlocos
+
+
+def _mel(quadros, semente=0):
+    return np.random.default_rng(semente).normal(size=(quadros, 80)).astype(np.float32)
+
+
+@pytest.mark.parametrize("quadros", [1, 10, 64, 65, 200, 1000])
+def test_fluxo_equivale_ao_mel_inteiro(quadros):
+    vocoder = MockVocoderStreaming()
+    mel = _mel(quadros)
+    em_blocos = VocoderEmBlocos(vocoder, quadros_por_bloco=64, sobreposicao=8)
+
+    trechos = list(em_blocos.fluxo(mel))
+
+    assert np.allclose(np.concatenate(trechos), vocoder.sintetizar_bloco(mel), atol=1e-6)
+    assert em_blocos.pico_amostras <= 64 * vocoder.amostras_por_quadro
+
+
+def test_crossfade_suaviza_bordas():
+    class VocoderComDeriva(MockVocoderStreaming):
+        def sintetizar_bloco(self, mel):
+            return np.full(len(mel) * self.amostras_por_quadro, float(len(mel)), np.float32)
+
+    trechos = list(VocoderEmBlocos(VocoderComDeriva(), 10, 4).fluxo(_mel(18)))
+    audio = np.concatenate(trechos)
+    # Blocos de 10, 10 e 6 quadros: o salto 10 → 6 vira uma rampa de 640 amostras
+    assert len(audio) == 18 * 160
+    assert audio[0] == 10.0 and audio[-1] == 6.0
+    assert np.max(np.abs(np.diff(audio))) < 0.01
+
+
+def test_latencia_e_memoria_limitada():
+    tempos = iter([0.0, 0.25, 0.5, 0.75, 1.0] + [2.0] * 100)
+    vocoder = MockVocoderStreaming()
+    em_blocos = VocoderEmBlocos(vocoder, 32, 4, relogio=lambda: next(tempos))
+
+    total = sum(len(t) for t in em_blocos.fluxo(_mel(500)))
+
+    assert total == 500 * vocoder.amostras_por_quadro
+    assert em_blocos.latencia_primeiro_audio == 0.25
+    assert em_blocos.blocos == 18
+    assert em_blocos.pico_amostras == 32 * vocoder.amostras_por_quadro
+
+
+def test_estatisticas_por_chamada_nao_se_misturam():
+    em_blocos = VocoderEmBlocos(MockVocoderStreaming(), 16, 2)
+    curta, longa = {}, {}
+    fluxo_curto = em_blocos.fluxo(_mel(10), curta)
+    fluxo_longo = em_blocos.fluxo(_mel(100), longa)
+
+    # Intercaladas, como duas falas sintetizadas em threads diferentes
+    next(fluxo_longo)
+    list(fluxo_curto)
+    list(fluxo_longo)
+
+    assert curta["blocos"] == 1 and curta["pico_amostras"] == 10 * 160
+    assert longa["blocos"] == 7 and longa["pico_amostras"] == 16 * 160
+    assert em_blocos.blocos == 1  # a última chamada iniciada foi a curta
+
+
+def test_sintetizar_from_mel_gera_wav():
+    em_blocos = VocoderEmBlocos(MockVocoderStreaming(), 16, 2)
+    with wave.open(io.BytesIO(em_blocos.sintetizar_from_mel(_mel(40)))) as wf:
+        assert wf.getnframes() == 40 * 160
+    assert list(em_blocos.fluxo(np.zeros((0, 80)))) == []
+
+
+def test_parametros_e_saida_invalidos():
+    with pytest.raises(ValueError):
+        VocoderEmBlocos(MockVocoderStreaming(), 8, 8)
+
+    class VocoderQuebrado(MockVocoderStreaming):
+        def sintetizar_bloco(self, mel):
+            return np.zeros(3, dtype=np.float32)
+
+    with pytest.raises(ValueError):
+        list(VocoderEmBlocos(VocoderQuebrado(), 8, 2).fluxo(_mel(20)))
@@ -0,0 +1,69 @@
+import io
+import math
+import struct
+import wave
+
+import numpy as np
+
+from autodub.adapters.mocks.mock_tts import MockTTS
+from autodub.utils.synthetic_audio import (
+    frequencia_do_texto,
+    gerar_ruido,
+    gerar_tom,
+    tom_wav_bytes,
+)
+
+
+def _sintetizar_com_laco(texto, duration_seconds=0.5, sample_rate=16000):
+    """Implementação original do MockTTS (amostra a amostra), usada como referência."""
+    import hashlib
+
+    dur = max(0.1, duration_seconds + (len(texto) % 5) * 0.1)
+    nframes = int(dur * sample_rate)
+    tone = (int(hashlib.sha1(texto.encode()).hexdigest(), 16) % 200) + 200
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        for i in range(nframes):
+            sample = int(32767 * 0.1 * math.sin(2 * math.pi * tone * i / sample_rate))
+            wf.writeframesraw(struct.pack("<h", sample))
+    return buffer.getvalue()
+
+
+def test_mock_tts_vetorizado_identico_ao_laco_original():
+    for texto in ["Olá mundo", "", "Determinístico", "segmento 42"]:
+        assert MockTTS().sintetizar(texto) == _sintetizar_com_laco(texto)
+
+
+def test_frequencia_do_texto_deterministica_e_na_faixa():
+    assert frequencia_do_texto("abc") == frequencia_do_texto("abc")
+    assert 200 <= frequencia_do_texto("abc") < 400
+    assert 220 <= frequencia_do_texto("abc", base=220) < 420
+
+
+def test_gerar_tom_formato_e_amplitude():
+    tom = gerar_tom(440, 1600, 16000, amplitude=0.5)
+    assert tom.dtype == np.int16
+    assert tom.shape == (1600,)
+    assert tom[0] == 0
+    assert np.abs(tom).max() <= 16384
+
+
+def test_gerar_ruido_deterministico_por_semente():
+    assert np.array_equal(gerar_ruido(100, semente=1), gerar_ruido(100, semente=1))
+    assert not np.array_equal(gerar_ruido(100, semente=1), gerar_ruido(100, semente=2))
+    assert np.abs(gerar_ruido(1000, amplitude=0.1)).max() <= 3277
+
+
+def test_tom_wav_bytes_usa_cache():
+    tom_wav_bytes.cache_clear()
+    primeiro = tom_wav_bytes(300, 800)
+    segundo = tom_wav_bytes(300, 800)
+    assert primeiro is segundo
+    assert tom_wav_bytes.cache_info().hits == 1
+
+    with wave.open(io.BytesIO(primeiro)) as wf:
+        assert wf.getnframes() == 800
+        assert wf.getframerate() == 16000
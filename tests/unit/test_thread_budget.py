@@ -0,0 +1,72 @@
+import os
+import sys
+import types
+
+import pytest
+
+from autodub.utils import thread_budget
+from autodub.utils.thread_budget import (
+    VARIAVEIS_THREADS,
+    aplicar_threads,
+    calcular_alocacao,
+    inicializar_trabalhador,
+)
+
+
+@pytest.fixture
+def ambiente_limpo(monkeypatch):
+    """Isola variáveis de ambiente e módulos opcionais alterados pelos testes."""
+    for variavel in VARIAVEIS_THREADS:
+        monkeypatch.delenv(variavel, raising=False)
+    monkeypatch.delitem(sys.modules, "torch", raising=False)
+    monkeypatch.setitem(sys.modules, "threadpoolctl", None)
+    return monkeypatch
+
+
+def test_calcular_alocacao_divide_nucleos():
+    assert calcular_alocacao(8, 3) == {
+        "nucleos_totais": 8,
+        "trabalhadores": 3,
+        "threads_por_trabalhador": 2,
+    }
+
+
+def test_calcular_alocacao_limita_trabalhadores_aos_nucleos():
+    alocacao = calcular_alocacao(2, 5)
+    assert alocacao["trabalhadores"] == 2
+    assert alocacao["threads_por_trabalhador"] == 1
+
+
+def test_calcular_alocacao_usa_cpu_count(monkeypatch):
+    monkeypatch.setattr(thread_budget.os, "cpu_count", lambda: None)
+    assert calcular_alocacao()["nucleos_totais"] == 1
+
+
+def test_calcular_alocacao_valores_invalidos():
+    with pytest.raises(ValueError):
+        calcular_alocacao(0)
+    with pytest.raises(ValueError):
+        calcular_alocacao(4, 0)
+
+
+def test_aplicar_threads_define_variaveis(ambiente_limpo):
+    aplicado = aplicar_threads(3)
+    assert all(os.environ[variavel] == "3" for variavel in VARIAVEIS_THREADS)
+    assert aplicado == {"threads": 3, "variaveis_ambiente": list(VARIAVEIS_THREADS)}
+
+
+def test_aplicar_threads_limita_torch_e_threadpoolctl(ambiente_limpo):
+    chamadas = {}
+    torch_falso = types.SimpleNamespace(set_num_threads=lambda n: chamadas.update(torch=n))
+    threadpoolctl_falso = types.SimpleNamespace(
+        threadpool_limits=lambda limits: chamadas.update(blas=limits)
+    )
+    ambiente_limpo.setitem(sys.modules, "torch", torch_falso)
+    ambiente_limpo.setitem(sys.modules, "threadpoolctl", threadpoolctl_falso)
+
+    inicializar_trabalhador(2)
+    aplicado = aplicar_threads(2)
+
+    assert chamadas == {"torch": 2, "blas": 2}
+    assert aplicado["torch"] == 2
+    assert aplicado["threadpoolctl"] == 2
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from autodub.utils.time_stretch import ajustar_ao_trecho, esticar_tempo
+
+TAXA = 16000
+
+
+def _senoide(frequencia=440.0, segundos=2.0):
+    t = np.arange(int(TAXA * segundos)) / TAXA
+    return (0.5 * np.sin(2 * np.pi * frequencia * t)).astype(np.float32)
+
+
+def _frequencia_dominante(audio):
+    espectro = np.abs(np.fft.rfft(audio))
+    return np.fft.rfftfreq(len(audio), 1 / TAXA)[np.argmax(espectro)]
+
+
+@pytest.mark.parametrize("fator", [0.7, 0.85, 1.2])
+def test_esticar_tempo_muda_duracao_e_preserva_altura(fator):
+    audio = _senoide()
+    resultado = esticar_tempo(audio, fator)
+
+    assert resultado.dtype == np.float32
+    assert len(resultado) == round(len(audio) * fator)
+    assert abs(_frequencia_dominante(resultado) - 440.0) < 2.0
+    # Sem cliques: a amplitude continua a da senoide original
+    assert np.abs(resultado[1000:-1000]).max() <= 0.55
+
+
+def test_esticar_tempo_audio_curto_e_fator_invalido():
+    assert len(esticar_tempo(np.ones(100), 0.5)) == 50
+    assert len(esticar_tempo(np.ones(100), 1.0)) == 100
+    with pytest.raises(ValueError):
+        esticar_tempo(np.ones(100), 0)
+
+
+def test_ajustar_ao_trecho_respeita_razao_maxima():
+    audio = _senoide(segundos=1.0)
+    assert len(ajustar_ao_trecho(audio, TAXA * 2)) == TAXA
+
+    assert len(ajustar_ao_trecho(audio, int(TAXA * 0.9), razao_maxima=1.25)) == int(TAXA * 0.9)
+    # Precisaria de 2x; a compressão para em 1.25x
+    assert len(ajustar_ao_trecho(audio, TAXA // 2, razao_maxima=1.25)) == round(TAXA / 1.25)
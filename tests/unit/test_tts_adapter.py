@@ -0,0 +1,41 @@
+import io
+import wave
+
+from autodub.adapters.tts_adapter import YourTTSAdapter, wav_bytes_from_array
+
+
+def test_placeholder_deterministico_e_valido():
+    tts = YourTTSAdapter()
+    saida = tts.sintetizar("Olá mundo")
+    assert saida == YourTTSAdapter().sintetizar("Olá mundo")
+    assert saida != tts.sintetizar("Outro texto")
+
+    with wave.open(io.BytesIO(saida)) as wf:
+        assert wf.getframerate() == 16000
+        assert wf.getnframes() == 12800
+
+
+def test_wav_bytes_from_array():
+    import numpy as np
+
+    dados = wav_bytes_from_array(np.zeros(160), sr=16000)
+    with wave.open(io.BytesIO(dados)) as wf:
+        assert wf.getnframes() == 160
+
+
+def test_vocoder_de_streaming():
+    import numpy as np
+
+    from autodub.adapters.mocks.mock_vocoder import MockVocoderStreaming
+
+    tts = YourTTSAdapter(vocoder=MockVocoderStreaming(), quadros_por_bloco=16, sobreposicao=4)
+    trechos = list(tts.sintetizar_streaming("Olá mundo"))
+
+    assert len(trechos) > 1
+    assert tts.vocoder_em_blocos.latencia_primeiro_audio is not None
+    with wave.open(io.BytesIO(tts.sintetizar("Olá mundo"))) as wf:
+        assert wf.getnframes() == sum(len(t) for t in trechos)
+
+    # Sem vocoder de streaming: um único trecho com o áudio completo
+    (unico,) = YourTTSAdapter().sintetizar_streaming("Olá mundo")
+    assert len(unico) == 12800 and np.max(np.abs(unico)) > 0
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from autodub.utils.voice_library import BibliotecaVozes
+
+
+def test_biblioteca_vazia_nao_encontra_vozes(tmp_path):
+    biblioteca = BibliotecaVozes(tmp_path / "vozes")
+    assert len(biblioteca) == 0
+    assert biblioteca.dimensao is None
+    assert biblioteca.buscar([1.0, 0.0, 0.0]) == [None]
+
+
+def test_adicionar_e_buscar_voz(tmp_path):
+    biblioteca = BibliotecaVozes(tmp_path / "vozes", limiar_similaridade=0.9)
+    biblioteca.adicionar("ana", [1.0, 0.0, 0.0])
+    biblioteca.adicionar("bruno", [0.0, 1.0, 0.0])
+
+    resultado = biblioteca.buscar([2.0, 0.1, 0.0])
+    nome, similaridade = resultado[0]
+    assert nome == "ana"
+    assert similaridade == pytest.approx(0.9988, abs=1e-3)
+    assert "ana" in biblioteca
+    assert biblioteca.dimensao == 3
+
+
+def test_buscar_em_lote_respeita_limiar(tmp_path):
+    biblioteca = BibliotecaVozes(tmp_path / "vozes")
+    biblioteca.adicionar_lote(["ana", "bruno"], np.eye(3, dtype=np.float32)[:2])
+
+    consultas = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [1.0, 1.0, 0.0]])
+    resultado = biblioteca.buscar(consultas)
+    assert resultado[0][0] == "bruno"
+    assert resultado[1] is None
+    assert resultado[2] is None  # similaridade ~0.707 abaixo do limiar padrão
+    assert biblioteca.buscar(consultas[2], limiar=0.7)[0][0] in {"ana", "bruno"}
+
+
+def test_salvar_e_recarregar_com_memory_map(tmp_path):
+    diretorio = tmp_path / "vozes"
+    biblioteca = BibliotecaVozes(diretorio)
+    biblioteca.adicionar("ana", [3.0, 4.0])
+    biblioteca.salvar()
+
+    recarregada = BibliotecaVozes(diretorio)
+    assert len(recarregada) == 1
+    assert isinstance(recarregada._matriz, np.memmap)
+    assert recarregada._matriz.dtype == np.float32
+    assert np.allclose(recarregada.obter("ana"), [0.6, 0.8])
+
+    recarregada.adicionar("bruno", [0.0, 1.0])
+    recarregada.salvar()
+    assert len(BibliotecaVozes(diretorio)) == 2
+
+
+def test_salvar_biblioteca_vazia_nao_cria_arquivos(tmp_path):
+    diretorio = tmp_path / "vozes"
+    BibliotecaVozes(diretorio).salvar()
+    assert not diretorio.exists()
+
+
+def test_nome_duplicado_e_dimensao_incompativel(tmp_path):
+    biblioteca = BibliotecaVozes(tmp_path / "vozes")
+    biblioteca.adicionar("ana", [1.0, 0.0])
+
+    with pytest.raises(ValueError, match="já cadastradas"):
+        biblioteca.adicionar("ana", [0.0, 1.0])
+    with pytest.raises(ValueError, match="já cadastradas"):
+        biblioteca.adicionar_lote(["caio", "caio"], [[0.0, 1.0], [1.0, 1.0]])
+    with pytest.raises(ValueError, match="dimensão"):
+        biblioteca.adicionar("bruno", [1.0, 0.0, 0.0])
+    with pytest.raises(ValueError, match="dimensão"):
+        biblioteca.buscar([1.0, 0.0, 0.0])
+    with pytest.raises(ValueError, match="mesma"):
+        biblioteca.adicionar_lote(["x", "y"], [[1.0, 0.0]])
+    with pytest.raises(KeyError):
+        biblioteca.obter("inexistente")
+
+
+def test_salvar_e_atomico_e_sem_temporarios_fixos(tmp_path, monkeypatch):
+    import os
+
+    diretorio = tmp_path / "vozes"
+    primeira = BibliotecaVozes(diretorio)
+    primeira.adicionar("ana", [1.0, 0.0])
+    primeira.salvar()
+
+    # Duas instâncias gravando a mesma biblioteca: vence a última, sempre íntegra
+    segunda, terceira = BibliotecaVozes(diretorio), BibliotecaVozes(diretorio)
+    segunda.adicionar("bruno", [0.0, 1.0])
+    terceira.adicionar_lote(["caio", "dora"], [[1.0, 1.0], [1.0, -1.0]])
+    segunda.salvar()
+    terceira.salvar()
+    recarregada = BibliotecaVozes(diretorio)
+    assert recarregada._nomes == ["ana", "caio", "dora"]
+    assert recarregada._matriz.shape == (3, 2)
+
+    # Processo morto antes da troca: a biblioteca anterior continua intacta
+    def morrer(*args):
+        raise KeyboardInterrupt
+
+    recarregada.adicionar("eva", [0.5, 0.5])
+    monkeypatch.setattr(os, "replace", morrer)
+    with pytest.raises(KeyboardInterrupt):
+        recarregada.salvar()
+    monkeypatch.undo()
+    assert BibliotecaVozes(diretorio)._nomes == ["ana", "caio", "dora"]
+    assert sorted(p.name for p in diretorio.iterdir()) == ["vozes.npy"]
+
+
+def test_cadastrar_arquivos_usa_extracao_em_lote(tmp_path):
+    from autodub.adapters.mocks.mock_embedding import MockEmbedding
+
+    class EmbeddingContador(MockEmbedding):
+        chamadas_lote = 0
+
+        def extrair_lote(self, caminhos_audio):
+            self.chamadas_lote += 1
+            return [[float(len(c)), 1.0, 0.0] for c in caminhos_audio]
+
+    extrator = EmbeddingContador()
+    biblioteca = BibliotecaVozes(tmp_path / "vozes")
+    biblioteca.cadastrar_arquivos(extrator, ["ana", "bruno"], ["a.wav", "bb.wav"])
+
+    assert extrator.chamadas_lote == 1
+    assert len(biblioteca) == 2
+    with pytest.raises(ValueError, match="mesma"):
+        biblioteca.cadastrar_arquivos(extrator, ["caio"], [])
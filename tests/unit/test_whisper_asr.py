@@ -69,6 +69,33 @@ def test_init_model_name(monkeypatch):
     assert asr.model_name == "base"
 
 
+def test_transcricao_preserva_metricas_de_qualidade(monkeypatch):
+    """As métricas do Whisper viram colunas numéricas (ausentes ficam fora do dict)."""
+    mock_model = MagicMock()
+    mock_model.transcribe.return_value = {
+        "segments": [
+            {
+                "text": "Música",
+                "start": 0.0,
+                "end": 1.0,
+                "no_speech_prob": 0.9,
+                "avg_logprob": -1.5,
+                "compression_ratio": 1.1,
+            },
+            {"text": "Sem métricas", "start": 1.0, "end": 2.0},
+        ]
+    }
+    monkeypatch.setattr(
+        "autodub.adapters.whisper_asr_adapter.whisper.load_model", lambda nome: mock_model
+    )
+
+    resultado = WhisperAsr(model_name="tiny").transcrever("audio_fake.wav")
+
+    assert resultado[0]["no_speech_prob"] == 0.9
+    assert resultado.numerica("avg_logprob")[0] == -1.5
+    assert "compression_ratio" not in resultado[1]
+
+
 # No final do arquivo tests/unit/test_whisper_asr.py
 
 
@@ -84,3 +111,18 @@ def test_integracao_carregamento_real_modelo():
         assert asr.model is not None
     except Exception as e:
         pytest.fail(f"Teste de integração falhou ao carregar o modelo real: {e}")
+
+
+def test_definir_threads_limita_torch(monkeypatch):
+    """definir_threads repassa o orçamento para torch.set_num_threads."""
+    import sys
+    import types
+
+    chamadas = []
+    monkeypatch.setitem(
+        sys.modules, "torch", types.SimpleNamespace(set_num_threads=chamadas.append)
+    )
+    monkeypatch.setattr("whisper.load_model", lambda name: "FAKE_MODEL")
+
+    WhisperAsr(model_name="base").definir_threads(3)
+    assert chamadas == [3]